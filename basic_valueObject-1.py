@@ -1,14 +1,14 @@
 from dataclasses import dataclass
+from valueobject_validation import Range, validated
 
+# Doğrulama bildirimsel: kısıtlar sınıf başına tek bir kontrol fonksiyonuna derlenir
+# (bkz. valueobject_validation). Money(-1, "USD") → ValidationError (ValueError'ın alt sınıfı)
 @dataclass(frozen=True)
+@validated(amount=Range(min=0))
 class Money:
     amount: float
     currency: str
 
-    def __post_init__(self):
-        if self.amount < 0:
-            raise ValueError("Amount cannot be negative")
-
     def __str__(self):
         return f"{self.amount} {self.currency}"
 
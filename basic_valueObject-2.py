@@ -1,6 +1,16 @@
+import calendar
 from dataclasses import dataclass
-
+from datetime import date
+from valueobject_intern import Interned, intern_stats
+from valueobject_keys import keyed
+from valueobject_validation import Pattern, Range, Rule, validated
+
+# Kısıtlar @validated ile tanımlanır; @dataclass'ın altında olmalı (__post_init__ ekler).
+# @keyed: hash ve sort_key oluşturulurken bir kez hesaplanır (dict/set anahtarı, sıralama);
+# @validated'ın altında durur, anahtar doğrulamadan sonra hesaplanır.
 @dataclass(frozen=True)
+@validated(hours=Range(0, 23), minutes=Range(0, 59), seconds=Range(0, 59))
+@keyed(sort_key=lambda hours, minutes, seconds: hours * 3600 + minutes * 60 + seconds)  # gece yarısından beri saniye
 class Time:
     hours: int
     minutes: int
@@ -15,9 +25,12 @@ end_time = Time(hours=17, minutes=45, seconds=0)
 
 print(start_time)  # Output: 09:30:00
 print(end_time)    # Output: 17:45:00
+print(start_time < end_time, end_time.sort_key)  # True 63900
 
 #*********************************************************************
 @dataclass(frozen=True)
+@validated(latitude=Range(-90, 90), longitude=Range(-180, 180))
+@keyed(sort_key=lambda latitude, longitude: (latitude, longitude))
 class Location:
     latitude: float
     longitude: float
@@ -43,8 +56,11 @@ product_quantity = Quantity(amount=100, unit="pieces")
 print(product_quantity)  # Output: 100 pieces
 
 #*********************************************************************
+# Interned: eşit değerler aynı nesneyi paylaşır (flyweight). Binlerce farklı
+# (amount, currency) çifti milyonlarca fiyat için tekrar tekrar kullanılır.
 @dataclass(frozen=True)
-class Money:
+@keyed(sort_key=lambda currency, amount: (currency, amount))  # önce para birimi, sonra tutar
+class Money(Interned, intern_size=4096):
     amount: float
     currency: str
 
@@ -54,9 +70,17 @@ class Money:
 # Kullanım örneği:
 salary = Money(amount=5000.0, currency="USD")
 print(salary)  # Output: 5000.0 USD
+print(salary is Money(5000.0, "USD"))  # True — yeni nesne oluşturulmadı
+print(intern_stats(Money))  # {'hits': 1, 'misses': 1, ...}
+print(Money(5000, "USD") is salary, Money(5000, "USD"))  # False 5000 USD — int ile float ayrı havuz anahtarı
 
 #*********************************************************************
 @dataclass(frozen=True)
+@validated(
+    day=Range(1, 31), month=Range(1, 12), year=Range(1, 9999),
+    rules=[Rule(lambda day, month, year: day <= calendar.monthrange(year, month)[1], "ayda bu gün yok")],
+)
+@keyed(sort_key=lambda day, month, year: date(year, month, day).toordinal())  # gün sırası (ordinal)
 class Date:
     day: int
     month: int
@@ -68,6 +92,7 @@ class Date:
 # Kullanım örneği:
 meeting_date = Date(day=15, month=6, year=2024)
 print(meeting_date)  # Output: 15/06/2024
+print(sorted([meeting_date, Date(day=1, month=1, year=2024)])[0])  # Output: 01/01/2024
 
 #*********************************************************************
 @dataclass(frozen=True)
@@ -83,6 +108,7 @@ print(file_path)  # Output: /home/user/file.txt
 
 #*********************************************************************
 @dataclass(frozen=True)
+@validated(address=Pattern(r"[^@\s]+@[^@\s]+\.[^@\s]+"))
 class EmailAddress:
     address: str
 
@@ -108,6 +134,7 @@ print(length)  # Output: 10 m
 
 #*********************************************************************
 @dataclass(frozen=True)
+@validated(red=Range(0, 255), green=Range(0, 255), blue=Range(0, 255))
 class Color:
     red: int
     green: int
@@ -141,6 +168,7 @@ class CurrencyConverter:
 
     def convert(self, amount):
         # Burada gerçek bir dönüşüm yapılabilir, ancak örnek olarak basit bir çarpma işlemi yapalım
+        # (kur tablosu, Money aritmetiği ve toplu dönüşüm için bkz. money_valueobject.py)
         return f"{amount} {self.from_currency} = {amount * 1.1} {self.to_currency}"
 
 # Kullanım örneği:
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from valueobject_intern import Interned, intern_stats
 
+# Interned: aynı değere sahip ValueObject'ler tek bir nesneyi paylaşır
 @dataclass(frozen=True)
-class ValueObject:
+class ValueObject(Interned):
     value: object
 
     def __str__(self):
@@ -25,6 +27,8 @@ print(color)
 print(file_size)
 print(currency_converter)
 print(conference_room)
+print(ValueObject("10 m") is measurement_unit)  # True — havuzdan geldi
+print(intern_stats(ValueObject))
 #measurement_unit.value="ayhamn" #hata verir
 
 @dataclass(frozen=True)
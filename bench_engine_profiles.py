@@ -0,0 +1,110 @@
+"""
+Eşzamanlı okuyucu/yazıcı verimi: varsayılan SQLite ayarları vs "throughput" profili.
+
+    python bench_engine_profiles.py                       # 4 okuyucu + 1 yazıcı, 5 sn
+    python bench_engine_profiles.py --readers 8 --seconds 10 --rows 50000
+
+Her profil için geçici bir dosyada products tablosu (pydantic_valueobject.ProductModel
+şeması) doldurulur; ardından okuyucu thread'ler rastgele id ile tek satır okur, tek bir yazıcı
+thread küçük transaction'larla satır ekler. Sonuç JSON olarak yazılır (okuma/s, yazma/s,
+"database is locked" hataları).
+"""
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, bindparam, insert, select
+from sqlalchemy.exc import OperationalError
+
+from valueobject_engine import create_tuned_engine, read_pragmas
+
+metadata = MetaData()
+products = Table(
+    "products", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(120), nullable=False),
+    Column("_price_amount", Float, index=True, nullable=False),
+    Column("_price_currency", String(8), index=True, nullable=False),
+)
+
+
+def run_profile(profile, workdir, rows, readers, seconds):
+    engine = create_tuned_engine(f"sqlite:///{Path(workdir) / profile}.db", profile=profile)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(products), [
+            {"name": f"p-{i}", "_price_amount": i % 1000, "_price_currency": "TRY"} for i in range(rows)
+        ])
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def reader():
+        n = locked = 0
+        stmt = select(products).where(products.c.id == bindparam("id"))  # derlenmiş SQL önbellekten
+        with engine.connect() as conn:
+            while not stop.is_set():
+                try:
+                    conn.execute(stmt, {"id": random.randint(1, rows)}).one()  # satır gerçekten okunur
+                    conn.rollback()  # okuma transaction'ını kapat (WAL snapshot'ı bırak)
+                    n += 1
+                except OperationalError:
+                    locked += 1
+        with lock:
+            counts["reads"] += n
+            counts["locked"] += locked
+
+    def writer():
+        n = locked = 0
+        while not stop.is_set():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(products), [
+                        {"name": "w", "_price_amount": 1.0, "_price_currency": "USD"} for _ in range(10)
+                    ])
+                n += 1
+            except OperationalError:
+                locked += 1
+        with lock:
+            counts["writes"] += n
+            counts["locked"] += locked
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    result = {
+        "profile": profile,
+        "pragmas": read_pragmas(engine),
+        "reads_per_s": round(counts["reads"] / seconds, 1),
+        "write_txn_per_s": round(counts["writes"] / seconds, 1),
+        "locked_errors": counts["locked"],
+    }
+    engine.dispose()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLite engine profili karşılaştırması")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--profiles", nargs="+", default=["default", "throughput"])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [run_profile(p, workdir, args.rows, args.readers, args.seconds) for p in args.profiles]
+    print(json.dumps({"readers": args.readers, "seconds": args.seconds, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
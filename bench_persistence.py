@@ -0,0 +1,182 @@
+"""
+Depodaki dört value object saklama stratejisinin tekrarlanabilir karşılaştırması.
+
+    profile_json  → single_valueoject.py       : ProfileType (JSON), filtre: text("json_extract(...)")
+    value_type    → multi_valueobject.py       : ValueType(Money) (JSON), filtre: text("json_extract(...)")
+    hybrid        → vealuobject_hybrid-property.py : ValueType(Money, indexed=("amount",)) + hybrid_property
+    split_columns → pydantic_valueobject.py    : _price_amount / _price_currency ayrı, indeksli kolonlar
+
+Her strateji ve her veri boyutu için ölçülenler:
+    insert_rows_per_s   → ORM ile toplu ekleme (add_all + commit)
+    point_lookup_us     → id ile tek satır okuma (session.get), ortalama
+    range_filter_ms     → "amount > eşik" filtresi (satırların ~%10'u), sonuçlar materialize
+    full_scan_decode_ms → tüm tabloyu okuyup value object alanına erişme
+    bytes_per_row       → full scan sonucu bellekte tutulan nesnelerin satır başına boyutu (tracemalloc)
+
+Çıktı JSON'dur (makine tarafından okunabilir); zaman içinde gerilemeleri görmek için saklayın:
+    python bench_persistence.py --sizes 1000 10000 --output bench_output.txt
+    python bench_persistence.py --memory --strategies hybrid split_columns
+"""
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+HERE = Path(__file__).resolve().parent
+CURRENCIES = ("TRY", "USD", "EUR")
+
+
+def load_script(filename):
+    """Dosya adı modül adı olamayan (tireli) demo betiklerini yükler; demo kısmı çalışmaz."""
+    spec = importlib.util.spec_from_file_location(Path(filename).stem.replace("-", "_"), HERE / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Strategy:
+    """Bir saklama stratejisi: model, satır üretimi, filtre ifadesi ve VO erişimi."""
+
+    def __init__(self, name, base, model, make, amount_filter, touch):
+        self.name = name
+        self.base = base
+        self.model = model
+        self.make = make                    # i → model nesnesi
+        self.amount_filter = amount_filter  # eşik → where ifadesi
+        self.touch = touch                  # model nesnesi → VO alanı (decode'u tetikler)
+
+
+def build_strategies():
+    single = importlib.import_module("single_valueoject")
+    multi = importlib.import_module("multi_valueobject")
+    hybrid = load_script("vealuobject_hybrid-property.py")
+    split = importlib.import_module("pydantic_valueobject")
+
+    return {
+        "profile_json": Strategy(
+            "profile_json", single.Base, single.User,
+            lambda i: single.User(name=f"user-{i}", profile=single.Profile(age=i % 1000, country="TR")),
+            lambda t: text(f"json_extract(profile, '$.age') > {int(t)}"),
+            lambda row: row.profile.age,
+        ),
+        "value_type": Strategy(
+            "value_type", multi.Base, multi.Product,
+            lambda i: multi.Product(name=f"p-{i}", price=multi.Money(amount=i % 1000, currency=CURRENCIES[i % 3])),
+            lambda t: text(f"json_extract(price, '$.amount') > {int(t)}"),
+            lambda row: row.price.amount,
+        ),
+        "hybrid": Strategy(
+            "hybrid", hybrid.Base, hybrid.Product,
+            lambda i: hybrid.Product(name=f"p-{i}", price=hybrid.Money(i % 1000, CURRENCIES[i % 3])),
+            lambda t: hybrid.Product.price_amount > t,
+            lambda row: row.price.amount,
+        ),
+        "split_columns": Strategy(
+            "split_columns", split.Base, split.ProductModel,
+            lambda i: split.ProductModel(name=f"p-{i}", _price_amount=i % 1000, _price_currency=CURRENCIES[i % 3]),
+            lambda t: split.ProductModel._price_amount > t,
+            lambda row: row.price.amount,
+        ),
+    }
+
+
+def make_engine(workdir, name, memory):
+    if memory:
+        return create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    return create_engine(f"sqlite:///{Path(workdir) / name}.db")
+
+
+def run_one(strategy, size, workdir, memory, lookups=200):
+    engine = make_engine(workdir, f"{strategy.name}_{size}", memory)
+    strategy.base.metadata.create_all(engine)
+    result = {"strategy": strategy.name, "rows": size}
+
+    t0 = time.perf_counter()
+    with Session(engine) as s:
+        s.add_all([strategy.make(i) for i in range(size)])
+        s.commit()
+    result["insert_rows_per_s"] = round(size / (time.perf_counter() - t0), 1)
+
+    ids = [random.randint(1, size) for _ in range(lookups)]
+    with Session(engine) as s:
+        t0 = time.perf_counter()
+        for pid in ids:
+            strategy.touch(s.get(strategy.model, pid))
+            s.expunge_all()  # identity map'ten gelmesin, her seferinde DB'ye gitsin
+        result["point_lookup_us"] = round((time.perf_counter() - t0) / lookups * 1e6, 2)
+
+    with Session(engine) as s:
+        t0 = time.perf_counter()
+        rows = s.query(strategy.model).filter(strategy.amount_filter(900)).all()
+        result["range_filter_ms"] = round((time.perf_counter() - t0) * 1e3, 3)
+        result["range_filter_rows"] = len(rows)
+
+    with Session(engine) as s:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        rows = s.query(strategy.model).all()
+        for row in rows:
+            strategy.touch(row)
+        elapsed = time.perf_counter() - t0
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        result["full_scan_decode_ms"] = round(elapsed * 1e3, 3)
+        result["bytes_per_row"] = round((after - before) / max(size, 1), 1)
+        del rows
+
+    engine.dispose()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Value object saklama stratejileri benchmark'ı")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--strategies", nargs="+", default=None, help="varsayılan: hepsi")
+    parser.add_argument("--memory", action="store_true", help="geçici dosya yerine :memory: SQLite")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON sonuçların yazılacağı dosya (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    strategies = build_strategies()
+    names = args.strategies or list(strategies)
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            for name in names:
+                results.append(run_one(strategies[name], size, workdir, args.memory))
+                print(f"{name:<14} {size:>8} satır tamam", file=sys.stderr)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "storage": "memory" if args.memory else "tempfile",
+        "seed": args.seed,
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Value object varyantlarının bellek ve oluşturma süresi karşılaştırması (tracemalloc).
+
+    python bench_valueobject_memory.py            # 200_000 nesne
+    python bench_valueobject_memory.py -n 1000000 --json
+
+Varyantlar (hepsi Money(amount, currency) şeklinde iki alanlı):
+    plain          → multi_valueobject.py / single_valueoject.py'deki düz sınıflar
+    dataclass      → basic_valueObject-*.py, PriceDC: @dataclass(frozen=True)
+    dataclass+slots→ @dataclass(frozen=True, slots=True)
+    value_object   → valueobject_base.value_object (slot'lu, frozen, hızlı __eq__/__hash__)
+
+Her varyant için ValueType yolu da denenir: codec ile encode → decode_trusted gidiş-dönüşü.
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from valueobject_base import value_object
+from valueobject_codec import get_codec
+
+
+class PlainMoney:
+    def __init__(self, amount, currency):
+        self.amount = amount
+        self.currency = currency
+
+
+@dataclass(frozen=True)
+class DataclassMoney:
+    amount: float
+    currency: str
+
+
+@dataclass(frozen=True, slots=True)
+class SlotsDataclassMoney:
+    amount: float
+    currency: str
+
+
+@value_object
+class SlotsMoney:
+    amount: float
+    currency: str
+
+
+VARIANTS = {
+    "plain": PlainMoney,
+    "dataclass": DataclassMoney,
+    "dataclass+slots": SlotsDataclassMoney,
+    "value_object": SlotsMoney,
+}
+
+
+def measure(cls, n):
+    # Aynı float/str nesneleri paylaşılsın diye girdiler önceden hazırlanır;
+    # böylece ölçülen fark sadece nesnenin kendi boyutudur.
+    amounts = [float(i % 5000) for i in range(n)]
+    currency = "TRY"
+
+    # Süre: tracemalloc kapalıyken (izleme her ayırmayı yavaşlatır)
+    gc.collect()
+    t0 = time.perf_counter()
+    objs = [cls(a, currency) for a in amounts]
+    elapsed = time.perf_counter() - t0
+    del objs
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [cls(a, currency) for a in amounts]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # ValueType yolu bu varyantla çalışıyor mu? (slot'lu sınıflarda __dict__ yok)
+    codec = get_codec(cls)
+    assert codec.to_tuple(codec.decode_trusted(codec.encode(objs[1]))) == codec.to_tuple(objs[1])
+
+    bytes_per_instance = (after - before - sys.getsizeof(objs)) / n
+    del objs
+    return {
+        "bytes_per_instance": round(bytes_per_instance, 1),
+        "construct_ns": round(elapsed / n * 1e9, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=200_000, help="varyant başına nesne sayısı")
+    parser.add_argument("--json", action="store_true", help="sonuçları JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    results = {name: measure(cls, args.n) for name, cls in VARIANTS.items()}
+    if args.json:
+        print(json.dumps({"n": args.n, "results": results}, indent=2))
+        return
+    print(f"{'varyant':<16} {'byte/nesne':>11} {'ns/oluşturma':>13}")
+    for name, r in results.items():
+        print(f"{name:<16} {r['bytes_per_instance']:>11} {r['construct_ns']:>13}")
+
+
+if __name__ == "__main__":
+    main()
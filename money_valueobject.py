@@ -0,0 +1,237 @@
+"""
+Money value object'i için aritmetik ve toplu (vektörel) döviz dönüşüm motoru.
+
+basic_valueObject-2.py'deki CurrencyConverter tek bir tutarı sabit `* 1.1` ile çevirip
+string döndürüyor, Money'nin ise hiç aritmetiği yok. Burada:
+
+    Money(100, "USD") + Money(5, "USD")       # Money(amount=105, currency='USD')
+    Money(100, "USD") * 3                     # ölçekleme
+    Money(100, "USD") + Money(5, "EUR")       # CurrencyMismatchError
+
+    rates = RateTable.from_file("exchange_rates.json")      # veya .csv (currency,rate)
+    fx = CurrencyConverter(rates)                           # float: hızlı
+    fx = CurrencyConverter(rates, mode="decimal")           # Decimal: kuruşu kuruşuna
+    fx.convert(Money(100, "USD"), "EUR")                    # Money(amount=92.0, currency='EUR')
+    fx.convert_many(prices, "EUR")                          # list[Money] / ValueObjectArray / tutar dizisi
+
+convert_many her para birimi çifti için oranı bir kez hesaplar; ValueObjectArray verilirse
+tutar sütunu ile sözlük kodlu para birimi sütunu üzerinde tek geçişte çalışır
+(NumPy kuruluysa tamamen vektörel: amounts * rate_by_code[codes]).
+"""
+from __future__ import annotations
+
+import csv
+import json
+from array import array
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, Decimal
+from pathlib import Path
+
+from valueobject_array import DictColumn, NumericColumn, ObjectColumn, ValueObjectArray, np
+from valueobject_codec import get_codec
+
+
+class CurrencyMismatchError(ValueError):
+    """Farklı para birimindeki Money değerleri doğrudan toplanamaz/karşılaştırılamaz."""
+
+
+@dataclass(frozen=True)
+class Money:
+    amount: float | Decimal
+    currency: str
+
+    def __str__(self):
+        return f"{self.amount} {self.currency}"
+
+    @classmethod
+    def zero(cls, currency):
+        return cls(0, currency)
+
+    def _same_currency(self, other):
+        if other.currency != self.currency:
+            raise CurrencyMismatchError(f"{self.currency} ile {other.currency} birlikte kullanılamaz")
+
+    def __add__(self, other):
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._same_currency(other)
+        return Money(self.amount + other.amount, self.currency)
+
+    def __sub__(self, other):
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._same_currency(other)
+        return Money(self.amount - other.amount, self.currency)
+
+    def __neg__(self):
+        return Money(-self.amount, self.currency)
+
+    def __mul__(self, factor):
+        if isinstance(factor, Money):
+            return NotImplemented  # Money * Money anlamsız
+        return Money(self.amount * factor, self.currency)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor):
+        if isinstance(divisor, Money):
+            return NotImplemented
+        return Money(self.amount / divisor, self.currency)
+
+    def __lt__(self, other):
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._same_currency(other)
+        return self.amount < other.amount
+
+    def __le__(self, other):
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._same_currency(other)
+        return self.amount <= other.amount
+
+
+class RateTable:
+    """
+    Bir baz para birimine göre kurlar: rates["EUR"] = 1 USD kaç EUR.
+    Kurlar Decimal olarak saklanır (dosyadaki metinden, yuvarlama hatası olmadan);
+    float modu için ayrıca float kopyası tutulur.
+    """
+
+    def __init__(self, base, rates):
+        self.base = base
+        self.rates = {cur: Decimal(str(rate)) for cur, rate in rates.items()}
+        self.rates.setdefault(base, Decimal(1))
+        self.float_rates = {cur: float(rate) for cur, rate in self.rates.items()}
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        JSON: {"base": "USD", "rates": {"EUR": "0.92", ...}}
+        CSV:  currency,rate satırları; ilk satırın kuru 1 ise baz kabul edilir
+              (veya "base" adlı bir satır baz para birimini belirtir).
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            with path.open(newline="", encoding="utf-8") as f:
+                rows = [(r["currency"].strip(), r["rate"].strip()) for r in csv.DictReader(f)]
+            base = next((rate for cur, rate in rows if cur == "base"), None)
+            rates = {cur: rate for cur, rate in rows if cur != "base"}
+            if base is None:
+                base = next(cur for cur, rate in rates.items() if Decimal(rate) == 1)
+            return cls(base, rates)
+        data = json.loads(path.read_text(encoding="utf-8"), parse_float=Decimal)
+        return cls(data["base"], data["rates"])
+
+    def rate(self, from_currency, to_currency, exact=False):
+        """1 birim from_currency kaç to_currency eder (çapraz kur baz üzerinden)."""
+        rates = self.rates if exact else self.float_rates
+        try:
+            return rates[to_currency] / rates[from_currency]
+        except KeyError as e:
+            raise KeyError(f"Kur tablosunda olmayan para birimi: {e.args[0]}") from None
+
+
+class CurrencyConverter:
+    """
+    :param rates: RateTable
+    :param mode: "float" (hızlı) veya "decimal" (tam; sonuç `places` haneye banker yuvarlamasıyla)
+    """
+
+    def __init__(self, rates, mode="float", places=2):
+        if mode not in ("float", "decimal"):
+            raise ValueError("mode 'float' veya 'decimal' olmalı")
+        self.rates = rates
+        self.mode = mode
+        self.exact = mode == "decimal"
+        self._quantum = Decimal(1).scaleb(-places)
+        self._factors = {}  # (from, to) → oran; her çift için bir kez hesaplanır
+
+    def factor(self, from_currency, to_currency):
+        key = (from_currency, to_currency)
+        f = self._factors.get(key)
+        if f is None:
+            f = self._factors[key] = self.rates.rate(from_currency, to_currency, self.exact)
+        return f
+
+    def _apply(self, amount, factor):
+        if self.exact:
+            return (Decimal(str(amount)) * factor).quantize(self._quantum, ROUND_HALF_EVEN)
+        return amount * factor
+
+    def convert(self, money, to_currency):
+        return Money(self._apply(money.amount, self.factor(money.currency, to_currency)), to_currency)
+
+    def convert_many(self, values, to_currency, from_currency=None):
+        """
+        Toplu dönüşüm, girdiyle aynı türde çıktı:
+        - ValueObjectArray (amount/currency alanlı)  → ValueObjectArray (para birimi to_currency)
+        - Money dizisi                               → list[Money]
+        - tutar dizisi (list/array/ndarray) + from_currency → aynı türde tutarlar
+        """
+        if isinstance(values, ValueObjectArray):
+            return self._convert_array(values, to_currency)
+        if from_currency is not None:
+            factor = self.factor(from_currency, to_currency)
+            if np is not None and isinstance(values, np.ndarray) and not self.exact:
+                return values * factor
+            if isinstance(values, array) and not self.exact:
+                return array("d", [v * factor for v in values])
+            apply = self._apply
+            return [apply(v, factor) for v in values]
+
+        build = get_codec(Money).from_tuple_trusted  # sonuçlar zaten geçerli → __init__ atlanır
+        factor, apply, out = self.factor, self._apply, []
+        for m in values:
+            out.append(build((apply(m.amount, factor(m.currency, to_currency)), to_currency)))
+        return out
+
+    def _convert_array(self, prices, to_currency):
+        currencies = prices.columns["currency"]
+        amounts = prices.columns["amount"]
+        if not isinstance(currencies, DictColumn):
+            raise TypeError("currency alanı sözlük kodlu (str) olmalı")
+        # Kod başına oran: kategoriler birkaç tane, satırlar milyonlarca
+        factors = [self.factor(cur, to_currency) for cur in currencies.categories]
+        target = DictColumn(array("i", bytes(4 * len(currencies))), [to_currency])  # tüm kodlar 0
+
+        if self.exact:
+            # Decimal vektörleştirilemez; yine de oranlar kod başına önceden hesaplı
+            apply = self._apply
+            column = ObjectColumn([apply(a, factors[c]) for a, c in zip(amounts.py_values(), currencies.codes)])
+            return ValueObjectArray(prices.cls, {"amount": column, "currency": target})
+        if np is not None:
+            converted = amounts.values() * np.asarray(factors)[currencies.code_values()]
+            column = NumericColumn("d", array("d", converted.tobytes()))
+        else:
+            column = NumericColumn("d", array("d", [a * factors[c] for a, c in zip(amounts.data, currencies.codes)]))
+        return ValueObjectArray(prices.cls, {"amount": column, "currency": target})
+
+
+if __name__ == "__main__":
+    fx = CurrencyConverter(RateTable.from_file(Path(__file__).with_name("exchange_rates.json")))
+    price = Money(100, "USD")
+    print(price + Money(20, "USD"), price * 3)  # 120 USD 300 USD
+    print(fx.convert(price, "EUR"))  # 92.0 EUR
+    try:
+        price + Money(1, "EUR")
+    except CurrencyMismatchError as e:
+        print("Hata:", e)
+
+    exact = CurrencyConverter(fx.rates, mode="decimal")
+    print(exact.convert(Money(19.99, "EUR"), "TRY"))  # Decimal, 2 hane
+
+    prices = [Money(i, "TRY" if i % 2 else "USD") for i in range(1, 6)]
+    print([str(m) for m in fx.convert_many(prices, "EUR")])
+    column = ValueObjectArray.from_objects(Money, prices)
+    print(fx.convert_many(column, "EUR").sum("amount"))
+    assert (column.min("currency"), column.max("currency")) == ("TRY", "USD")  # sözlük kodlu sütun
+    assert column.filter(column.mask("currency", "==", "TRY")).max("currency") == "TRY"
+    assert (column.min("amount"), column.max("amount"), column.sum("amount")) == (1, 5, 15)
+    # filtre sonrası boş gruplar dönmez (GROUP BY gibi), toplamlar float
+    assert column.where("currency", "==", "TRY").group_sum("amount", by="currency") == {"TRY": 9.0}
+    assert column.group_sum("amount", by="currency") == {"USD": 6.0, "TRY": 9.0}
+    if np is not None:
+        strided = np.arange(10, dtype="int64")[::2]  # bitişik olmayan ndarray
+        built = ValueObjectArray.from_columns(Money, amount=strided, currency=(array("i", [0] * 5), ["TRY"]))
+        assert built.column("amount").tolist() == [0, 2, 4, 6, 8] and built.max("currency") == "TRY"
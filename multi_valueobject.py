@@ -1,47 +1,80 @@
 from sqlalchemy import TypeDecorator, String
-import json
 from sqlalchemy import text
+from valueobject_base import value_object
+from valueobject_codec import get_codec
+from valueobject_engine import create_tuned_engine
+from valueobject_lazy import LazyValue
+from valueobject_serializers import resolve_serializer, serializer_for
 class ValueType(TypeDecorator):
     """
     Herhangi bir sınıfı JSON olarak SQLite'de saklamak için genel TypeDecorator.
     Kullanım: Column(ValueType(Money))
+    trusted=True: okurken __init__ doğrulaması atlanır (sütunu sadece biz yazıyoruz).
+    serializer="msgpack" / "struct" / "orjson": JSON yerine başka backend
+    (bkz. valueobject_serializers). Not: json_extract sorguları sadece JSON backend'lerle çalışır.
+    lazy=True: okurken decode edilmez, ilk attribute erişiminde decode eden LazyValue döner
+    (sadece p.name okunan liste sorgularında JSON çözme maliyeti olmaz; bkz. valueobject_lazy).
     """
     impl = String  # SQLite TEXT sütunu
+    cache_ok = True  # __init__ argümanları (cls, trusted, serializer) aynı adlarla saklanıyor
 
-    def __init__(self, cls, *args, **kwargs):
+    def __init__(self, cls, *args, trusted=False, serializer=None, lazy=False, **kwargs):
         super().__init__(*args, **kwargs)
         self.cls = cls  # Hangi value object sınıfı?
+        self.trusted = trusted
+        self.lazy = lazy
+        self.codec = get_codec(cls)  # Sınıf başına bir kez derlenen encoder/decoder
+        self.serializer = serializer
+        self._serializer = resolve_serializer(serializer) if serializer is not None else None
+
+    def load_dialect_impl(self, dialect):
+        # json/orjson → TEXT, msgpack/struct → BLOB
+        return dialect.type_descriptor(serializer_for(self._serializer, dialect).impl())
 
     def process_bind_param(self, value, dialect):
-        # Python nesnesini -> JSON string
+        # Python nesnesini -> JSON string (veya seçilen backend'e göre bytes)
         if value is not None:
-            return json.dumps(value.__dict__)
+            serializer = serializer_for(self._serializer, dialect)
+            if type(value) is LazyValue:  # dokunulmamış/aynı formatlı lazy değer → ham değer
+                raw = value.raw_for(self.codec, serializer)
+                if raw is not None:
+                    return raw
+            return serializer.dumper(self.codec)(value)
         return None
 
     def process_result_value(self, value, dialect):
         # JSON string -> Python nesnesi
         if value is not None:
-            data = json.loads(value)
-            return self.cls(**data)
+            serializer = serializer_for(self._serializer, dialect)
+            if self.lazy:
+                return serializer.lazy_loader(self.codec, self.trusted)(value)
+            return serializer.loader(self.codec, self.trusted)(value)
         return None
-    
+
+    def compare_values(self, x, y):
+        # Flush'ta değişiklik tespiti: önce kimlik, sonra alanlar (eşit yeni nesne → UPDATE yok);
+        # değişebilir (frozen olmayan) sınıflarda TypeDecorator'ın varsayılanı x == y
+        return self.codec.equal(x, y) if self.codec.frozen else x == y
+
+# Değişmez value object'ler: yerinde değişiklik (p.price.amount = 1) FrozenInstanceError verir,
+# çünkü ORM bunu göremez ve güncelleme kaybolurdu.
+@value_object
 class Money:
-    def __init__(self, amount, currency):
-        self.amount = amount
-        self.currency = currency
+    amount: float
+    currency: str
 
+@value_object
 class Coordinates:
-    def __init__(self, lat, lng):
-        self.lat = lat
-        self.lng = lng
+    lat: float
+    lng: float
 
+@value_object
 class FullName:
-    def __init__(self, first, last):
-        self.first = first
-        self.last = last
+    first: str
+    last: str
 
 
-from sqlalchemy import create_engine, Column, Integer, String
+from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -51,82 +84,82 @@ class Product(Base):
     __tablename__ = 'products'
     id = Column(Integer, primary_key=True)
     name = Column(String)
-    price = Column(ValueType(Money))  # Value object
+    price = Column(ValueType(Money, trusted=True, lazy=True))  # Value object (ilk erişimde decode)
 
 class Place(Base):
     __tablename__ = 'places'
     id = Column(Integer, primary_key=True)
     name = Column(String)
-    location = Column(ValueType(Coordinates))
-    owner_name = Column(ValueType(FullName))
-
-engine = create_engine('sqlite:///multi_ValueObject.db')
-Base.metadata.create_all(engine)
-
-Session = sessionmaker(bind=engine)
-session = Session()
-
-# Ürün ekle
-laptop = Product(
-    name="Laptop",
-    price=Money(amount=15000, currency="TRY")
-)
-
-# Mekan ekle
-cafe = Place(
-    name="Kahve Dükkanı",
-    location=Coordinates(lat=41.0151, lng=28.9793),
-    owner_name=FullName(first="Ayşe", last="Yılmaz")
-)
-
-session.add_all([laptop, cafe])
-session.commit()
-
-
-# Ürünü oku
-p = session.query(Product).filter_by(name="Laptop").first()
-print(p.price.amount)     # 15000
-print(p.price.currency)   # TRY
-
-# Mekanı oku
-pl = session.query(Place).first()
-print(pl.location.lat)    # 41.0151
-print(pl.owner_name.first) # Ayşe
-
-
-# Fiyatı 10.000'den yüksek olan ürünler
-expensive = session.query(Product).filter(
-    text("json_extract(price, '$.amount') > 10000")
-).all()
-
-for p in expensive:
-    print(f"{p.name}: {p.price.amount} {p.price.currency}")
-
-# Sahibi "Ayşe" olan mekanlar
-ayse_places = session.query(Place).filter(
-    text("json_extract(owner_name, '$.first') = 'Ayşe'")
-).all()
-
-for pl in ayse_places:
-    print(pl.name)  # Kahve Dükkanı
-print("----------------------------------------------------------------------")
-"""✅ Alternatifler (değişiklik yapmadan değil ama)
-Eğer hiçbir değişiklik yapmadan istiyorsanız, tek seçeneğiniz tüm kayıtları
-Python tarafında filtrelemek:"""
-products = session.query(Product).all()
-expensive = [p for p in products if p.price and p.price.amount > 10000]
-for p in expensive:
-    print(f"{p.name}: {p.price.amount} {p.price.currency}")
-
-#Bu, verimsizdir (özellikle büyük veri setlerinde) ama çalışır — ve json_extract kullanmaz.
-
-print("----------------------------------------------------------------------")
-p = session.query(Product).first()
-print(p.price.amount)  # ✅ Bu çalışır — çünkü ORM bu nesneyi Python nesnesi olarak döndürdü.
-
-
-
-
-
-
-        
+    location = Column(ValueType(Coordinates, trusted=True, lazy=True))
+    owner_name = Column(ValueType(FullName, trusted=True, lazy=True))
+
+if __name__ == "__main__":
+    engine = create_tuned_engine('sqlite:///multi_ValueObject.db')
+    Base.metadata.create_all(engine)
+
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    # Ürün ekle
+    laptop = Product(
+        name="Laptop",
+        price=Money(amount=15000, currency="TRY")
+    )
+
+    # Mekan ekle
+    cafe = Place(
+        name="Kahve Dükkanı",
+        location=Coordinates(lat=41.0151, lng=28.9793),
+        owner_name=FullName(first="Ayşe", last="Yılmaz")
+    )
+
+    session.add_all([laptop, cafe])
+    session.commit()
+
+
+    # Ürünü oku
+    p = session.query(Product).filter_by(name="Laptop").first()
+    print(type(p.price).__name__, p.price.decoded)  # LazyValue False — henüz decode edilmedi
+    print(p.price.amount)     # 15000
+    print(p.price.currency)   # TRY
+
+    # Mekanı oku
+    pl = session.query(Place).first()
+    print(pl.location.lat)    # 41.0151
+    print(pl.owner_name.first) # Ayşe
+
+
+    # Fiyatı 10.000'den yüksek olan ürünler
+    expensive = session.query(Product).filter(
+        text("json_extract(price, '$.amount') > 10000")
+    ).all()
+
+    for p in expensive:
+        print(f"{p.name}: {p.price.amount} {p.price.currency}")
+
+    # Sahibi "Ayşe" olan mekanlar
+    ayse_places = session.query(Place).filter(
+        text("json_extract(owner_name, '$.first') = 'Ayşe'")
+    ).all()
+
+    for pl in ayse_places:
+        print(pl.name)  # Kahve Dükkanı
+    print("----------------------------------------------------------------------")
+    """✅ Alternatifler (değişiklik yapmadan değil ama)
+    Eğer hiçbir değişiklik yapmadan istiyorsanız, tek seçeneğiniz tüm kayıtları
+    Python tarafında filtrelemek:"""
+    products = session.query(Product).all()
+    expensive = [p for p in products if p.price and p.price.amount > 10000]
+    for p in expensive:
+        print(f"{p.name}: {p.price.amount} {p.price.currency}")
+
+    #Bu, verimsizdir (özellikle büyük veri setlerinde) ama çalışır — ve json_extract kullanmaz.
+
+    # ✅ Toplama için doğru yol: SQL'de GROUP BY (bkz. valueobject_aggregate)
+    from valueobject_aggregate import ValueAggregator
+    revenue = ValueAggregator.for_column(Product.price).aggregate(session, "sum")
+    print("Para birimine göre ciro:", {cur: m.amount for cur, m in revenue.items()})
+
+    print("----------------------------------------------------------------------")
+    p = session.query(Product).first()
+    print(p.price.amount)  # ✅ Bu çalışır — çünkü ORM bu nesneyi Python nesnesi olarak döndürdü.
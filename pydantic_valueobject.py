@@ -1,20 +1,35 @@
-# pip install "sqlalchemy>=2" "pydantic>=2"
+# pip install "sqlalchemy>=2"
+# Alan doğrulaması pydantic yerine valueobject_validation ile (sınıf başına derlenmiş kontrol).
 from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, List
+from itertools import islice
+from typing import Iterable, Iterator, Optional, List
 
-from sqlalchemy import Float, String, Integer, create_engine, select
+from sqlalchemy import Float, String, Integer, insert, select
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, Session
 
+from valueobject_array import ValueObjectArray
+from valueobject_codec import get_codec
+from valueobject_engine import create_tuned_engine
+from valueobject_validation import Pattern, Range, validated
+
 
 # ================== DOMAIN ==================
 @dataclass(frozen=True)
+@validated(amount=Range(min=0), currency=Pattern("[A-Z]{3}"))  # ISO 4217 kodu
 class PriceDC:
     amount: float
     currency: str
 
 
-@dataclass
+# DB'den okunan fiyatlar yazılırken doğrulandı: (amount, currency) → PriceDC, __post_init__ atlanır
+_price_from_db = get_codec(PriceDC).from_tuple_trusted
+
+
+@dataclass(frozen=True)  # önbellekte paylaşıldığı için değişmez
 class ProductDC:
     id: Optional[int]
     name: str
@@ -39,7 +54,7 @@ class ProductModel(Base):
     # --- Hybrid property benzeri düz property ---
     @property
     def price(self) -> PriceDC:
-        return PriceDC(self._price_amount, self._price_currency)
+        return _price_from_db((self._price_amount, self._price_currency))
 
     @price.setter
     def price(self, val: PriceDC):
@@ -48,8 +63,21 @@ class ProductModel(Base):
 
 
 # ================== SETUP ===================
-engine = create_engine("sqlite:///hybrid_price_demo.db", echo=False)
-Base.metadata.create_all(engine)
+DATABASE_URL = "sqlite:///hybrid_price_demo.db"
+_engine = None
+
+
+def get_engine():
+    """
+    Repository fonksiyonlarının engine'i; ilk çağrıda oluşturulur ve tablolar kurulur.
+    Import yan etkisizdir: şemayı/sınıfları kullanan modüller (pydantic_valueobject_async,
+    bench_persistence, valueobject_aggregate) DB dosyası açmaz.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_tuned_engine(DATABASE_URL, echo=False)
+        Base.metadata.create_all(_engine)
+    return _engine
 
 
 # ================== HELPERS =================
@@ -57,14 +85,79 @@ def _to_dc(orm: ProductModel) -> ProductDC:
     return ProductDC(
         id=orm.id,
         name=orm.name,
-        price=PriceDC(orm._price_amount, orm._price_currency),
+        price=_price_from_db((orm._price_amount, orm._price_currency)),
     )
 
 
+class LRUCache:
+    """
+    Sınırlı boyutlu, opsiyonel TTL'li LRU önbellek (thread-safe).
+    Sadece değişmez değerler (ProductDC) saklanmalı: aynı nesne tüm çağıranlarla paylaşılır.
+    """
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is self._MISSING:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# id -> ProductDC okuma önbelleği; yazma fonksiyonları ilgili id'leri geçersiz kılar
+product_cache = LRUCache(maxsize=10_000, ttl=300)
+
+
 # ================== REPO-LIKE API ===========
 def add_product(p: ProductDC) -> ProductDC:
     """ProductDC -> DB insert -> ProductDC (id ile döndür)."""
-    with Session(engine) as s:
+    with Session(get_engine()) as s:
         orm = ProductModel(
             name=p.name,
             _price_amount=p.price.amount,
@@ -77,35 +170,108 @@ def add_product(p: ProductDC) -> ProductDC:
         s.add(orm)
         s.commit()
         s.refresh(orm)
+        product_cache.invalidate([orm.id])
         return _to_dc(orm)
 
 
-def add_products_bulk(items: List[ProductDC]) -> List[ProductDC]:
-    with Session(engine) as s:
-        orms = [
-            ProductModel(
-                name=p.name,
-                _price_amount=p.price.amount,
-                _price_currency=p.price.currency,
-            )
-            for p in items
+def add_products_bulk(items: Iterable[ProductDC], chunk_size: Optional[int] = None) -> List[ProductDC]:
+    """
+    Toplu ekleme: ORM nesnesi / unit of work olmadan Core insert() + executemany.
+    SQLAlchemy 2 "insertmanyvalues" ile satırları çok satırlı INSERT ... RETURNING id
+    cümlelerine böler; id'ler parametre sırasıyla döner (sort_by_parameter_order).
+    :param chunk_size: None → hepsi tek transaction (eski davranış);
+                       sayı → her chunk ayrı transaction (1M+ satırlık ithalatlar için)
+    """
+    table = ProductModel.__table__
+    stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+
+    items = iter(items)
+    out: List[ProductDC] = []
+    while True:
+        chunk = list(items) if chunk_size is None else list(islice(items, chunk_size))
+        if not chunk:
+            break
+        params = [
+            {"name": p.name, "_price_amount": p.price.amount, "_price_currency": p.price.currency}
+            for p in chunk
         ]
-        s.add_all(orms)
-        s.commit()
-        # id’ler yazıldı; tekrar select yerine direkt map’liyoruz
-        return [_to_dc(o) for o in orms]
+        with get_engine().begin() as conn:  # chunk başına bir transaction
+            ids = conn.execute(stmt, params).scalars().all()
+        product_cache.invalidate(ids)
+        out.extend(ProductDC(id=pid, name=p.name, price=p.price) for pid, p in zip(ids, chunk))
+        if chunk_size is None:
+            break
+    return out
+
+
+def iter_products(batch_size: int = 1000) -> Iterator[ProductDC]:
+    """
+    Tüm ürünleri sabit bellekle akış halinde döndürür.
+    - ORM entity yerine sadece gereken 4 kolon seçilir → identity map / unit of work yok
+    - yield_per: satırlar cursor'dan batch_size'lık parçalar halinde çekilir
+    - her satır doğrudan ProductDC/PriceDC'ye map'lenir
+    """
+    stmt = (
+        select(ProductModel.id, ProductModel.name, ProductModel._price_amount, ProductModel._price_currency)
+        .order_by(ProductModel.id.asc())
+    )
+    with get_engine().connect() as conn:
+        result = conn.execution_options(yield_per=batch_size).execute(stmt)
+        for rows in result.partitions():
+            for pid, name, amount, currency in rows:
+                yield ProductDC(id=pid, name=name, price=_price_from_db((amount, currency)))
 
 
 def get_all_products() -> List[ProductDC]:
-    with Session(engine) as s:
-        rows = s.execute(select(ProductModel).order_by(ProductModel.id.asc())).scalars().all()
-        return [_to_dc(r) for r in rows]
+    # ORM nesneleri + dataclass'lar aynı anda bellekte tutulmasın diye kolon bazlı akıştan topla
+    return list(iter_products())
 
 
 def get_product_by_id(pid: int) -> Optional[ProductDC]:
-    with Session(engine) as s:
+    cached = product_cache.get(pid)
+    if cached is not None:
+        return cached
+    with Session(get_engine()) as s:
         row = s.get(ProductModel, pid)
-        return _to_dc(row) if row else None
+        if row is None:
+            return None
+        product = _to_dc(row)
+        product_cache.put(pid, product)
+        return product
+
+
+def get_products_by_ids(ids: Iterable[int], chunk_size: int = 500) -> List[Optional[ProductDC]]:
+    """
+    N+1 yerine toplu okuma: önce önbellek, kalan id'ler chunk_size'lık IN (...) sorgularıyla
+    tek bağlantıda çekilir. Dönüş girdi sırasıyla hizalıdır; bulunamayan id için None.
+    """
+    ids = list(ids)
+    found = {}
+    missing = []
+    for pid in dict.fromkeys(ids):
+        cached = product_cache.get(pid)
+        if cached is None:
+            missing.append(pid)
+        else:
+            found[pid] = cached
+
+    if missing:
+        cols = select(ProductModel.id, ProductModel.name, ProductModel._price_amount, ProductModel._price_currency)
+        with get_engine().connect() as conn:
+            for start in range(0, len(missing), chunk_size):
+                chunk = missing[start:start + chunk_size]
+                for pid, name, amount, currency in conn.execute(cols.where(ProductModel.id.in_(chunk))):
+                    product = ProductDC(id=pid, name=name, price=_price_from_db((amount, currency)))
+                    product_cache.put(pid, product)
+                    found[pid] = product
+    return [found.get(pid) for pid in ids]
+
+
+def get_price_array() -> ValueObjectArray:
+    """Tüm fiyatları sütunsal olarak yükler: ORM nesnesi ve PriceDC üretilmez (raporlama için)."""
+    with Session(get_engine()) as s:
+        rows = s.execute(select(ProductModel._price_amount, ProductModel._price_currency))
+        return ValueObjectArray.from_rows(PriceDC, rows)
 
 
 # ================== DEMO ====================
@@ -120,6 +286,14 @@ if __name__ == "__main__":
         ProductDC(id=None, name="Thermos",   price=PriceDC(399.0,  "TRY")),
         ProductDC(id=None, name="Kettle",    price=PriceDC(799.99, "TRY")),
     ])
+    print("Bulk ids:", [p.id for p in bulk_inserted])
+
+    # 3) Büyük ithalat (örnekte küçük): 10'luk chunk'lar, her biri ayrı transaction
+    imported = add_products_bulk(
+        (ProductDC(id=None, name=f"Spoon #{i}", price=PriceDC(9.9, "TRY")) for i in range(25)),
+        chunk_size=10,
+    )
+    print("Imported:", len(imported), "last id:", imported[-1].id)
 
     # === get_all ===
     all_products = get_all_products()
@@ -127,7 +301,21 @@ if __name__ == "__main__":
     for p in all_products:
         print(f"- #{p.id}: {p.name} | {p.price.amount} {p.price.currency}")
 
+    # === akış halinde okuma (büyük tablolar için sabit bellek) ===
+    expensive = sum(1 for p in iter_products(batch_size=2) if p.price.amount > 300)
+    print("300'den pahalı ürün sayısı:", expensive)
+
     # === get_by_id === (örnek: 1 ve 5)
     p1 = get_product_by_id(1)
     p5 = get_product_by_id(5)
     print("\nget_by_id(1):", p1)
+
+    # === get_by_ids === (tek sorgu + önbellek)
+    batch = get_products_by_ids([5, 1, 2, 999_999, 1])
+    print("get_by_ids:", [p.name if p else None for p in batch])
+    print("cache:", product_cache.stats())
+
+    # === sütunsal rapor ===
+    prices = get_price_array()
+    print("\nToplam (para birimine göre):", prices.group_sum("amount", by="currency"))
+    print("100'den ucuz ürün sayısı:", len(prices.where("amount", "<", 100)))
@@ -0,0 +1,165 @@
+# pip install "sqlalchemy[asyncio]>=2" aiosqlite
+"""
+pydantic_valueobject.py'deki repository fonksiyonlarının asyncio karşılığı.
+
+Senkron fonksiyonlar her çağrıda Session(engine) açıp bloklayan I/O yapıyor; async bir
+API servisinde bu, her DB çağrısında event loop'u durdurur. Burada aynı ProductModel /
+ProductDC / PriceDC eşlemesi AsyncEngine + AsyncSession (aiosqlite) üzerinden çalışır.
+
+- Eşzamanlılık sınırı: aynı anda en fazla MAX_CONCURRENCY DB işlemi (asyncio.Semaphore)
+- get_products_by_ids: id listesini chunk'lara bölüp IN (...) sorgularını asyncio.gather
+  ile paralel çalıştırır; sonuç girdi sırasıyla, bulunamayanlar None
+
+    await init_models()
+    p = await add_product(ProductDC(None, "Mug", PriceDC(129.9, "TRY")))
+    a, b = await asyncio.gather(get_product_by_id(1), get_product_by_id(2))
+    items = await get_products_by_ids([5, 1, 99])     # [ProductDC, ProductDC, None]
+"""
+from __future__ import annotations
+
+import asyncio
+import weakref
+from itertools import islice
+from typing import AsyncIterator, Iterable, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydantic_valueobject import (
+    DATABASE_URL, Base, PriceDC, ProductDC, ProductModel, _price_from_db, _to_dc, product_cache,
+)
+
+# ================== SETUP ===================
+# Senkron modülle aynı DB dosyası; import edilmesi senkron engine'i oluşturmaz
+async_engine = create_async_engine(DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1), echo=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+MAX_CONCURRENCY = 8
+IN_CHUNK_SIZE = 500  # SQLite parametre limitinin (999/32766) altında
+_limits = weakref.WeakKeyDictionary()  # event loop → Semaphore
+
+
+def _limit() -> asyncio.Semaphore:
+    """
+    Çalışan event loop'un semaforu. Semaphore ilk beklemede o loop'a bağlanır; modül
+    düzeyinde tek bir nesne sonraki asyncio.run çağrılarında "bound to a different event loop" verir.
+    """
+    loop = asyncio.get_running_loop()
+    limit = _limits.get(loop)
+    if limit is None:
+        limit = _limits[loop] = asyncio.Semaphore(MAX_CONCURRENCY)
+    return limit
+
+
+async def init_models() -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+# ================== REPO-LIKE API ===========
+async def add_product(p: ProductDC) -> ProductDC:
+    """ProductDC -> DB insert -> ProductDC (id ile döndür)."""
+    async with _limit(), AsyncSessionLocal() as s:
+        orm = ProductModel(
+            name=p.name,
+            _price_amount=p.price.amount,
+            _price_currency=p.price.currency,
+        )
+        s.add(orm)
+        await s.commit()
+        product_cache.invalidate([orm.id])  # senkron API ile aynı süreçte çalışılıyorsa
+        return _to_dc(orm)
+
+
+async def add_products_bulk(items: Iterable[ProductDC]) -> List[ProductDC]:
+    """Core insert ... RETURNING id ile tek transaction'da toplu ekleme."""
+    items = list(items)
+    if not items:
+        return []
+    table = ProductModel.__table__
+    stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    params = [
+        {"name": p.name, "_price_amount": p.price.amount, "_price_currency": p.price.currency}
+        for p in items
+    ]
+    async with _limit(), async_engine.begin() as conn:
+        ids = (await conn.execute(stmt, params)).scalars().all()
+    product_cache.invalidate(ids)
+    return [ProductDC(id=pid, name=p.name, price=p.price) for pid, p in zip(ids, items)]
+
+
+async def get_product_by_id(pid: int) -> Optional[ProductDC]:
+    async with _limit(), AsyncSessionLocal() as s:
+        row = await s.get(ProductModel, pid)
+        return _to_dc(row) if row else None
+
+
+def _columns():
+    return select(ProductModel.id, ProductModel.name, ProductModel._price_amount, ProductModel._price_currency)
+
+
+async def _fetch_chunk(ids: List[int]) -> List[ProductDC]:
+    async with _limit(), async_engine.connect() as conn:
+        rows = await conn.execute(_columns().where(ProductModel.id.in_(ids)))
+        return [ProductDC(id=pid, name=name, price=_price_from_db((amount, currency))) for pid, name, amount, currency in rows]
+
+
+async def get_products_by_ids(ids: Iterable[int]) -> List[Optional[ProductDC]]:
+    """
+    Toplu okuma: her IN_CHUNK_SIZE id için bir sorgu, chunk'lar eşzamanlı (gather).
+    Dönüş girdi sırasıyla hizalıdır; bulunamayan id için None.
+    """
+    ids = list(ids)
+    unique = iter(dict.fromkeys(ids))
+    chunks = []
+    while chunk := list(islice(unique, IN_CHUNK_SIZE)):
+        chunks.append(chunk)
+    found = {}
+    for batch in await asyncio.gather(*(_fetch_chunk(c) for c in chunks)):
+        found.update((p.id, p) for p in batch)
+    return [found.get(pid) for pid in ids]
+
+
+async def get_all_products() -> List[ProductDC]:
+    return [p async for p in iter_products()]
+
+
+async def iter_products(batch_size: int = 1000) -> AsyncIterator[ProductDC]:
+    """Kolon bazlı, akış halinde okuma (senkron iter_products'ın async karşılığı)."""
+    async with async_engine.connect() as conn:
+        result = await conn.stream(
+            _columns().order_by(ProductModel.id.asc()).execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            for pid, name, amount, currency in rows:
+                yield ProductDC(id=pid, name=name, price=_price_from_db((amount, currency)))
+
+
+# ================== DEMO ====================
+async def _demo():
+    await init_models()
+    mug = await add_product(ProductDC(id=None, name="Async Mug", price=PriceDC(149.9, "TRY")))
+    bulk = await add_products_bulk([
+        ProductDC(id=None, name="Async Plate", price=PriceDC(59.0, "TRY")),
+        ProductDC(id=None, name="Async Bowl", price=PriceDC(79.0, "TRY")),
+    ])
+    print("Eklendi:", mug.id, [p.id for p in bulk])
+
+    a, b = await asyncio.gather(get_product_by_id(mug.id), get_product_by_id(bulk[0].id))
+    print("gather:", a.name, b.name)
+    print("by_ids:", [p and p.name for p in await get_products_by_ids([bulk[1].id, -1, mug.id])])
+    print("toplam ürün:", len(await get_all_products()))
+    await _contended_reads(mug.id)
+
+
+async def _contended_reads(pid: int) -> None:
+    # MAX_CONCURRENCY'den fazla eşzamanlı istek: semafor beklemeye girer (loop'a bağlanır)
+    found = await asyncio.gather(*(get_product_by_id(pid) for _ in range(MAX_CONCURRENCY * 4)))
+    assert all(p is not None and p.id == pid for p in found)
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
+    asyncio.run(_contended_reads(1))  # ikinci event loop: aynı semafor kullanılsaydı RuntimeError
+    print("ikinci event loop: tamam")
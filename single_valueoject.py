@@ -1,7 +1,11 @@
-from sqlalchemy import create_engine, Column, Integer, String, TypeDecorator
+from sqlalchemy import Column, Integer, String, TypeDecorator
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
 import json
+from valueobject_base import value_object
+from valueobject_codec import get_codec
+from valueobject_engine import create_tuned_engine
+from valueobject_serializers import resolve_serializer, serializer_for
 
 # --- Temel ORM kurulumu ---
 Base = declarative_base()
@@ -11,11 +15,12 @@ User sınıfı olsun.
 profile sütunu, bir JSON içinde age ve country tutacak.
 profile bir value object gibi davranacak.
 age > 18 olan kullanıcıları sorgula"""
-# --- Value Object: Profile (sadece veri taşıyor) ---
+# --- Value Object: Profile (sadece veri taşıyor, değişmez) ---
+# user.profile.age = 30 → FrozenInstanceError; yeni değer için user.profile = Profile(30, "TR")
+@value_object
 class Profile:
-    def __init__(self, age, country):
-        self.age = age
-        self.country = country
+    age: int
+    country: str
 """🧠 Sonuç
 ❌ SQLite’da gerçek composite yok.
 ✅ Ama TypeDecorator ile aynı amacı (value object saklamak) çok basit şekilde
@@ -24,19 +29,32 @@ Bu yapı, DDD’deki value object kavramına tam uyar"""
 #------------------------------------------------------------------ 
 # --- JSON tipi için özel sütun ---
 #ProfileType → Profile nesnesini JSON’a çevirir.
+#serializer → "json" (varsayılan), "orjson", "msgpack" (BLOB) veya fallback dizisi
+#            ("orjson", "json"); bkz. valueobject_serializers
 class ProfileType(TypeDecorator):
     impl = String  # SQLite TEXT sütunu
+    cache_ok = True  # json_extract(profile, ...) içeren sorgular da SQL önbelleğine girsin
+
+    def __init__(self, *args, serializer=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.serializer = serializer
+        self._serializer = resolve_serializer(serializer) if serializer is not None else None
+        self.codec = get_codec(Profile)  # ValueType'larla aynı arayüz (dışa/içe aktarma vb.)
+
+    def load_dialect_impl(self, dialect):
+        # json/orjson → TEXT, msgpack → BLOB
+        return dialect.type_descriptor(serializer_for(self._serializer, dialect).impl())
 
     def process_bind_param(self, value, dialect):
         # Python nesnesini JSON string'e çevir
         if value is not None:
-            return json.dumps({'age': value.age, 'country': value.country})
+            return serializer_for(self._serializer, dialect).dumper(self.codec)(value)
         return None
         #------------------------------------------------------------------    
           #🔄 Örnek Akış:       
             #user = User(profile=Profile(age=25, country="TR"))
             #session.add(user)  # 1. Kaydetme
-           """
+        """
             SQLAlchemy user.profile'i görür.
             profile sütunu ProfileType tipinde → process_bind_param çağrılır.
             Profile(25, "TR") → '{"age": 25, "country": "TR"}' (string)
@@ -45,12 +63,16 @@ class ProfileType(TypeDecorator):
     def process_result_value(self, value, dialect):
         # JSON string'den Python nesnesine çevir
         if value is not None:
-            data = json.loads(value)
-            return Profile(data['age'], data['country'])
+            return serializer_for(self._serializer, dialect).loader(self.codec)(value)
         return None
+
+    def compare_values(self, x, y):
+        # Flush'ta değişiklik tespiti: önce kimlik, sonra alanlar (eşit yeni nesne → UPDATE yok);
+        # değişebilir (frozen olmayan) sınıflarda TypeDecorator'ın varsayılanı x == y
+        return self.codec.equal(x, y) if self.codec.frozen else x == y
         #------------------------------------------------------------------    
             #user = session.query(User).first()  # 2. Okuma
-            """
+        """
                 ***1-SQLite’dan '{"age": 25, "country": "TR"}' gelir.
                 ***2-ProfileType.process_result_value çağrılır.
                 ***3-JSON string → Profile(age=25, country="TR")
@@ -63,49 +85,50 @@ class User(Base):
     name = Column(String)
     profile = Column(ProfileType)  # JSON olarak saklanır
 
-# --- Veritabanı bağlantısı ---
-engine = create_engine('sqlite:///example.db')
-Base.metadata.create_all(engine)
+if __name__ == "__main__":
+    # --- Veritabanı bağlantısı ---
+    engine = create_tuned_engine('sqlite:///example.db')
+    Base.metadata.create_all(engine)
 
-Session = sessionmaker(bind=engine)
-session = Session()
+    Session = sessionmaker(bind=engine)
+    session = Session()
 
-session.add(User(name="Ali", profile=Profile(age=25, country="TR")))
-session.add(User(name="Zeynep", profile=Profile(age=17, country="TR")))
-session.add(User(name="Mehmet", profile=Profile(age=30, country="DE")))
-session.add(User(name="Veli", profile=Profile(age=24, country="TR")))
-session.add(User(name="Züleyha", profile=Profile(age=18, country="TR")))
-session.add(User(name="Muhittin", profile=Profile(age=20, country="DE")))
-session.add(User(name="Şükrü", profile=Profile(age=23, country="TR")))
-session.add(User(name="leyla", profile=Profile(age=16, country="TR")))
-session.add(User(name="Kemal", profile=Profile(age=32, country="DE")))
-session.commit()
+    session.add(User(name="Ali", profile=Profile(age=25, country="TR")))
+    session.add(User(name="Zeynep", profile=Profile(age=17, country="TR")))
+    session.add(User(name="Mehmet", profile=Profile(age=30, country="DE")))
+    session.add(User(name="Veli", profile=Profile(age=24, country="TR")))
+    session.add(User(name="Züleyha", profile=Profile(age=18, country="TR")))
+    session.add(User(name="Muhittin", profile=Profile(age=20, country="DE")))
+    session.add(User(name="Şükrü", profile=Profile(age=23, country="TR")))
+    session.add(User(name="leyla", profile=Profile(age=16, country="TR")))
+    session.add(User(name="Kemal", profile=Profile(age=32, country="DE")))
+    session.commit()
 
-from sqlalchemy import text
-#------------------------------------------------------------------
-"""
-Ama dikkat:
-"SQLAlchemy profile.age" gibi doğrudan sorgulamayı otomatik desteklemez,
-çünkü profile bir TEXT sütunu içinde JSON olarak saklanıyor.
+    from sqlalchemy import text
+    #------------------------------------------------------------------
+    """
+    Ama dikkat:
+    "SQLAlchemy profile.age" gibi doğrudan sorgulamayı otomatik desteklemez,
+    çünkü profile bir TEXT sütunu içinde JSON olarak saklanıyor.
 
-Ancak SQLite, json_extract fonksiyonunu destekler. Bunu kullanarak sorgu
-yapabiliriz."""
-#------------------------------------------------------------------
-# JSON içinden age'ye göre sorgu
-results = session.query(User).filter(
-    text("json_extract(profile, '$.age') > 18")
-).all()
-for user in results:
-    print(f"{user.name} - {user.profile.age} yaşında")
+    Ancak SQLite, json_extract fonksiyonunu destekler. Bunu kullanarak sorgu
+    yapabiliriz."""
+    #------------------------------------------------------------------
+    # JSON içinden age'ye göre sorgu
+    results = session.query(User).filter(
+        text("json_extract(profile, '$.age') > 18")
+    ).all()
+    for user in results:
+        print(f"{user.name} - {user.profile.age} yaşında")
 
-#------------------------------------------------------------------   
-turks = session.query(User).filter(
-    text("json_extract(profile, '$.country') = 'DE'")
-).all()
-for user in turks:
-    print(user.name)
-#------------------------------------------------------------------    
-"""✅ Özet
-ProfileType → Profile nesnesini JSON’a çevirir.
-json_extract → SQLite’ın JSON sorgulama fonksiyonu.
-text() → SQLAlchemy’de ham SQL fonksiyonlarını kullanmamızı sağlar."""
+    #------------------------------------------------------------------   
+    turks = session.query(User).filter(
+        text("json_extract(profile, '$.country') = 'DE'")
+    ).all()
+    for user in turks:
+        print(user.name)
+    #------------------------------------------------------------------    
+    """✅ Özet
+    ProfileType → Profile nesnesini JSON’a çevirir.
+    json_extract → SQLite’ın JSON sorgulama fonksiyonu.
+    text() → SQLAlchemy’de ham SQL fonksiyonlarını kullanmamızı sağlar."""
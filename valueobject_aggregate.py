@@ -0,0 +1,137 @@
+"""
+Value object alanları üzerinde SQL'e itilmiş (push-down) toplama: sum / avg / min / max / count.
+
+Para birimi başına ciro için her Product'ı yükleyip p.price.amount'u Python'da toplamak
+(multi_valueobject.py'nin sonundaki "verimsiz" döngü) yerine tek bir GROUP BY sorgusu:
+
+    # JSON ValueType sütunu (multi_valueobject.py / vealuobject_hybrid-property.py)
+    prices = ValueAggregator.for_column(Product.price)
+    # Ayrı kolonlar (valueobject_composite.value_columns / pydantic_valueobject.py)
+    prices = ValueAggregator.for_column(SplitProduct.price)
+    prices = ValueAggregator(PriceDC, amount=ProductModel._price_amount, currency=ProductModel._price_currency)
+
+    prices.aggregate(session, "sum")                 # {"TRY": Money(31500, "TRY"), "USD": Money(...)}
+    prices.aggregate(session, "count")               # {"TRY": 3, "USD": 1}
+    prices.summary(session, where=[Product.name.like("L%")])
+    # {"TRY": {"sum": Money, "avg": Money, "min": Money, "max": Money, "count": 3}, ...}
+
+Sonuçlar sütunun value object sınıfıyla döner (Money / PriceDC): toplanan alan + gruplama
+alanı. JSON sütunlarda alan ifadesi sütun tipinin comparator'ından alınır (Product.price.amount →
+CAST(json_extract(...) AS FLOAT), ifade indeksleriyle aynı); comparator'ı olmayan ValueType'larda
+json_extract kullanılır.
+"""
+from sqlalchemy import func, literal_column, select
+
+from valueobject_codec import get_codec
+
+AGGREGATES = {
+    "sum": func.sum,
+    "avg": func.avg,
+    "min": func.min,
+    "max": func.max,
+    "count": func.count,
+}
+
+
+def _json_field(column, name):
+    try:
+        return getattr(column, name)  # ValueType.Comparator: tipli/CAST'li ifade
+    except AttributeError:
+        return func.json_extract(column, literal_column(f"'$.{name}'"))
+
+
+class ValueAggregator:
+    """
+    :param value_cls: sonuçların oluşturulacağı value object sınıfı (Money, PriceDC ...)
+    :param columns: alan adı → SQL ifadesi (kolon, json_extract ...)
+    """
+
+    def __init__(self, value_cls, **columns):
+        self.value_cls = value_cls
+        self.codec = get_codec(value_cls)
+        self.columns = columns
+        missing = set(columns) - set(self.codec.fields)
+        if missing:
+            raise ValueError(f"{value_cls.__name__} sınıfında olmayan alanlar: {sorted(missing)}")
+
+    @classmethod
+    def for_column(cls, column):
+        """
+        ValueType sütunu (ORM attribute'u veya Column) için: alanlar JSON'dan okunur.
+        value_columns ile ayrı sütunlarda saklanan attribute'larda alanlar gerçek sütunlardır.
+        """
+        composite = getattr(getattr(column, "property", None), "codec", None)
+        if composite is not None:
+            return cls(composite.cls, **{name: getattr(column, name) for name in composite.fields})
+        value_cls = column.type.cls
+        return cls(value_cls, **{name: _json_field(column, name) for name in get_codec(value_cls).fields})
+
+    def statement(self, ops, field="amount", by="currency", where=()):
+        """SELECT <by>, op(<field>) ... GROUP BY <by>; ops sırasıyla etiketli (op adı)."""
+        try:
+            target, key = self.columns[field], self.columns[by]
+        except KeyError as e:
+            raise ValueError(f"Bilinmeyen alan: {e.args[0]}") from None
+        selected = []
+        for op in ops:
+            if op not in AGGREGATES:
+                raise ValueError(f"Desteklenmeyen toplama: {op!r} (seçenekler: {', '.join(AGGREGATES)})")
+            selected.append(AGGREGATES[op](target).label(op))
+        return select(key.label(by), *selected).where(*where).group_by(key).order_by(key)
+
+    def _build(self, field, by):
+        if set(self.codec.fields) != {field, by}:
+            return None  # sonuç value object'e çevrilemez (başka alanlar da var) → ham değer
+        build = self.codec.from_dict_trusted  # değerler DB'den, doğrulanmış alanlardan
+        return lambda value, group: None if value is None else build({field: value, by: group})
+
+    def aggregate(self, session, op, field="amount", by="currency", where=()):
+        """{grup: sonuç}; count → int, diğerleri → value object (örneğin Money(toplam, grup))."""
+        build = self._build(field, by) if op != "count" else None
+        rows = session.execute(self.statement((op,), field, by, where))
+        if build is None:
+            return {group: value for group, value in rows}
+        return {group: build(value, group) for group, value in rows}
+
+    def summary(self, session, field="amount", by="currency", ops=tuple(AGGREGATES), where=()):
+        """Tek sorguda birden çok toplama: {grup: {op: sonuç}}."""
+        build = self._build(field, by)
+        result = {}
+        for row in session.execute(self.statement(ops, field, by, where)).mappings():
+            group = row[by]
+            result[group] = {
+                op: row[op] if op == "count" or build is None else build(row[op], group) for op in ops
+            }
+        return result
+
+
+if __name__ == "__main__":
+    from sqlalchemy.orm import Session
+
+    import multi_valueobject as multi
+    import pydantic_valueobject as split
+    from valueobject_engine import create_tuned_engine
+
+    rows = [(15000, "TRY"), (12000, "TRY"), (4500, "TRY"), (999, "USD"), (120, "EUR")]
+
+    engine = create_tuned_engine("sqlite://")
+    multi.Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        s.add_all([multi.Product(name=f"p-{i}", price=multi.Money(a, c)) for i, (a, c) in enumerate(rows)])
+        s.commit()
+        json_prices = ValueAggregator.for_column(multi.Product.price)
+        print("JSON  sum:", json_prices.aggregate(s, "sum"))
+        print("JSON  özet:", json_prices.summary(s, where=[multi.Product.name != "p-0"])["TRY"])
+        assert json_prices.aggregate(s, "sum")["TRY"] == multi.Money(31500, "TRY")
+
+    engine = create_tuned_engine("sqlite://")
+    split.Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        s.add_all([split.ProductModel(name=f"p-{i}", price=split.PriceDC(a, c)) for i, (a, c) in enumerate(rows)])
+        s.commit()
+        split_prices = ValueAggregator(
+            split.PriceDC, amount=split.ProductModel._price_amount, currency=split.ProductModel._price_currency
+        )
+        print("Kolon max:", split_prices.aggregate(s, "max"))
+        print("Kolon count:", split_prices.aggregate(s, "count"))
+        assert split_prices.aggregate(s, "sum")["TRY"] == split.PriceDC(31500, "TRY")
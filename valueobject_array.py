@@ -0,0 +1,381 @@
+"""
+Bir value object sınıfı için sütunsal (columnar) koleksiyon: ValueObjectArray.
+
+Analitik işlerde 10M PriceDC / Coordinates yüklemek 10M Python nesnesi demek.
+ValueObjectArray her alanı bitişik, tipli bir tamponda tutar:
+- sayısal alanlar → array.array ("d" float64, "q" int64); NumPy kuruluysa aynı tampon
+  np.frombuffer ile KOPYALANMADAN ndarray olarak görülür ve işlemler vektörel yapılır
+- str alanlar (currency gibi) → sözlük kodlaması (dictionary encoding):
+  int32 kod dizisi + farklı değerlerin listesi ("TRY" milyon kez değil bir kez saklanır)
+- diğer tipler → düz Python listesi
+
+    prices = ValueObjectArray.from_rows(PriceDC, session.execute(
+        select(ProductModel._price_amount, ProductModel._price_currency)))
+    len(prices)                                   # 10_000_000
+    prices[3].amount                              # tembel görünüm; nesne üretmez
+    prices.get(3)                                 # gerçek PriceDC nesnesi
+    cheap = prices.where("amount", "<", 100)      # vektörel filtre → yeni ValueObjectArray
+    prices.sum("amount")                          # indirgeme
+    prices.group_sum("amount", by="currency")     # {"TRY": ..., "USD": ...}
+"""
+import operator
+from array import array
+from itertools import compress
+
+from valueobject_codec import get_codec
+
+try:
+    import numpy as np
+except ImportError:  # opsiyonel bağımlılık
+    np = None
+
+# Anotasyon → array typecode. str sözlük kodlanır; bilinmeyenler ilk değerden çıkarılır.
+_TYPECODES = {float: "d", "float": "d", int: "q", "int": "q", bool: "b", "bool": "b"}
+_NP_DTYPES = {"d": "float64", "q": "int64", "b": "int8", "i": "int32"}
+
+_OPS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+}
+
+
+class NumericColumn:
+    """array.array tabanlı sayısal sütun."""
+    __slots__ = ("data",)
+
+    def __init__(self, typecode, data=None):
+        self.data = data if data is not None else array(typecode)
+
+    def append(self, value):
+        self.data.append(value)
+
+    def extend(self, values):
+        self.data.extend(values)
+
+    def __getitem__(self, i):
+        return self.data[i]
+
+    def __len__(self):
+        return len(self.data)
+
+    def values(self):
+        """Vektörel işlemler için: NumPy varsa kopyasız ndarray görünümü, yoksa array'in kendisi."""
+        if np is not None:
+            return np.frombuffer(self.data, dtype=_NP_DTYPES[self.data.typecode])
+        return self.data
+
+    def py_values(self):
+        return self.data  # array.array elemanları Python float/int olarak okunur
+
+    def take(self, mask):
+        if np is not None:
+            return NumericColumn(self.data.typecode, array(self.data.typecode, self.values()[mask].tobytes()))
+        return NumericColumn(self.data.typecode, array(self.data.typecode, compress(self.data, mask)))
+
+    def compare(self, op, value):
+        if np is not None:
+            return _OPS[op](self.values(), value)
+        fn = _OPS[op]
+        return [fn(x, value) for x in self.data]
+
+
+class DictColumn:
+    """Sözlük kodlamalı str sütunu: codes[i] → categories[codes[i]]."""
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self, codes=None, categories=None):
+        self.codes = codes if codes is not None else array("i")
+        self.categories = categories if categories is not None else []
+        self._index = {v: i for i, v in enumerate(self.categories)}
+
+    def _code(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self._code(value))
+
+    def extend(self, values):
+        code = self._code
+        self.codes.extend([code(v) for v in values])
+
+    def __getitem__(self, i):
+        return self.categories[self.codes[i]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def values(self):
+        return [self.categories[c] for c in self.codes]
+
+    py_values = values
+
+    def code_values(self):
+        if np is not None:
+            return np.frombuffer(self.codes, dtype="int32")
+        return self.codes
+
+    def take(self, mask):
+        if np is not None:
+            codes = array("i", self.code_values()[mask].tobytes())
+        else:
+            codes = array("i", compress(self.codes, mask))
+        return DictColumn(codes, list(self.categories))
+
+    def compare(self, op, value):
+        # Eşitlik sorguları tek bir int kod karşılaştırmasına iner
+        if op in ("==", "!="):
+            code = self._index.get(value, -1)
+            if np is not None:
+                return _OPS[op](self.code_values(), code)
+            fn = _OPS[op]
+            return [fn(c, code) for c in self.codes]
+        fn, cats = _OPS[op], self.categories
+        matches = [fn(v, value) for v in cats]  # her kategori için bir kez
+        if np is not None:
+            return np.asarray(matches, dtype=bool)[self.code_values()]
+        return [matches[c] for c in self.codes]
+
+
+class ObjectColumn:
+    """Tipi bilinmeyen/karışık alanlar için düz liste."""
+    __slots__ = ("data",)
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else []
+
+    def append(self, value):
+        self.data.append(value)
+
+    def extend(self, values):
+        self.data.extend(values)
+
+    def __getitem__(self, i):
+        return self.data[i]
+
+    def __len__(self):
+        return len(self.data)
+
+    def values(self):
+        return self.data
+
+    py_values = values
+
+    def take(self, mask):
+        if np is not None:
+            mask = mask.tolist()
+        return ObjectColumn(list(compress(self.data, mask)))
+
+    def compare(self, op, value):
+        fn = _OPS[op]
+        result = [fn(x, value) for x in self.data]
+        return np.asarray(result, dtype=bool) if np is not None else result
+
+
+def _new_column(annotation, sample):
+    kind = _TYPECODES.get(annotation)
+    if kind is None and annotation in (str, "str"):
+        return DictColumn()
+    if kind is None and annotation is None:
+        if isinstance(sample, str):
+            return DictColumn()
+        if isinstance(sample, bool):
+            kind = "b"
+        elif isinstance(sample, int):
+            kind = "q"
+        elif isinstance(sample, float):
+            kind = "d"
+    return NumericColumn(kind) if kind else ObjectColumn()
+
+
+class ValueObjectArray:
+    """
+    Tek bir value object sınıfının sütunsal dizisi. Oluşturmak için from_objects,
+    from_rows veya from_columns kullanın.
+    """
+
+    def __init__(self, cls, columns):
+        self.cls = cls
+        self.codec = get_codec(cls)
+        self.columns = columns  # {alan: NumericColumn | DictColumn | ObjectColumn}
+        self._view_cls = None
+
+    # ---------- oluşturma ----------
+    @classmethod
+    def _empty(cls, vo_cls, sample):
+        codec = get_codec(vo_cls)
+        return cls(vo_cls, {
+            f: _new_column(codec.types[f], sample[i] if sample is not None else None)
+            for i, f in enumerate(codec.fields)
+        })
+
+    @classmethod
+    def from_rows(cls, vo_cls, rows, chunk_size=65536):
+        """
+        Alan sırasıyla (amount, currency) gelen satırlardan: örneğin
+        session.execute(select(ProductModel._price_amount, ProductModel._price_currency)).
+        Satırlar parça parça sütunlara aktarılır; arada hiç value object nesnesi oluşmaz.
+        """
+        rows = iter(rows)
+        result = None
+        while True:
+            chunk = [tuple(r) for _, r in zip(range(chunk_size), rows)]
+            if not chunk:
+                break
+            if result is None:
+                result = cls._empty(vo_cls, chunk[0])
+            for col, values in zip(result.columns.values(), zip(*chunk)):
+                col.extend(values)
+        return result if result is not None else cls._empty(vo_cls, None)
+
+    @classmethod
+    def from_objects(cls, vo_cls, objects, chunk_size=65536):
+        """Mevcut value object nesnelerinden (ör. get_all_products() fiyatları)."""
+        to_tuple = get_codec(vo_cls).to_tuple
+        return cls.from_rows(vo_cls, map(to_tuple, objects), chunk_size)
+
+    @classmethod
+    def from_columns(cls, vo_cls, **columns):
+        """
+        Hazır tamponlardan oluşturma. array.array (ve (codes, categories) çiftinde "i" tipli
+        array.array codes) kopyasız sarılır; sütunlar array.array üzerinde durduğu için
+        ndarray ve diğer diziler TEK kopyayla aktarılır (bitişik olmayan ndarray önce
+        bitişik hale getirilir). str alanlar için (codes, categories) çifti ya da düz liste verilebilir.
+        """
+        result = {}
+        for f in get_codec(vo_cls).fields:
+            data = columns[f]
+            if isinstance(data, tuple):
+                codes = data[0]
+                if not (isinstance(codes, array) and codes.typecode == "i"):
+                    codes = array("i", codes)
+                result[f] = DictColumn(codes, list(data[1]))
+            elif isinstance(data, array):
+                result[f] = NumericColumn(data.typecode, data)
+            elif np is not None and isinstance(data, np.ndarray):
+                tc = {v: k for k, v in _NP_DTYPES.items()}.get(str(data.dtype))
+                if tc is None:
+                    result[f] = ObjectColumn(data.tolist())
+                else:
+                    buf = array(tc)
+                    buf.frombytes(memoryview(np.ascontiguousarray(data)).cast("B"))  # ndarray → array: tek memcpy
+                    result[f] = NumericColumn(tc, buf)
+            elif data and isinstance(data[0], str):
+                col = DictColumn()
+                col.extend(data)
+                result[f] = col
+            else:
+                result[f] = ObjectColumn(list(data))
+        return cls(vo_cls, result)
+
+    # ---------- erişim ----------
+    def __len__(self):
+        first = next(iter(self.columns.values()), None)
+        return len(first) if first is not None else 0
+
+    def _view_type(self):
+        """Alan başına bir property içeren, __slots__'lu hafif görünüm sınıfı (bir kez üretilir)."""
+        if self._view_cls is None:
+            ns = {"__slots__": ("_cols", "_i")}
+            for f in self.codec.fields:
+                ns[f] = property(lambda self, _f=f: self._cols[_f][self._i])
+
+            def __repr__(self):
+                values = ", ".join(f"{f}={self._cols[f][self._i]!r}" for f in self._cols)
+                return f"<{type(self).__name__} {values}>"
+            ns["__repr__"] = __repr__
+            self._view_cls = type(f"{self.cls.__name__}View", (), ns)
+        return self._view_cls
+
+    def __getitem__(self, i):
+        """Tembel görünüm: alanlar erişildiği anda sütunlardan okunur."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        view_cls = self._view_type()
+        view = view_cls.__new__(view_cls)
+        view._cols, view._i = self.columns, i
+        return view
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def get(self, i):
+        """i. elemanı gerçek value object olarak döndürür (__init__ atlanır)."""
+        return self.codec.from_tuple_trusted(tuple(self.columns[f][i] for f in self.codec.fields))
+
+    def to_objects(self):
+        build = self.codec.from_tuple_trusted
+        return [build(row) for row in zip(*(c.py_values() for c in self.columns.values()))]
+
+    def column(self, field):
+        """Alanın vektörel değerleri (ndarray görünümü veya array.array)."""
+        return self.columns[field].values()
+
+    # ---------- filtre ----------
+    def mask(self, field, op, value):
+        """Alan üzerinde karşılaştırma maskesi (ndarray[bool] veya list[bool])."""
+        return self.columns[field].compare(op, value)
+
+    def filter(self, mask):
+        return ValueObjectArray(self.cls, {f: c.take(mask) for f, c in self.columns.items()})
+
+    def where(self, field, op, value):
+        """prices.where("amount", ">", 100) → koşulu sağlayan elemanlardan yeni dizi."""
+        return self.filter(self.mask(field, op, value))
+
+    # ---------- indirgeme ----------
+    # Vektörel yol yalnızca NumericColumn'da: DictColumn'un values()'u str listesi, ObjectColumn'unki
+    # düz listedir (ndarray değil, .sum()/.min() yok)
+    def sum(self, field):
+        column = self.columns[field]
+        if np is not None and isinstance(column, NumericColumn):
+            return column.values().sum().item()
+        return sum(column.py_values())
+
+    def min(self, field):
+        column = self.columns[field]
+        if isinstance(column, DictColumn):  # kullanılan kategoriler arasında; satır başına değil
+            return min(column.categories[c] for c in set(column.codes))
+        if np is not None and isinstance(column, NumericColumn):
+            return column.values().min().item()
+        return min(column.py_values())
+
+    def max(self, field):
+        column = self.columns[field]
+        if isinstance(column, DictColumn):
+            return max(column.categories[c] for c in set(column.codes))
+        if np is not None and isinstance(column, NumericColumn):
+            return column.values().max().item()
+        return max(column.py_values())
+
+    def mean(self, field):
+        return self.sum(field) / len(self) if len(self) else None
+
+    def group_sum(self, field, by):
+        """
+        Sözlük kodlu `by` alanına göre gruplu toplam: {"TRY": 1234.5, "USD": 99.0}.
+        NumPy'de tek bir bincount çağrısı; saf Python'da kod başına tek geçiş.
+        GROUP BY gibi yalnızca satırı olan gruplar döner (filter() sonrası kategori listesi
+        eski gruplar da içerir); toplamlar her iki yolda da float.
+        """
+        keys = self.columns[by]
+        if not isinstance(keys, DictColumn):
+            raise TypeError(f"group_sum: {by!r} sözlük kodlu (str) bir alan olmalı")
+        values = self.column(field)
+        n = len(keys.categories)
+        if np is not None:
+            codes = keys.code_values()
+            counts = np.bincount(codes, minlength=n).tolist()
+            totals = np.bincount(codes, weights=values, minlength=n).tolist()
+        else:
+            counts, totals = [0] * n, [0.0] * n
+            for code, v in zip(keys.codes, values):
+                counts[code] += 1
+                totals[code] += v
+        return {cat: total for cat, total, count in zip(keys.categories, totals, counts) if count}
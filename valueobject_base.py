@@ -0,0 +1,107 @@
+"""
+__slots__ tabanlı, kompakt value object üreteci.
+
+Depodaki value object'lerin hepsi (düz Money/Coordinates sınıfları ve @dataclass(frozen=True)
+olanlar) her nesne için bir __dict__ taşıyor. @value_object dekoratörü anotasyonlardan:
+- __slots__ ile __dict__'siz bir sınıf,
+- değişmez (frozen) nesneler: atama FrozenInstanceError verir (dataclass ile aynı hata),
+- ucuz __eq__ (önce kimlik kontrolü, tuple oluşturmadan alan alan karşılaştırma) ve __hash__,
+- __repr__, __match_args__ ve pickle desteği üretir.
+
+    @value_object
+    class Coordinates:
+        lat: float
+        lng: float
+
+    Coordinates(41.0151, 28.9793) == Coordinates(41.0151, 28.9793)   # True
+    {Coordinates(41.0151, 28.9793)}                                   # hashlenebilir
+
+Sınıf __post_init__ tanımlarsa __init__ sonunda çağrılır (doğrulama için).
+ValueType bu sınıfları slot alanlarından serialize eder (bkz. valueobject_codec).
+Interned (valueobject_intern) ile birlikte kullanılabilir; gerekli __weakref__ slot'u eklenir.
+Alan sayısına göre bellek/hız karşılaştırması: python bench_valueobject_memory.py
+"""
+import inspect
+from dataclasses import FrozenInstanceError
+
+from valueobject_codec import _compile
+
+
+def _frozen_setattr(self, name, value):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name):
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _build(cls):
+    fields = tuple(inspect.get_annotations(cls))
+    defaults = {f: cls.__dict__[f] for f in fields if f in cls.__dict__}
+
+    ns = {k: v for k, v in cls.__dict__.items()
+          if k not in fields and k not in ("__dict__", "__weakref__")}
+    slots = list(fields)
+    slots.extend(getattr(cls, "__extra_slots__", ()))  # alan olmayan önbellek slot'ları (valueobject_keys)
+    if hasattr(cls, "__intern_pool__") and not any("__weakref__" in vars(b) for b in cls.__mro__[1:]):
+        slots.append("__weakref__")  # Interned havuzu WeakValueDictionary kullanır
+    ns["__slots__"] = tuple(slots)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, ns)
+
+    gl = {}
+    for f in fields:
+        gl[f"_set_{f}"] = new_cls.__dict__[f].__set__  # slot descriptor: frozen __setattr__'ı atlar
+        if f in defaults:
+            gl[f"_dflt_{f}"] = defaults[f]
+
+    params = ", ".join(f"{f}=_dflt_{f}" if f in defaults else f for f in fields)
+    body = [f"def __init__(self, {params}):" if fields else "def __init__(self):"]
+    body += [f"    _set_{f}(self, {f})" for f in fields]
+    if "__post_init__" in ns:
+        body.append("    self.__post_init__()")
+    if len(body) == 1:
+        body.append("    pass")
+    new_cls.__init__ = _compile("__init__", body, gl)
+
+    # Eşitlik: aynı nesne → True; farklı sınıf → NotImplemented; alanlar kısa devreyle
+    compare = " and ".join(f"self.{f} == other.{f}" for f in fields) or "True"
+    new_cls.__eq__ = _compile("__eq__", [
+        "def __eq__(self, other):",
+        "    if self is other:",
+        "        return True",
+        "    if other.__class__ is not self.__class__:",
+        "        return NotImplemented",
+        f"    return {compare}",
+    ], gl)
+    values = "".join(f"self.{f}, " for f in fields)
+    if ns.get("__hash__") is None:  # @keyed önbellekli __hash__ tanımladıysa dokunma
+        new_cls.__hash__ = _compile("__hash__", [
+            "def __hash__(self):",
+            f"    return hash(({values}))",
+        ], gl)
+    if "__repr__" not in ns:
+        reprs = ", ".join(f"{f}={{self.{f}!r}}" for f in fields)
+        new_cls.__repr__ = _compile("__repr__", [
+            "def __repr__(self):",
+            f"    return f'{{self.__class__.__qualname__}}({reprs})'",
+        ], gl)
+    # Slot'lu ve frozen sınıflar varsayılan pickle yolunda setattr kullanır → __reduce__
+    new_cls.__reduce__ = _compile("__reduce__", [
+        "def __reduce__(self):",
+        f"    return (self.__class__, ({values}))",
+    ], gl)
+    new_cls.__setattr__ = _frozen_setattr
+    new_cls.__delattr__ = _frozen_delattr
+    new_cls.__match_args__ = fields
+    new_cls.__value_fields__ = fields
+    return new_cls
+
+
+def value_object(cls=None):
+    """
+    Sınıf dekoratörü: anotasyonlu alanlardan slot'lu, frozen, hashlenebilir bir value object üretir.
+    Hem @value_object hem @value_object() şeklinde kullanılabilir.
+    """
+    if cls is None:
+        return _build
+    return _build(cls)
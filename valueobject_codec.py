@@ -0,0 +1,241 @@
+"""
+Value object sınıfları için sınıf başına bir kez derlenen (compiled) encoder/decoder'lar.
+
+ValueType her satırda json.dumps(value.__dict__) ve self.cls(**data) çağırıyordu:
+her hücre için genel bir dict kopyası ve **kwargs dağıtımı. Burada her value object
+sınıfı için alan listesine özel küçük fonksiyonlar bir kez üretilir ve sınıf
+anahtarlı bir önbellekte (_CODECS) saklanır.
+
+Kullanım:
+    codec = get_codec(Money)
+    raw = codec.encode(Money(15000, "TRY"))   # '{"amount": 15000, "currency": "TRY"}'
+    m = codec.decode_trusted(raw)             # __init__ çağrılmadan Money nesnesi
+    m = codec.decode(raw)                     # Money(**data) → __init__ doğrulaması çalışır
+"""
+import dataclasses
+import inspect
+import json
+import math
+import types
+from json.encoder import encode_basestring_ascii
+
+_json_encode = json.JSONEncoder().encode   # json.dumps(x) ile aynı çıktı, kwargs kontrolü yok
+_json_decode = json.JSONDecoder().decode   # json.loads(s) ile aynı
+
+
+def _encode_float(x):
+    # float.__repr__ json.dumps ile aynı metni üretir; NaN/Infinity için json'a bırak
+    return float.__repr__(x) if math.isfinite(x) else _json_encode(x)
+
+
+# Sık görülen skaler tipler için json.dumps'ın ürettiği metni doğrudan üreten fonksiyonlar.
+# Listede olmayan her tip (bool, None, list, Decimal...) _json_encode'a düşer.
+_SCALAR_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+}
+
+_CODECS = {}  # {value object sınıfı: ValueCodec}
+
+
+def value_fields(cls):
+    """
+    Bir value object sınıfının alan adlarını tanım sırasıyla döndürür.
+    - dataclass      → dataclasses.fields(cls)
+    - @value_object  → __value_fields__
+    - __slots__ sınıf → MRO boyunca tanımlanmış slot adları
+    - düz sınıf       → __init__ imzasındaki parametreler (Money(amount, currency) gibi;
+                        parametrelerin aynı isimli attribute'lara atandığı varsayılır)
+    """
+    if dataclasses.is_dataclass(cls):
+        return tuple(f.name for f in dataclasses.fields(cls))
+    if hasattr(cls, "__value_fields__"):  # valueobject_base.value_object (ek slot'lar alan değil)
+        return cls.__value_fields__
+
+    slots = []
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get("__slots__", ())
+        if isinstance(names, str):
+            names = (names,)
+        slots.extend(n for n in names if n not in ("__dict__", "__weakref__"))
+    if slots:
+        return tuple(slots)
+
+    params = list(inspect.signature(cls.__init__).parameters.values())[1:]  # self hariç
+    return tuple(
+        p.name for p in params
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    )
+
+
+def class_annotations(cls):
+    """MRO boyunca sınıf anotasyonları, taban sınıfınkiler önce (dataclass alan sırası gibi)."""
+    merged = {}
+    for base in reversed(cls.__mro__):
+        merged.update(inspect.get_annotations(base))
+    return merged
+
+
+def value_field_types(cls, fields):
+    """
+    Alanların tip anotasyonlarını döndürür: {alan: tip}. Anotasyonu olmayan alan için None.
+    dataclass'ta alan tipleri, diğerlerinde __init__ parametre anotasyonları, onlar yoksa
+    sınıf anotasyonları (@value_object'in ürettiği __init__ anotasyonsuzdur) kullanılır.
+    `from __future__ import annotations` kullanan modüllerde tipler string gelir ("int").
+    """
+    if dataclasses.is_dataclass(cls):
+        hints = {f.name: f.type for f in dataclasses.fields(cls)}
+    else:
+        hints = dict(inspect.get_annotations(cls))
+        hints.update(
+            (name, p.annotation)
+            for name, p in inspect.signature(cls.__init__).parameters.items()
+            if p.annotation is not p.empty
+        )
+    return {f: hints.get(f) for f in fields}
+
+
+def _compile(name, lines, namespace):
+    """dataclasses modülündeki gibi: kaynak kodu üret, exec et, fonksiyonu döndür."""
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+class ValueCodec:
+    """
+    Tek bir value object sınıfı için derlenmiş dönüşüm fonksiyonları.
+    Doğrudan oluşturmak yerine get_codec(cls) kullanın (önbellek).
+
+    :ivar fields: Alan adları (tuple)
+    :ivar types: {alan: tip anotasyonu veya None}
+    :ivar kind: "dataclass", "slots" veya "plain"
+    :ivar frozen: nesneler değişmez mi (frozen dataclass veya @value_object)
+    :ivar equal: (x, y) → bool; alan alan karşılaştırma, frozen ise önce kimlik (ORM değişiklik takibi için)
+    :ivar to_dict: nesne → {alan: değer}
+    :ivar to_tuple: nesne → (değer, ...) alan sırasıyla (msgpack/struct gibi ikili formatlar için)
+    :ivar encode: nesne → JSON string
+    :ivar from_dict_trusted: {alan: değer} → nesne (__init__ / __post_init__ atlanır)
+    :ivar decode_trusted: JSON string → nesne (__init__ atlanır)
+    :ivar from_tuple_trusted: (değer, ...) → nesne (__init__ atlanır)
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fields = value_fields(cls)
+        self.types = value_field_types(cls, self.fields)
+        # Slot'ta saklanan alanlar: sınıf attribute'u bir member descriptor'dır
+        slot_fields = {
+            f for f in self.fields
+            if isinstance(getattr(cls, f, None), types.MemberDescriptorType)
+        }
+        if dataclasses.is_dataclass(cls):
+            self.kind = "dataclass"
+        elif slot_fields:
+            self.kind = "slots"
+        else:
+            self.kind = "plain"
+        if self.kind == "dataclass":
+            self.frozen = cls.__dataclass_params__.frozen
+        else:
+            self.frozen = hasattr(cls, "__value_fields__")  # valueobject_base.value_object
+
+        ns = {
+            "_cls": cls, "_new": object.__new__, "_loads": _json_decode,
+            "_enc": _json_encode, "_scalar": _SCALAR_ENCODERS.get,
+        }
+        items = ", ".join(f"{f!r}: v.{f}" for f in self.fields)
+        self.to_dict = _compile("to_dict", [
+            "def to_dict(v):",
+            f"    return {{{items}}}",
+        ], ns)
+        values = "".join(f"v.{f}, " for f in self.fields)
+        self.to_tuple = _compile("to_tuple", [
+            "def to_tuple(v):",
+            f"    return ({values})",
+        ], ns)
+
+        # equal: ORM flush'ında eski/yeni değer karşılaştırması (TypeDecorator.compare_values).
+        # Değişmez nesnelerde dokunulmamış sütunun değeri aynı nesnedir → kimlik kontrolü yeter;
+        # eşit değerli yeni bir nesne atanmışsa alanlar karşılaştırılır, __eq__ tanımlı olmasa da.
+        # Değişebilir sınıflarda kimlik kısa yolu yok: aynı nesne yerinde değişmiş olabilir.
+        same = " and ".join(f"x.{f} == y.{f}" for f in self.fields) or "True"
+        identity = ["    if x is y:", "        return True"] if self.frozen else []
+        self.equal = _compile("equal", [
+            "def equal(x, y):",
+            *identity,
+            "    if x is None or y is None or x.__class__ is not y.__class__:",
+            "        return False",
+            f"    return {same}",
+        ], ns)
+
+        # encode: ara dict üretmeden JSON metnini parça parça birleştirir.
+        # Çıktı json.dumps(value.__dict__) ile birebir aynıdır: '{"amount": 15000, "currency": "TRY"}'
+        parts = []
+        for i, f in enumerate(self.fields):
+            prefix = ("{" if i == 0 else ", ") + encode_basestring_ascii(f) + ": "
+            parts.append(f"{prefix!r} + (_scalar(type(v.{f})) or _enc)(v.{f})")
+        self.encode = _compile("encode", [
+            "def encode(v):",
+            f"    return {' + '.join(parts)} + '}}'" if parts else "    return '{}'",
+        ], ns)
+
+        # Güvenilir okuma: sütuna yalnızca bizim encode ettiğimiz veri yazıldığı için
+        # __init__ doğrulamasını tekrar çalıştırmaya gerek yok. Nesne object.__new__ ile
+        # oluşturulur ve alanlar doğrudan yazılır (frozen sınıfların __setattr__'ı da atlanır).
+        for f in slot_fields:
+            ns[f"_set_{f}"] = getattr(cls, f).__set__  # slot descriptor'ı
+        # @keyed sınıflarda (valueobject_keys) önbellekli hash/sort_key __post_init__'te
+        # hesaplanır; __init__ atlandığı için burada doldurulur.
+        ns["_fill"] = getattr(cls, "__keyed_fill__", None)
+
+        def trusted_builder(name, arg, item):
+            body = [f"def {name}({arg}):", "    obj = _new(_cls)"]
+            if len(slot_fields) < len(self.fields):
+                body.append("    od = obj.__dict__")
+            for i, f in enumerate(self.fields):
+                if f in slot_fields:
+                    body.append(f"    _set_{f}(obj, {arg}[{item(i, f)}])")
+                else:
+                    body.append(f"    od[{f!r}] = {arg}[{item(i, f)}]")
+            if ns["_fill"] is not None:
+                body.append("    _fill(obj)")
+            body.append("    return obj")
+            return _compile(name, body, ns)
+
+        self.from_dict_trusted = trusted_builder("from_dict_trusted", "d", lambda i, f: repr(f))
+        self.from_tuple_trusted = trusted_builder("from_tuple_trusted", "t", lambda i, f: i)
+
+        # Interned sınıflar (valueobject_intern): DB'den okunan değerler de aynı havuzdan
+        # geçer; eşit satırlar için yeni nesne yerine havuzdaki nesne döner.
+        pool = getattr(cls, "__intern_pool__", None)
+        if pool is not None:
+            keys = "".join(f"d[{f!r}], " for f in self.fields)
+            dict_key = _compile("dict_key", ["def dict_key(d):", f"    return ({keys})"], ns)
+            self.from_dict_trusted = pool.wrap(self.from_dict_trusted, dict_key)
+            self.from_tuple_trusted = pool.wrap(self.from_tuple_trusted, tuple)
+        ns["_from_dict_trusted"] = self.from_dict_trusted
+        self.decode_trusted = _compile("decode_trusted", [
+            "def decode_trusted(raw):",
+            "    return _from_dict_trusted(_loads(raw))",
+        ], ns)
+
+    def from_dict(self, data):
+        """Doğrulamalı yol: cls(**data) → __init__ / __post_init__ çalışır."""
+        return self.cls(**data)
+
+    def from_tuple(self, values):
+        """Doğrulamalı yol: cls(*values) → __init__ / __post_init__ çalışır."""
+        return self.cls(*values)
+
+    def decode(self, raw):
+        """JSON string → nesne, __init__ doğrulamasıyla."""
+        return self.cls(**_json_decode(raw))
+
+
+def get_codec(cls):
+    """Sınıf için derlenmiş ValueCodec'i döndürür; ilk çağrıda üretip önbelleğe alır."""
+    codec = _CODECS.get(cls)
+    if codec is None:
+        codec = _CODECS.setdefault(cls, ValueCodec(cls))
+    return codec
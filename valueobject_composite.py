@@ -0,0 +1,272 @@
+"""
+Value object'leri JSON metni yerine alan başına gerçek SQL sütunlarında saklama (composite).
+
+ValueType(Money) Money'yi tek bir TEXT sütununda JSON olarak saklar; her filtre ve sıralama
+json_extract ile metni ayrıştırır (ifade indeksi olsa bile yazarken ve indekssiz sorgularda).
+pydantic_valueobject.py'deki ProductModel aynı fiyatı iki gerçek sütunda tutuyor ama bunu
+elle yazılmış kolonlar + property ile yapıyor. value_columns her value object sınıfı için
+aynısını üretir: alan başına tipli bir sütun, Python tarafında yine tek attribute.
+
+    class Product(Base):
+        __tablename__ = "products"
+        id = Column(Integer, primary_key=True)
+        price = value_columns(Money, "price", indexed=("amount",))
+        # → price_amount FLOAT (indeksli), price_currency VARCHAR
+
+    p.price                                   # Money(15000.0, 'TRY'), ValueType ile aynı API
+    p.price = Money(12000, "TRY")             # eşit değerli atama UPDATE üretmez
+    select(Product).where(Product.price.amount > 10000).order_by(Product.price.currency)
+    select(Product).where(Product.price == Money(15000, "TRY"))
+
+Tüm alanlar NULL ise değer None'dır. Okuma codec'in güvenilir (trusted) yoluyla yapılır:
+sütun değerleri doğrudan slot'lara yazılır, JSON ayrıştırma ve __init__ yoktur.
+
+Var olan bir JSON sütununu yerinde dönüştürmek için migrate_json_to_columns (aşağıda):
+sütunları ekler, satırları parti parti kopyalar, indeksleri kurar ve JSON sütununu kaldırır.
+"""
+import re
+from decimal import Decimal
+
+from sqlalchemy import Boolean, Column, Float, Integer, Numeric, String, text
+from sqlalchemy.orm import Composite
+
+from valueobject_codec import get_codec
+
+# Alan anotasyonu → SQL tipi (`from __future__ import annotations` ile string gelebilir).
+# vealuobject_hybrid-property.py JSON alan ifadelerinin CAST tipini de buradan alır.
+FIELD_SQL_TYPES = {
+    int: Integer, "int": Integer,
+    float: Float, "float": Float,
+    Decimal: Numeric, "Decimal": Numeric,
+    bool: Boolean, "bool": Boolean,
+    str: String, "str": String,
+}
+
+
+def field_columns(cls, name, types=None):
+    """{alan: (sütun adı, SQL tipi)}; tipler anotasyonlardan, `types` ile ezilebilir."""
+    codec = get_codec(cls)
+    types = types or {}
+    columns = {}
+    for field in codec.fields:
+        type_ = types.get(field) or FIELD_SQL_TYPES.get(codec.types[field])
+        if type_ is None:
+            raise ValueError(
+                f"{cls.__name__}.{field} için SQL tipi bulunamadı; anotasyon ekleyin veya types={{...}} verin"
+            )
+        columns[field] = (f"{name}_{field}", type_)
+    return columns
+
+
+class ValueComposite(Composite):
+    """
+    Codec ile çalışan ORM composite'i: nesne → sütun değerleri codec.to_tuple, sütunlar →
+    nesne codec.from_tuple_trusted (trusted=False ise cls(*values), __init__ doğrulamasıyla).
+    Doğrudan oluşturmak yerine value_columns(...) kullanın.
+
+    Kurucu olarak sınıf yerine bir fabrika verilir (tüm alanlar NULL → None; SQLAlchemy 2.0 ve
+    2.1'de aynı çalışır). Alan getter'ı property'de tutulur, value object sınıfına
+    __composite_values__ eklenmez (aynı sınıf JSON ValueType sütunlarında da kullanılıyor).
+    composite_class bir sınıf olmadığından update(...).values({Product.price: Money(...)})
+    desteklenmez; toplu UPDATE'te alan sütunlarını (Product.price.amount ...) kullanın.
+    """
+
+    class Comparator(Composite.Comparator):
+        # Product.price.amount → products.price_amount (ValueType.Comparator ile aynı yazım)
+        def __getattr__(self, name):
+            fields = self.prop.codec.fields
+            if name in fields:
+                return self._comparable_elements[fields.index(name)]
+            raise AttributeError(name)
+
+    def __init__(self, cls, *columns, trusted=True, **kwargs):
+        self.codec = codec = get_codec(cls)
+        self.trusted = trusted
+        build = codec.from_tuple_trusted if trusted else codec.from_tuple
+
+        def construct(*values):
+            for value in values:
+                if value is not None:
+                    return build(values)
+            return None  # tüm alanlar NULL → None
+
+        kwargs.setdefault("comparator_factory", ValueComposite.Comparator)
+        super().__init__(construct, *columns, **kwargs)
+        # dataclass'lar için SQLAlchemy'nin kendi ürettiği getter'ın yeri: atama, karşılaştırma
+        # ve bulk save yolları bunu __composite_values__'tan önce kullanır
+        self._generated_composite_accessor = codec.to_tuple
+
+
+def value_columns(cls, name, indexed=(), nullable=True, trusted=True, types=None, **kwargs):
+    """
+    Value object'i alan başına bir sütunda saklayan ORM attribute'u.
+    :param cls: value object sınıfı (Money, Coordinates ...)
+    :param name: sütun adı öneki; sütunlar "<name>_<alan>" (price_amount, price_currency)
+    :param indexed: indekslenecek alanlar veya True (tüm alanlar); normal B-tree indeksi
+    :param nullable: False ise sütunlar NOT NULL (değer None atanamaz)
+    :param trusted: True ise okurken __init__ doğrulaması atlanır
+    :param types: {alan: SQL tipi} ile anotasyondan gelen tip ezilebilir (örneğin String(8))
+    """
+    fields = get_codec(cls).fields
+    indexed = fields if indexed is True else tuple(indexed)
+    columns = [
+        Column(column, type_, index=field in indexed, nullable=nullable)
+        for field, (column, type_) in field_columns(cls, name, types).items()
+    ]
+    return ValueComposite(cls, *columns, trusted=trusted, **kwargs)
+
+
+# ================== JSON → SÜTUN GÖÇÜ ==================
+def _table_sql(conn, kind, table):
+    return conn.execute(
+        text("SELECT name, sql FROM sqlite_master WHERE type = :kind AND tbl_name = :table"),
+        {"kind": kind, "table": table},
+    ).all()
+
+
+def _mentions(sql, column):
+    # price_amount gibi yeni sütunlar "price" ile eşleşmesin: tam kelime
+    return sql is not None and re.search(rf"\b{re.escape(column)}\b", sql) is not None
+
+
+def migrate_json_to_columns(engine, table, column, cls, indexed=(), types=None, batch_size=10_000,
+                            drop_source=True, drop_indexes=(), progress=None):
+    """
+    JSON metni tutan bir sütunu (ValueType) yerinde value_columns düzenine çevirir:
+    1. eksik "<column>_<alan>" sütunlarını ekler (ALTER TABLE ADD COLUMN),
+    2. satırları rowid aralıklarıyla, her parti ayrı transaction'da json_extract ile kopyalar
+       (yarıda kesilirse tekrar çalıştırılabilir; kopyalanmış partiler aynı değeri yazar),
+    3. drop_source=True ise JSON sütununa ait ifade indekslerini kaldırır,
+    4. `indexed` alanlar için indeks oluşturur (aynı adla başka bir ifadeyi indeksleyen
+       indeks varsa ValueError), drop_source=True ise JSON sütununu kaldırır.
+    Sütunu okuyan tetikleyiciler (SpatialIndex / TextSearchIndex) JSON sütunu kaldırılınca
+    bozulur: bu nesneler drop_indexes=(place_locations, owner_search) ile verilirse göçten önce
+    drop(conn) ile tetikleyicileri ve gölge tabloları silinir; verilmezse ValueError.
+    Kopyalanan satır sayısını döndürür; progress(kopyalanan, toplam) her partiden sonra çağrılır.
+
+    Model tarafında sütun tanımı değiştirilir: Column(ValueType(Money)) → value_columns(Money, "price").
+    """
+    targets = field_columns(cls, column, types)
+    indexed = tuple(targets) if indexed is True else tuple(indexed)
+
+    with engine.begin() as conn:
+        if drop_source:
+            for index in drop_indexes:
+                index.drop(conn)
+            triggers = [name for name, sql in _table_sql(conn, "trigger", table) if _mentions(sql, column)]
+            if triggers:
+                raise ValueError(
+                    f"{table}.{column} sütununu kullanan tetikleyiciler var: {triggers}; "
+                    "SpatialIndex / TextSearchIndex nesnelerini drop_indexes=(...) ile verin"
+                )
+        existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            raise ValueError(f"{table} tablosunda {column} sütunu yok")
+        for field, (name, type_) in targets.items():
+            if name not in existing:
+                ddl = (type_() if isinstance(type_, type) else type_).compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+        low, high = conn.execute(text(f"SELECT min(rowid), max(rowid) FROM {table}")).one()
+
+    assignments = ", ".join(
+        f"{name} = json_extract({column}, '$.{field}')" for field, (name, _) in targets.items()
+    )
+    update = text(f"UPDATE {table} SET {assignments} WHERE rowid >= :lo AND rowid < :hi AND {column} IS NOT NULL")
+    copied = 0
+    if low is not None:
+        total = high - low + 1
+        for start in range(low, high + 1, batch_size):
+            with engine.begin() as conn:  # kısa transaction'lar: okuyucular ve WAL checkpoint beklemez
+                copied += conn.execute(update, {"lo": start, "hi": start + batch_size}).rowcount
+            if progress:
+                progress(min(start + batch_size - low, total), total)
+
+    with engine.begin() as conn:
+        indexes = dict(_table_sql(conn, "index", table))
+        if drop_source:
+            # Önce kaldır: JSON ifade indeksi aynı adı taşıyabilir (ix_products_price_amount
+            # ON json_extract(price, ...)); yoksa aşağıdaki indeks hiç oluşturulmaz
+            for name, sql in list(indexes.items()):
+                if _mentions(sql, column) and not name.startswith("sqlite_autoindex"):
+                    conn.exec_driver_sql(f"DROP INDEX {name}")
+                    del indexes[name]
+        for field in indexed:
+            name = targets[field][0]
+            index = f"ix_{table}_{name}"
+            if index in indexes:
+                # aynı adlı indeks başka bir ifadeyi indeksliyorsa sessizce atlanmaz
+                if _mentions(indexes[index], column) or not _mentions(indexes[index], name):
+                    raise ValueError(f"{index} zaten var ve {name} sütununu indekslemiyor: {indexes[index]}")
+                continue
+            conn.exec_driver_sql(f"CREATE INDEX {index} ON {table} ({name})")
+        if drop_source:
+            conn.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN {column}")
+    return copied
+
+
+if __name__ == "__main__":
+    import time
+
+    from sqlalchemy import insert, select, func
+    from sqlalchemy.orm import DeclarativeBase, Session
+
+    import multi_valueobject as multi
+    from valueobject_engine import create_tuned_engine
+
+    class Base(DeclarativeBase):
+        pass
+
+    # products tablosunun göç sonrası hali: aynı Money API'si, iki gerçek sütun
+    class Product(Base):
+        __tablename__ = "products"
+        id = Column(Integer, primary_key=True)
+        name = Column(String)
+        price = value_columns(multi.Money, "price", indexed=True)
+
+    print([str(c) for c in Product.__table__.columns])
+    assert not hasattr(multi.Money, "__composite_values__")  # kullanıcının sınıfına dokunulmaz
+
+    # multi_valueobject.py'nin JSON tablosunu doldur, yerinde göç ettir
+    engine = create_tuned_engine("sqlite://")
+    multi.Base.metadata.create_all(engine)
+    n = 100_000
+    with engine.begin() as conn:
+        conn.execute(insert(multi.Product.__table__), [
+            {"name": f"p-{i}", "price": multi.Money(i % 5000, ("TRY", "USD", "EUR")[i % 3])} for i in range(n)
+        ])
+        conn.execute(insert(multi.Product.__table__), [{"name": "fiyatsız", "price": None}])
+        # ValueType(Money, indexed=("amount",)) ile aynı adı taşıyan JSON ifade indeksi
+        conn.exec_driver_sql(
+            "CREATE INDEX ix_products_price_amount ON products (json_extract(price, '$.amount'))")
+
+    with Session(engine) as s:
+        start = time.perf_counter()
+        json_hits = s.query(multi.Product).filter(func.json_extract(multi.Product.price, "$.amount") > 4990).count()
+        json_ms = (time.perf_counter() - start) * 1000
+
+    copied = migrate_json_to_columns(engine, "products", "price", multi.Money, indexed=True, batch_size=25_000,
+                                     progress=lambda done, total: print(f"  {done}/{total}"))
+    print("kopyalanan satır:", copied)
+
+    with Session(engine) as s:
+        start = time.perf_counter()
+        column_hits = s.query(Product).filter(Product.price.amount > 4990).count()
+        column_ms = (time.perf_counter() - start) * 1000
+        print(f"amount > 4990: JSON {json_hits} satır {json_ms:.1f} ms, sütun {column_hits} satır {column_ms:.1f} ms")
+        assert json_hits == column_hits
+
+        p = s.scalars(select(Product).where(Product.price == multi.Money(42, "TRY"))).first()
+        print(p.name, p.price, type(p.price).__name__)
+        assert s.scalars(select(Product).where(Product.name == "fiyatsız")).one().price is None
+
+        p.price = multi.Money(p.price.amount, p.price.currency)  # eşit değer → UPDATE yok
+        assert not s.is_modified(p)
+        p.price = multi.Money(43, "USD")
+        s.commit()
+        print("sıralama:", [x.price for x in s.scalars(
+            select(Product).where(Product.price.currency == "USD").order_by(Product.price.amount.desc()).limit(2))])
+        print("toplam USD:", s.scalar(select(func.sum(Product.price.amount)).where(Product.price.currency == "USD")))
+        plan = [row[-1] for row in s.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM products WHERE price_amount > 4990"))]
+        print("Query plan:", plan)
+        assert any("ix_products_price_amount" in step for step in plan), plan
@@ -0,0 +1,293 @@
+"""
+Value object sorguları için isteğe bağlı (opt-in) ölçüm katmanı: SQLAlchemy engine event'leri.
+
+json_extract filtrelerinin (single_valueoject.py, multi_valueobject.py) ya da hybrid
+expression'ların (vealuobject_hybrid-property.py) indeks kullanıp kullanmadığını, ne kadar
+sürdüğünü ve satırların decode edilmesine ne kadar zaman gittiğini gösterir.
+
+    from valueobject_instrumentation import instrument
+    probe = instrument(engine, types=(ValueType,), slow_ms=50, large_table_rows=10_000)
+    ... sorgular ...
+    probe.snapshot()          # dict (dashboard'lar için)
+    probe.to_json()           # aynı veri JSON olarak
+    probe.full_scans()        # büyük tabloda SCAN yapan ifadeler
+    probe.remove()            # event'leri ve decode sarmalayıcılarını kaldır
+
+İfade (SQL metni) başına toplananlar:
+    count / total_ms / mean_ms / max_ms  → gecikme; histogram → kova başına çalıştırma sayısı
+    rows                                 → döndürülen satır sayısı (sqlite3 cursor.row_factory ile)
+    decode_ms                            → bu ifadenin satırlarında process_result_value süresi
+    plan / full_scans                    → slow_ms'i aşan SELECT'ler için EXPLAIN QUERY PLAN
+                                           ve tam tablo taraması yapılan büyük tablolar
+
+Not: decode süresi types ile verilen TypeDecorator sınıflarının process_result_value
+metodu sarılarak ölçülür. Sarmalayıcı sınıf başına bir kez kurulur ve kalır; yalnızca
+instrument() edilmiş engine'lerin dialect'iyle gelen çağrıları sayar, diğerleri için tek bir
+sözlük aramasıyla asıl metodu çağırır. remove() engine'in kaydını siler, sınıfa dokunmaz.
+SQLAlchemy sonuç işleyicilerini önbelleğe aldığı için sarmalayıcıdan önce oluşturulmuş
+işleyiciler ölçülmez: instrument() bu engine'in önbelleklerini temizlemeyi dener (bkz.
+_forget_cached_processors); en güvenlisi instrument()'ı ilk sorgudan önce çağırmaktır.
+"""
+import json
+import re
+import threading
+import time
+
+from sqlalchemy import event
+
+# Gecikme histogramı kova üst sınırları (ms); son kova ">1000"
+HISTOGRAM_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# "SCAN products" tam tablo taramasıdır; "SCAN products USING COVERING INDEX ..." değil
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+# Sınıf başına bir kez kurulan, kalıcı process_result_value sarmalayıcıları ve ölçülen
+# engine'ler (dialect → Instrumentation). Sarmalayıcı kayıtlı olmayan dialect'te tek bir
+# sözlük aramasıyla asıl metodu çağırır; remove() sadece kaydı siler, önbellekteki
+# işleyiciler geçerli kalır (SQLAlchemy'nin işleyici önbelleğine dokunmak gerekmez).
+_ORIGINALS = {}
+_ACTIVE = {}
+
+
+def _install_decode_wrapper(type_cls):
+    if type_cls in _ORIGINALS:
+        return
+    original = _ORIGINALS[type_cls] = type_cls.__dict__.get(
+        "process_result_value", type_cls.process_result_value)
+    active = _ACTIVE
+
+    def process_result_value(type_self, value, dialect):
+        probe = active.get(dialect)
+        if probe is None:  # ölçülmeyen engine
+            return original(type_self, value, dialect)
+        return probe._time_decode(original, type_self, value, dialect)
+
+    type_cls.process_result_value = process_result_value
+
+
+class StatementStats:
+    """Tek bir SQL metni için birikmiş ölçümler."""
+
+    __slots__ = ("sql", "count", "total_ms", "max_ms", "buckets", "rows", "decode_ms", "plan", "full_scans")
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.rows = 0
+        self.decode_ms = 0.0
+        self.plan = None
+        self.full_scans = []
+
+    def observe(self, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def count_row(self, row_factory):
+        """sqlite3 cursor.row_factory: her satırda çağrılır, satırı değiştirmeden döndürür."""
+        def factory(cursor, row):
+            self.rows += 1
+            return row if row_factory is None else row_factory(cursor, row)
+        return factory
+
+    def as_dict(self):
+        labels = [f"<={b}" for b in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}"]
+        return {
+            "sql": self.sql,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "histogram_ms": dict(zip(labels, self.buckets)),
+            "rows": self.rows,
+            "decode_ms": round(self.decode_ms, 3),
+            "plan": self.plan,
+            "full_scans": self.full_scans,
+        }
+
+
+class Instrumentation:
+    """
+    :param engine: ölçülecek Engine
+    :param types: decode süresi ölçülecek TypeDecorator sınıfları (örneğin (ValueType, ProfileType))
+    :param slow_ms: bu süreyi aşan SELECT'ler için EXPLAIN QUERY PLAN alınır (0 → hepsi)
+    :param large_table_rows: bu sayıdan fazla satırı olan tablolardaki SCAN işaretlenir
+    """
+
+    def __init__(self, engine, types=(), slow_ms=50.0, large_table_rows=10_000):
+        self.engine = engine
+        self.slow_ms = slow_ms
+        self.large_table_rows = large_table_rows
+        self.statements = {}
+        self.decode = {}        # tip etiketi → [çağrı, toplam ms]
+        self._table_rows = {}   # tablo → satır sayısı (tablo başına bir kez sayılır)
+        self._lock = threading.Lock()
+        self._local = threading.local()  # iş parçacığında son çalışan ifade (decode'u ona yaz)
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        if types:
+            for type_cls in types:
+                _install_decode_wrapper(type_cls)
+            _ACTIVE[engine.dialect] = self
+            self._forget_cached_processors()
+
+    # ---- engine event'leri ----
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            stats = self.statements.get(statement)
+            if stats is None:
+                stats = self.statements[statement] = StatementStats(statement)
+        if hasattr(cursor, "row_factory"):
+            cursor.row_factory = stats.count_row(cursor.row_factory)
+        self._local.current = stats
+        conn.info.setdefault("vo_query_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["vo_query_start"].pop()) * 1e3
+        stats = self.statements.get(statement)
+        if stats is None:  # before/after arasında reset() çağrıldı
+            return
+        with self._lock:
+            stats.observe(elapsed_ms)
+        if (elapsed_ms >= self.slow_ms and stats.plan is None and not executemany
+                and statement.lstrip().upper().startswith("SELECT")):
+            self._explain(cursor, stats, parameters)
+
+    def _explain(self, cursor, stats, parameters):
+        # Aynı DB-API bağlantısında ayrı bir cursor; asıl cursor'un sonuçlarına dokunmaz
+        dbapi_conn = cursor.connection
+        plan = [row[-1] for row in dbapi_conn.execute(f"EXPLAIN QUERY PLAN {stats.sql}", parameters)]
+        scans = []
+        for step in plan:
+            match = _FULL_SCAN.match(step)
+            if match and self._row_count(dbapi_conn, match.group(1)) > self.large_table_rows:
+                scans.append(match.group(1))
+        stats.plan, stats.full_scans = plan, scans
+
+    def _row_count(self, dbapi_conn, table):
+        count = self._table_rows.get(table)
+        if count is None:
+            count = self._table_rows[table] = dbapi_conn.execute(f'SELECT count(*) FROM "{table}"').fetchone()[0]
+        return count
+
+    # ---- decode süresi ----
+    def _time_decode(self, original, type_self, value, dialect):
+        t0 = time.perf_counter()
+        result = original(type_self, value, dialect)
+        elapsed_ms = (time.perf_counter() - t0) * 1e3
+        vo_cls = getattr(type_self, "cls", None)
+        label = f"{type(type_self).__name__}({vo_cls.__name__})" if vo_cls else type(type_self).__name__
+        with self._lock:
+            totals = self.decode.setdefault(label, [0, 0.0])
+            totals[0] += 1
+            totals[1] += elapsed_ms
+            current = getattr(self._local, "current", None)
+            if current is not None:
+                current.decode_ms += elapsed_ms
+        return result
+
+    def _forget_cached_processors(self):
+        # Sarmalayıcıdan önce oluşturulmuş işleyiciler asıl metodu bağlamıştır. Derlenmiş
+        # ifade önbelleği açık API ile temizlenir; dialect'in tip önbelleği (_type_memos) özel
+        # bir alandır: yoksa atlanır, o zaman instrument() ilk sorgudan önce çağrılmalıdır.
+        self.engine.clear_compiled_cache()
+        memos = getattr(self.engine.dialect, "_type_memos", None)
+        if memos is not None:
+            memos.clear()
+
+    # ---- dışa aktarma ----
+    def snapshot(self):
+        with self._lock:
+            statements = [s.as_dict() for s in self.statements.values()]
+            decode = {k: {"calls": n, "total_ms": round(ms, 3)} for k, (n, ms) in self.decode.items()}
+        statements.sort(key=lambda s: s["total_ms"], reverse=True)
+        return {
+            "slow_ms": self.slow_ms,
+            "large_table_rows": self.large_table_rows,
+            "statements": statements,
+            "decode": decode,
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.snapshot(), ensure_ascii=False, **kwargs)
+
+    def full_scans(self):
+        """Büyük tabloda tam tarama yapan ifadeler: [(sql, [tablo, ...]), ...]."""
+        return [(s.sql, s.full_scans) for s in self.statements.values() if s.full_scans]
+
+    def reset(self):
+        with self._lock:
+            self.statements.clear()
+            self.decode.clear()
+            self._table_rows.clear()
+
+    def remove(self):
+        event.remove(self.engine, "before_cursor_execute", self._before)
+        event.remove(self.engine, "after_cursor_execute", self._after)
+        if _ACTIVE.get(self.engine.dialect) is self:
+            del _ACTIVE[self.engine.dialect]  # sarmalayıcı bu engine için de asıl metoda geçer
+
+
+def instrument(engine, types=(), slow_ms=50.0, large_table_rows=10_000):
+    """Engine'e ölçüm katmanını bağlar ve Instrumentation nesnesini döndürür."""
+    return Instrumentation(engine, types, slow_ms=slow_ms, large_table_rows=large_table_rows)
+
+
+if __name__ == "__main__":
+    from bench_persistence import load_script
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+    from valueobject_engine import create_tuned_engine
+
+    multi = __import__("multi_valueobject")
+    hybrid = load_script("vealuobject_hybrid-property.py")
+
+    for module, amount_filter in (
+        (multi, text("json_extract(price, '$.amount') > 900")),
+        (hybrid, hybrid.Product.price_amount > 900),
+    ):
+        engine = create_tuned_engine("sqlite://")
+        module.Base.metadata.create_all(engine)
+        with Session(engine) as s:
+            s.add_all([module.Product(name=f"p-{i}", price=module.Money(i % 1000, "TRY")) for i in range(2000)])
+            s.commit()
+
+        other = create_tuned_engine("sqlite://")  # ölçülmeyen engine: decode'u sayılmamalı
+        module.Base.metadata.create_all(other)
+        with Session(other) as s:
+            s.add(module.Product(name="başka", price=module.Money(1, "USD")))
+            s.commit()
+            s.query(module.Product).all()  # işleyiciler instrument()'tan önce önbelleğe alınır
+
+        with Session(engine) as s:
+            s.query(module.Product).filter(amount_filter).all()  # instrument()'tan önce önbellekte
+        probe = instrument(engine, types=(module.ValueType,), slow_ms=0, large_table_rows=1000)
+        with Session(engine) as s:
+            s.query(module.Product).filter(amount_filter).all()
+        snap = probe.snapshot()
+        assert sum(d["calls"] for d in snap["decode"].values()) > 0  # önbellek temizlendi
+        with Session(other) as s:
+            s.query(module.Product).all()
+        assert probe.snapshot()["decode"] == snap["decode"]
+        probe.remove()
+        with Session(engine) as s:
+            s.query(module.Product).filter(amount_filter).all()
+        assert probe.snapshot()["decode"] == snap["decode"]
+        engine.dispose()
+        other.dispose()
+
+        select_stats = next(st for st in snap["statements"] if st["sql"].lstrip().startswith("SELECT"))
+        print(f"{module.__name__}: {select_stats['rows']} satır, {select_stats['mean_ms']} ms, "
+              f"decode {select_stats['decode_ms']} ms")
+        print("  plan:", select_stats["plan"], "→ tam tarama:", select_stats["full_scans"] or "yok")
+    print(json.dumps(snap["decode"], ensure_ascii=False))
@@ -0,0 +1,148 @@
+"""
+Değişmez (immutable) value object'ler için flyweight / interning havuzu.
+
+Katalogda milyonlarca fiyat var ama farklı (amount, currency) çifti birkaç bin tane.
+Her oluşturma ve her DB satırı yeni bir nesne ayırıyor. Interned taban sınıfından
+türeyen sınıflarda eşit değerler AYNI nesneyi döndürür:
+
+    @dataclass(frozen=True)
+    class Money(Interned, intern_size=4096):
+        amount: float
+        currency: str
+
+    Money(100, "USD") is Money(100, "USD")   # True
+    intern_stats(Money)                      # {'hits': 1, 'misses': 1, 'live': 1, ...}
+
+Havuz iki katmanlıdır:
+- WeakValueDictionary: hâlâ kullanılan tüm nesneler (kimse tutmayınca kendiliğinden silinir)
+- intern_size uzunluğunda bir halka (deque): en son üretilen nesneleri güçlü referansla
+  canlı tutar; böylece sık gelen değerler arada referans kalmasa bile havuzda kalır.
+
+ValueType (trusted=True) okurken de aynı havuzu kullanır (bkz. valueobject_codec).
+
+Anahtar alan değerleri ve tipleridir (typed_key): Python eşitliğine göre 100 == 100.0 == True
+olsa da Money(100, "USD") ile Money(100.0, "USD") farklı nesnelerdir; aksi halde havuzdan dönen
+nesnenin alan tipi (ve JSON çıktısı, repr'i) ilk oluşturan çağrıya bağlı olurdu.
+Sadece değişmez sınıflarla kullanın: paylaşılan bir nesneyi değiştirmek herkesi etkiler.
+"""
+import weakref
+from collections import deque
+
+from valueobject_codec import get_codec
+
+DEFAULT_INTERN_SIZE = 1024
+
+
+def typed_key(values):
+    """Havuz anahtarı: (100, "USD") → (100, "USD", int, str); 100 ile 100.0 ayrı anahtarlardır."""
+    return values + tuple(map(type, values))
+
+
+class InternPool:
+    """Tek bir sınıfın interning havuzu: anahtar (typed_key(alan değerleri)) → nesne."""
+
+    def __init__(self, maxsize=DEFAULT_INTERN_SIZE):
+        self.maxsize = maxsize
+        self._live = weakref.WeakValueDictionary()
+        self._pinned = deque(maxlen=maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Havuzdaki nesne veya None. Hashlenemeyen anahtarlar (örneğin list) hiç interne edilmez."""
+        try:
+            obj = self._live.get(key)
+        except TypeError:
+            return None
+        if obj is not None:
+            self.hits += 1
+        return obj
+
+    def add(self, key, obj):
+        """Nesneyi havuza ekler; aynı anahtarla zaten bir nesne varsa onu döndürür."""
+        try:
+            existing = self._live.setdefault(key, obj)
+        except TypeError:
+            return obj
+        if existing is obj:
+            self.misses += 1
+            self._pinned.append(obj)
+        else:
+            self.hits += 1
+        return existing
+
+    def wrap(self, build, key):
+        """
+        build(data) fonksiyonunu havuz üzerinden çalışacak şekilde sarar (ValueType okuma yolu).
+        key(data) alan değerlerinin tuple'ını döndürür; tipler burada eklenir.
+        """
+        get, add = self.get, self.add
+
+        def load(data):
+            k = typed_key(key(data))
+            obj = get(k)
+            return obj if obj is not None else add(k, build(data))
+        return load
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "live": len(self._live),      # şu an bellekte tekil kaç nesne var
+            "pinned": len(self._pinned),  # halkada güçlü referansla tutulanlar
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        self._live.clear()
+        self._pinned.clear()
+        self.hits = self.misses = 0
+
+
+class InternedMeta(type):
+    """Sınıf çağrısını (Money(...)) havuzdan geçirir; isabet olursa __init__ hiç çalışmaz."""
+
+    def __call__(cls, *args, **kwargs):
+        pool = cls.__intern_pool__
+        fields = get_codec(cls).fields
+        key = None
+        if not kwargs:
+            if len(args) == len(fields):
+                key = typed_key(args)
+        elif len(args) + len(kwargs) == len(fields):
+            try:
+                key = typed_key(args + tuple([kwargs[f] for f in fields[len(args):]]))
+            except KeyError:
+                key = None
+
+        if key is not None:
+            obj = pool.get(key)
+            if obj is not None:
+                return obj
+            return pool.add(key, super().__call__(*args, **kwargs))
+
+        # Varsayılan değerli / karışık çağrı: önce oluştur, sonra alanlardan anahtar çıkar
+        obj = super().__call__(*args, **kwargs)
+        return pool.add(typed_key(get_codec(cls).to_tuple(obj)), obj)
+
+
+class Interned(metaclass=InternedMeta):
+    """
+    Opt-in interning taban sınıfı. Her alt sınıf kendi havuzunu alır:
+        class Money(Interned, intern_size=4096): ...
+    """
+    __slots__ = ()
+
+    def __init_subclass__(cls, intern_size=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if intern_size is None:
+            intern_size = getattr(cls, "__intern_pool__", None)
+            intern_size = intern_size.maxsize if intern_size is not None else DEFAULT_INTERN_SIZE
+        cls.__intern_pool__ = InternPool(intern_size)
+
+
+def intern_stats(cls):
+    """Sınıfın havuz istatistikleri: hits, misses, hit_rate, live, pinned, maxsize."""
+    return cls.__intern_pool__.stats()
@@ -0,0 +1,200 @@
+"""
+Değişmez value object'ler için önceden hesaplanmış hash ve sıralama anahtarı.
+
+Money / Date / Time / Location büyük dict ve set'lerde anahtar olarak kullanılıyor ve
+sıralanıyor. dataclass'ın ürettiği __hash__ her çağrıda alanlardan yeni bir tuple kurup
+hashliyor; Date ve Time'ın ise hiç sıralaması yok (Date(1, 2, 2024) < Date(3, 4, 2024) → TypeError).
+@keyed hash'i ve sıralama anahtarını nesne oluşturulurken BİR KEZ hesaplayıp nesnede saklar:
+
+    @dataclass(frozen=True)
+    @keyed(sort_key=lambda day, month, year: date(year, month, day).toordinal())
+    class Date:
+        day: int
+        month: int
+        year: int
+
+    d.sort_key                                   # 738886 — düz int
+    sorted(dates, key=by_sort_key)               # int karşılaştırması, Python seviyesinde __lt__ yok
+    sorted(dates), d1 < d2, max(dates)           # __lt__ / __le__ / ... da sort_key üzerinden
+    bisect_left(dates, d.sort_key, key=by_sort_key)
+    key_range(dates, Date(1, 1, 2024), Date(31, 1, 2024))   # sıralı listede aralık (bisect ile)
+
+sort_key verilmezse sadece hash önbelleğe alınır. Anahtar fonksiyonunun parametre adları
+alan adlarıdır (valueobject_validation.Rule ile aynı); eşit nesneler eşit anahtar üretmeli.
+
+@validated gibi __post_init__ ekler: @dataclass / @value_object'in altına yazılır. İkisi
+birlikte kullanılıyorsa @keyed sınıfa en yakın olanıdır; anahtar doğrulamadan sonra hesaplanır.
+__init__'i atlayan yollar da önbelleği doldurur: codec'in trusted decode'u __keyed_fill__'i
+çağırır, pickle'dan dönen nesnede yeniden hesaplanır (hash süreçten sürece değişebildiği
+için pickle'a yazılmaz). __getattr__ ile tembel doldurma kullanılmaz: sınıfta __getattr__
+tanımlı olması HER attribute erişimini yavaşlatır.
+"""
+import inspect
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+from valueobject_codec import _compile, class_annotations
+
+_CACHED = ("_hash", "sort_key")
+
+by_sort_key = attrgetter("sort_key")
+
+
+def keyed(sort_key=None):
+    """
+    Sınıf dekoratörü: hash'i ve (verilirse) sort_key'i oluşturma anında hesaplayıp saklar,
+    sort_key varsa karşılaştırma operatörlerini ekler.
+    """
+    def decorate(cls):
+        fields = tuple(class_annotations(cls))
+        values = "".join(f"self.{f}, " for f in fields)
+        ns = {"_set": object.__setattr__, "_key": sort_key}
+        fill = ["def _fill(self):", f"    _set(self, '_hash', hash(({values})))"]
+        if sort_key is not None:
+            params = tuple(inspect.signature(sort_key).parameters)
+            unknown = set(params) - set(fields)
+            if unknown:
+                raise TypeError(f"{cls.__name__}: sort_key bilinmeyen alan kullanıyor: {sorted(unknown)}")
+            fill.append(f"    _set(self, 'sort_key', _key({', '.join(f'self.{p}' for p in params)}))")
+        fill_fn = ns["_fill"] = _compile("_fill", fill, ns)
+
+        original = getattr(cls, "__post_init__", None)  # kalıtılan da çağrılır
+        if original is not None:
+            ns["_original"] = original
+            cls.__post_init__ = _compile("__post_init__", [
+                "def __post_init__(self):", "    _original(self)", "    _fill(self)",
+            ], ns)
+        else:
+            cls.__post_init__ = fill_fn
+
+        def __hash__(self):
+            return self._hash
+
+        cls.__hash__ = __hash__
+        cls.__keyed_fill__ = fill_fn  # valueobject_codec trusted yolu çağırır
+        cls.__extra_slots__ = _CACHED  # @value_object bunları slot olarak ekler
+
+        # dataclass (__dict__'li) nesnelerin pickle/copy yolu; @value_object kendi __reduce__'unu
+        # kullanır (cls(*alanlar) → __post_init__)
+        def __getstate__(self):
+            return {k: v for k, v in self.__dict__.items() if k not in _CACHED}
+
+        def __setstate__(self, state):
+            self.__dict__.update(state)
+            fill_fn(self)
+
+        cls.__getstate__ = __getstate__
+        cls.__setstate__ = __setstate__
+
+        if sort_key is not None:
+            add_ordering(cls)
+        return cls
+    return decorate
+
+
+def add_ordering(cls):
+    """
+    sort_key üzerinden __lt__ / __le__ / __gt__ / __ge__ ekler (aynı sınıftan nesneler arasında).
+    @keyed kullanır; sort_key'i kendisi tutan sınıflar (valueobject_temporal) doğrudan çağırır.
+    """
+    for op, symbol in (("lt", "<"), ("le", "<="), ("gt", ">"), ("ge", ">=")):
+        setattr(cls, f"__{op}__", _compile(f"__{op}__", [
+            f"def __{op}__(self, other):",
+            "    if other.__class__ is self.__class__:",
+            f"        return self.sort_key {symbol} other.sort_key",
+            "    return NotImplemented",
+        ], {}))
+    return cls
+
+
+def key_range(items, low, high, key=by_sort_key):
+    """
+    sort_key'e göre sıralı listede low <= x <= high olan dilim (iki bisect).
+    low/high value object veya doğrudan anahtar (int, tuple) olabilir.
+    """
+    lo = key(low) if hasattr(low, "sort_key") else low
+    hi = key(high) if hasattr(high, "sort_key") else high
+    return items[bisect_left(items, lo, key=key):bisect_right(items, hi, key=key)]
+
+
+if __name__ == "__main__":
+    import pickle
+    import random
+    import time
+    from dataclasses import dataclass
+    from datetime import date
+
+    from valueobject_base import value_object
+    from valueobject_codec import get_codec
+
+    @dataclass(frozen=True)
+    class PlainDate:
+        day: int
+        month: int
+        year: int
+
+    @dataclass(frozen=True)
+    @keyed(sort_key=lambda day, month, year: date(year, month, day).toordinal())
+    class Date:
+        day: int
+        month: int
+        year: int
+
+    @value_object
+    @keyed(sort_key=lambda hours, minutes, seconds: hours * 3600 + minutes * 60 + seconds)
+    class Time:
+        hours: int
+        minutes: int
+        seconds: int
+
+    rng = random.Random(7)
+    raw = [(rng.randint(1, 28), rng.randint(1, 12), rng.randint(1990, 2030)) for _ in range(300_000)]
+    plain = [PlainDate(*r) for r in raw]
+    dates = [Date(*r) for r in raw]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:38} {(time.perf_counter() - start) * 1000:7.1f} ms")
+        return result
+
+    timed("set(PlainDate)  — tuple hash", lambda: set(plain))
+    timed("set(Date)       — önbellekli hash", lambda: set(dates))
+    timed("sorted(PlainDate, key=(y, m, d))", lambda: sorted(plain, key=lambda d: (d.year, d.month, d.day)))
+    ordered = timed("sorted(Date, key=by_sort_key)", lambda: sorted(dates, key=by_sort_key))
+    assert [d.sort_key for d in ordered] == sorted(d.sort_key for d in dates)
+    january = key_range(ordered, Date(1, 1, 2024), Date(31, 1, 2024))
+    print("Ocak 2024:", len(january), "kayıt")
+    assert all(d.year == 2024 and d.month == 1 for d in january)
+
+    assert Date(1, 2, 2024) < Date(3, 4, 2024) and max(dates) == ordered[-1]
+    assert Time(9, 30, 0) < Time(17, 45, 0) and Time(9, 30, 0).sort_key == 34200
+    assert hash(Date(1, 2, 2024)) == hash((1, 2, 2024)) == hash(PlainDate(1, 2, 2024))
+
+    copy = pickle.loads(pickle.dumps(Date(5, 6, 2024)))
+    assert copy.sort_key == Date(5, 6, 2024).sort_key and hash(copy) == hash(Date(5, 6, 2024))
+    assert pickle.loads(pickle.dumps(Time(1, 2, 3))) == Time(1, 2, 3)
+    loaded = get_codec(Time).decode_trusted('{"hours": 8, "minutes": 0, "seconds": 5}')
+    assert loaded.sort_key == 28805 and hash(loaded) == hash(Time(8, 0, 5))  # __init__'siz yol
+    print("pickle / trusted decode: önbellek dolduruldu")
+
+    @dataclass(frozen=True)
+    class Checked:
+        value: int
+
+        def __post_init__(self):
+            if self.value < 0:
+                raise ValueError("negatif olamaz")
+
+    @dataclass(frozen=True)
+    @keyed(sort_key=lambda value: value)
+    class Score(Checked):  # taban sınıfın __post_init__'i kaybolmamalı
+        pass
+
+    assert Score(3) < Score(5)
+    try:
+        Score(-1)
+    except ValueError as e:
+        print("Hata:", e)
+    else:
+        raise AssertionError("kalıtılan __post_init__ çalışmadı")
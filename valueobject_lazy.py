@@ -0,0 +1,114 @@
+"""
+ValueType sütunları için tembel (lazy) decode: ValueType(Money, lazy=True).
+
+process_result_value her satırda JSON'u çözüp nesneyi kuruyor; sadece p.name okunan
+liste sorgularında (multi_valueobject.py'deki döngüler gibi) bu iş boşa gider. Lazy modda
+sütun ham değeri (JSON metni / msgpack bytes) tutan hafif bir LazyValue döndürür:
+
+    p = session.query(Product).first()
+    type(p.price)            # LazyValue — henüz decode edilmedi
+    p.price.amount           # ilk attribute erişiminde decode edilir, sonuç önbelleğe alınır
+    isinstance(p.price, Money), p.price == Money(15000, "TRY"), hash(p.price)   # şeffaf
+
+Yeniden yazarken (örneğin satırı başka bir tabloya kopyalarken) aynı serializer ve aynı
+sınıf için ham değer olduğu gibi geri verilir: encode yapılmaz. Value object'ler değişmez
+olduğundan (bkz. valueobject_base) decode edilmiş bir proxy'nin ham değeri de hâlâ geçerlidir.
+"""
+
+
+class LazyValue:
+    """
+    Ham sütun değerini tutan, ilk erişimde decode eden vekil nesne.
+    Doğrudan değil lazy_factory(...) ile üretilir: satır başına maliyet bir nesne + iki slot
+    yazımı (decode'un yaklaşık beşte biri).
+    """
+
+    __slots__ = ("_raw", "_src", "_value")  # _src = (load, codec, serializer), sütun başına ortak
+
+    def resolve(self):
+        """Decode edilmiş nesne (ilk çağrıda decode edilir)."""
+        try:
+            return _get_value(self)
+        except AttributeError:  # slot henüz boş → decode edilmedi
+            value = self._src[0](self._raw)
+            _set_value(self, value)
+            return value
+
+    @property
+    def decoded(self):
+        try:
+            _get_value(self)
+        except AttributeError:
+            return False
+        return True
+
+    def raw_for(self, codec, serializer):
+        """Aynı sınıf ve serializer ile yazılıyorsa ham değer, değilse None (encode gerekir)."""
+        _, src_codec, src_serializer = self._src
+        if codec is src_codec and serializer is src_serializer:
+            return self._raw
+        return None
+
+    # ---- şeffaflık ----
+    @property
+    def __class__(self):
+        return self._src[1].cls  # isinstance(p.price, Money) → True
+
+    def __getattr__(self, name):
+        if name[:2] == "__" == name[-2:]:
+            # hasattr(value, "__clause_element__") gibi protokol yoklamaları decode tetiklemesin
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)  # frozen sınıflarda FrozenInstanceError
+
+    def __delattr__(self, name):
+        delattr(self.resolve(), name)
+
+    def __eq__(self, other):
+        if type(other) is LazyValue:
+            if other._src is self._src and other._raw == self._raw:
+                return True  # aynı sütun tipi, aynı ham değer → decode etmeden eşit
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.resolve())
+
+    def __bool__(self):
+        return bool(self.resolve())
+
+    def __repr__(self):
+        return repr(self.resolve())
+
+    def __str__(self):
+        return str(self.resolve())
+
+    def __reduce_ex__(self, protocol):
+        return self.resolve().__reduce_ex__(protocol)  # pickle/copy gerçek nesneyi taşır
+
+
+_get_value = LazyValue._value.__get__
+_set_value = LazyValue._value.__set__
+
+
+def lazy_factory(load, codec, serializer):
+    """ham değer → LazyValue fonksiyonu (Serializer.lazy_loader üzerinden, önbellekli)."""
+    src = (load, codec, serializer)
+    new, set_raw, set_src = object.__new__, LazyValue._raw.__set__, LazyValue._src.__set__
+
+    def make(raw):
+        obj = new(LazyValue)
+        set_raw(obj, raw)
+        set_src(obj, src)
+        return obj
+    return make
+
+
+def unwrap(value):
+    """LazyValue ise decode edilmiş nesne, değilse değerin kendisi."""
+    return value.resolve() if type(value) is LazyValue else value
@@ -0,0 +1,490 @@
+"""
+Value object tabloları (products, places, users) için akışlı, çok süreçli dışa/içe aktarma.
+
+ORM ile satır satır (nesne kur → JSON encode → INSERT) taşımak yerine:
+- okuma: ham sütun değerleri (value object sütunlarında JSON metni) yield_per ile parti parti,
+- dönüştürme: partiler bir süreç havuzunda (ProcessPoolExecutor) NDJSON/CSV metnine veya
+  INSERT parametrelerine çevrilir; sıralı ve sınırlı sayıda parti bellekte tutulur,
+- yazma: tek bir bağlantı, executemany ile büyük transaction'lar (commit_every satırda bir).
+
+    python valueobject_pipeline.py export sqlite:///multi_ValueObject.db products products.ndjson
+    python valueobject_pipeline.py export sqlite:///example.db users users.csv --layout flat
+    python valueobject_pipeline.py import sqlite:///copy.db products products.ndjson --workers 8
+    python valueobject_pipeline.py demo
+
+    stats = export_table(engine, Product.__table__, "products.ndjson", progress=print)
+    stats = import_table(engine, Product.__table__, "products.csv", layout="flat")
+    stats.as_dict()   # {"rows": ..., "rows_per_s": ..., "bytes": ..., "batches": ..., ...}
+
+Value object sütunları iki düzende yazılır/okunur:
+    nested → {"id": 1, "price": {"amount": 15000, "currency": "TRY"}}   (CSV'de hücrede JSON metni)
+    flat   → {"id": 1, "price.amount": 15000, "price.currency": "TRY"}  (CSV'de ayrı sütunlar)
+Nested NDJSON dışa aktarmada sütundaki JSON metni çözülmeden satıra gömülür. İçe aktarmada
+value object'ler codec'in ürettiği JSON metniyle birebir aynı biçimde yazılır; ifade
+indeksleri, R*Tree ve FTS tetikleyicileri normal INSERT'teki gibi çalışır.
+CSV'de boş hücre None demektir; tipler sütun tipinden / value object anotasyonlarından gelir
+(float alanlarda tam sayı yazılmış hücre int kalır: 15000 → 15000, 15000.0 → 15000.0).
+Value object sütunları JSON metni olarak saklanmalıdır (msgpack/struct BLOB desteklenmez).
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import Column, MetaData, String, Table, TypeDecorator, insert, select, type_coerce
+
+from valueobject_serializers import serializer_for
+
+FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".json": "ndjson", ".csv": "csv"}
+LAYOUTS = ("nested", "flat")
+
+
+# ================== TABLO TANIMI ==================
+def _to_bool(value):
+    return value.lower() in ("1", "true", "t", "yes") if isinstance(value, str) else bool(value)
+
+
+def _to_number(value):
+    # "15000" → 15000 (int), "15000.0" → 15000.0: value object JSON'u codec.encode ile aynı kalır
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+_CONVERTERS = {"int": int, "float": _to_number, "decimal": Decimal, "bool": _to_bool, "str": str}
+_TYPE_NAMES = {int: "int", float: "float", Decimal: "decimal", bool: "bool", str: "str",
+               "int": "int", "float": "float", "Decimal": "decimal", "bool": "bool", "str": "str"}
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """Süreçlere gönderilen (pickle edilebilir) tablo özeti."""
+    columns: tuple          # sütun adları, tablo sırasıyla
+    types: tuple            # sütun başına dönüştürücü adı (CSV için) veya None
+    values: tuple           # ((sütun, (alan, ...), (tip adı, ...)), ...) value object sütunları
+
+    def value_map(self):
+        return {col: (fields, types) for col, fields, types in self.values}
+
+    def header(self, layout):
+        """CSV başlığı / flat NDJSON anahtarları."""
+        if layout == "nested":
+            return list(self.columns)
+        values, names = self.value_map(), []
+        for col in self.columns:
+            names.extend(f"{col}.{f}" for f in values[col][0]) if col in values else names.append(col)
+        return names
+
+
+def _python_type_name(sa_type):
+    try:
+        return _TYPE_NAMES.get(sa_type.python_type)
+    except NotImplementedError:
+        return None
+
+
+def _storage_type(col):
+    """Dosyada yazılan ham değerin tipi: value object → JSON metni, diğer TypeDecorator'lar
+    (PackedDateType gibi) → sakladıkları tip (INTEGER), diğerleri → sütun tipi."""
+    if getattr(col.type, "codec", None) is not None:
+        return String()
+    if isinstance(col.type, TypeDecorator):
+        return col.type.impl_instance
+    return col.type
+
+
+def table_spec(table):
+    """Tablodan TableSpec: value object sütunları tipinde `codec` olan sütunlardır (ValueType, ProfileType)."""
+    types, values = [], []
+    for col in table.columns:
+        codec = getattr(col.type, "codec", None)
+        if codec is None:
+            types.append(_python_type_name(_storage_type(col)))
+        else:
+            types.append(None)
+            values.append((col.name, codec.fields, tuple(_TYPE_NAMES.get(codec.types[f]) for f in codec.fields)))
+    return TableSpec(tuple(c.name for c in table.columns), tuple(types), tuple(values))
+
+
+def _check_text_storage(table, dialect):
+    for col in table.columns:
+        if getattr(col.type, "codec", None) is not None:
+            if serializer_for(getattr(col.type, "_serializer", None), dialect).binary:
+                raise ValueError(f"{table.name}.{col.name} ikili (BLOB) serializer kullanıyor; JSON metni gerekli")
+
+
+def _raw_columns(table):
+    """Value object / TypeDecorator sütunları decode edilmeden: ham JSON metni, ham int ..."""
+    return [
+        type_coerce(col, _storage_type(col)).label(col.name) if _storage_type(col) is not col.type else col
+        for col in table.columns
+    ]
+
+
+def _raw_table(table):
+    """INSERT için sütunları saklama tipinde olan kopya (parametreler zaten kodlanmış)."""
+    return Table(table.name, MetaData(), *[Column(col.name, _storage_type(col)) for col in table.columns])
+
+
+# ================== SÜREÇ HAVUZU ==================
+class _InlineExecutor:
+    """workers=0: aynı süreçte çalıştır (küçük dosyalar, hata ayıklama)."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _executor(workers):
+    if workers == 0:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+
+
+def _ordered_map(pool, fn, items, inflight):
+    """pool.map gibi ama girdiyi tembel tüketir: en fazla `inflight` parti bellekte/işlemde."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= inflight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class PipelineStats:
+    """İlerleme ve verim sayaçları; progress callback'ine her partiden sonra verilir."""
+
+    def __init__(self, direction, table):
+        self.direction = direction
+        self.table = table
+        self.rows = 0
+        self.batches = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add(self, rows, nbytes=0):
+        self.rows += rows
+        self.batches += 1
+        self.bytes += nbytes
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def rows_per_s(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            "direction": self.direction,
+            "table": self.table,
+            "rows": self.rows,
+            "batches": self.batches,
+            "bytes": self.bytes,
+            "elapsed_s": round(self.elapsed, 3),
+            "rows_per_s": round(self.rows_per_s, 1),
+        }
+
+    def __str__(self):
+        return (f"{self.direction} {self.table}: {self.rows} satır, {self.batches} parti, "
+                f"{self.bytes / 1e6:.1f} MB, {self.rows_per_s:,.0f} satır/s")
+
+
+# ================== İŞÇİ FONKSİYONLARI ==================
+def _export_chunk(spec, fmt, layout, rows):
+    """Ham satırlar → NDJSON/CSV metni. (satır sayısı, metin) döndürür."""
+    values = spec.value_map()
+    out = io.StringIO()
+    if fmt == "ndjson" and layout == "nested":
+        # JSON metni çözülmeden gömülür; sadece skaler sütunlar encode edilir
+        keys = [json.dumps(c) + ": " for c in spec.columns]
+        is_value = [c in values for c in spec.columns]
+        dumps = json.dumps
+        for row in rows:
+            parts = [k + ((v if v is not None else "null") if vo else dumps(v, ensure_ascii=False))
+                     for k, v, vo in zip(keys, row, is_value)]
+            out.write("{" + ", ".join(parts) + "}\n")
+        return len(rows), out.getvalue()
+
+    flat = layout == "flat"
+    records = []
+    for row in rows:
+        record = []
+        for col, value in zip(spec.columns, row):
+            if col not in values:
+                record.append(value)
+            elif flat:
+                data = json.loads(value) if value is not None else {}
+                record.extend(data.get(f) for f in values[col][0])
+            else:
+                record.append(value if fmt == "csv" else (json.loads(value) if value is not None else None))
+        records.append(record)
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerows([["" if v is None else v for v in r] for r in records])
+    else:
+        header = spec.header(layout)
+        for record in records:
+            out.write(json.dumps(dict(zip(header, record)), ensure_ascii=False) + "\n")
+    return len(rows), out.getvalue()
+
+
+def _encode_value(fields, data):
+    """Alan sözlüğü → codec.encode ile aynı JSON metni (alan sırası, ensure_ascii)."""
+    if data is None or all(data.get(f) is None for f in fields):
+        return None
+    return json.dumps({f: data.get(f) for f in fields})
+
+
+def _import_chunk(spec, fmt, layout, payload):
+    """NDJSON satırları / CSV kayıtları → INSERT parametreleri (value object'ler JSON metni)."""
+    values = spec.value_map()
+    params = []
+    if fmt == "ndjson":
+        for line in payload:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            row = {}
+            for col in spec.columns:
+                if col not in values:
+                    if col in obj:
+                        row[col] = obj[col]
+                    continue
+                fields = values[col][0]
+                if layout == "flat":
+                    row[col] = _encode_value(fields, {f: obj.get(f"{col}.{f}") for f in fields})
+                else:
+                    row[col] = _encode_value(fields, obj.get(col))
+            params.append(row)
+        return params
+
+    header, records = payload
+    index = {name: i for i, name in enumerate(header)}
+    converters = dict(zip(spec.columns, spec.types))
+
+    def cell(record, name, type_name):
+        i = index.get(name)
+        if i is None or record[i] == "":
+            return None
+        conv = _CONVERTERS.get(type_name)
+        return conv(record[i]) if conv else record[i]
+
+    for record in records:
+        row = {}
+        for col in spec.columns:
+            if col not in values:
+                if col in index:
+                    row[col] = cell(record, col, converters[col])
+                continue
+            fields, types = values[col]
+            if layout == "flat":
+                row[col] = _encode_value(fields, {f: cell(record, f"{col}.{f}", t) for f, t in zip(fields, types)})
+            else:
+                raw = cell(record, col, None)
+                row[col] = _encode_value(fields, json.loads(raw)) if raw is not None else None
+        params.append(row)
+    return params
+
+
+# ================== GİRİŞ NOKTALARI ==================
+def _format_for(path):
+    try:
+        return FORMATS[Path(path).suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Dosya uzantısından format anlaşılamadı: {path} (.ndjson/.jsonl/.csv)") from None
+
+
+def export_table(engine, table, path, layout="nested", fmt=None, batch_size=10_000, workers=None, progress=None):
+    """Tabloyu NDJSON/CSV dosyasına akış halinde yazar; PipelineStats döndürür."""
+    fmt = fmt or _format_for(path)
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout {LAYOUTS} olmalı")
+    _check_text_storage(table, engine.dialect)
+    spec = table_spec(table)
+    stats = PipelineStats("export", table.name)
+    convert = partial(_export_chunk, spec, fmt, layout)
+    with engine.connect() as conn, open(path, "w", encoding="utf-8", newline="") as f, _executor(workers) as pool:
+        if fmt == "csv":
+            csv.writer(f).writerow(spec.header(layout))
+        result = conn.execution_options(yield_per=batch_size).execute(select(*_raw_columns(table)))
+        batches = ([tuple(r) for r in part] for part in result.partitions())
+        written = f.tell()
+        for rows, chunk in _ordered_map(pool, convert, batches, inflight=2 * (workers or os.cpu_count() or 1)):
+            f.write(chunk)
+            position = f.tell()
+            stats.add(rows, position - written)
+            written = position
+            if progress:
+                progress(stats)
+    return stats
+
+
+def _read_batches(path, fmt, batch_size, counter):
+    if fmt == "ndjson":
+        with open(path, "rb") as f:
+            while lines := list(islice(f, batch_size)):
+                counter.append(sum(map(len, lines)))
+                yield lines
+    else:
+        read = [0]  # csv.reader konum (tell) vermez: okunan satırların uzunluğu sayılır
+
+        def lines(f):
+            for line in f:
+                read[0] += len(line)
+                yield line
+
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(lines(f))
+            header = next(reader, None)
+            if header is None:
+                return
+            while records := list(islice(reader, batch_size)):
+                counter.append(read[0])
+                read[0] = 0
+                yield header, records
+
+
+def import_table(engine, table, path, layout="nested", fmt=None, batch_size=10_000,
+                 commit_every=200_000, workers=None, progress=None):
+    """
+    NDJSON/CSV dosyasını tabloya ekler: dönüştürme süreç havuzunda, yazma tek bağlantıda
+    executemany ile, her commit_every satırda bir commit. PipelineStats döndürür.
+    """
+    fmt = fmt or _format_for(path)
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout {LAYOUTS} olmalı")
+    _check_text_storage(table, engine.dialect)
+    spec = table_spec(table)
+    stmt = insert(_raw_table(table))
+    stats = PipelineStats("import", table.name)
+    convert = partial(_import_chunk, spec, fmt, layout)
+    sizes = deque()
+    with engine.connect() as conn, _executor(workers) as pool:
+        tx, pending = conn.begin(), 0
+        batches = _read_batches(path, fmt, batch_size, sizes)
+        for params in _ordered_map(pool, convert, batches, inflight=2 * (workers or os.cpu_count() or 1)):
+            if params:
+                conn.execute(stmt, params)
+            pending += len(params)
+            if pending >= commit_every:
+                tx.commit()
+                tx, pending = conn.begin(), 0
+            stats.add(len(params), sizes.popleft())
+            if progress:
+                progress(stats)
+        tx.commit()
+    return stats
+
+
+# ================== CLI ==================
+def load_tables():
+    """CLI'nin bildiği tablolar: products/places (multi_valueobject.py), users (single_valueoject.py)."""
+    import multi_valueobject
+    import single_valueoject
+    return {
+        "products": multi_valueobject.Product.__table__,
+        "places": multi_valueobject.Place.__table__,
+        "users": single_valueoject.User.__table__,
+    }
+
+
+def _demo(workers):
+    import tempfile
+
+    from sqlalchemy import func
+
+    from valueobject_engine import create_tuned_engine
+    import multi_valueobject as multi
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = create_tuned_engine(f"sqlite:///{tmp}/source.db")
+        target = create_tuned_engine(f"sqlite:///{tmp}/target.db")
+        multi.Base.metadata.create_all(source)
+        multi.Base.metadata.create_all(target)
+        with source.begin() as conn:
+            conn.execute(insert(multi.Place.__table__), [
+                {"name": f"Yer {i}", "location": multi.Coordinates(41 + i / 1e5, 29 - i / 1e5),
+                 "owner_name": multi.FullName("Şükrü" if i % 2 else "Ayşe", f"Soyad-{i}")}
+                for i in range(50_000)
+            ])
+            # float alanda int ve float tutarlar: {"amount": 15000} ile {"amount": 15000.0} ayrı kalmalı
+            conn.execute(insert(multi.Product.__table__), [
+                {"name": f"p-{i}", "price": multi.Money(15000 + i if i % 2 else 15000.0 + i, "TRY")}
+                for i in range(50_000)
+            ])
+        for table, name, layout in (
+            (multi.Place.__table__, "places.ndjson", "nested"),
+            (multi.Place.__table__, "places.csv", "flat"),
+            (multi.Product.__table__, "products.csv", "flat"),
+        ):
+            path = f"{tmp}/{name}"
+            print(export_table(source, table, path, layout=layout, workers=workers))
+            with target.begin() as conn:
+                conn.execute(table.delete())
+            print(import_table(target, table, path, layout=layout, workers=workers))
+            with target.connect() as conn:
+                assert conn.scalar(select(func.count()).select_from(table)) == 50_000
+                raw = select(*_raw_columns(table)).order_by(table.c.id)
+                with source.connect() as src:
+                    assert conn.execute(raw).all() == src.execute(raw).all()  # JSON metni birebir aynı
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Value object tabloları için NDJSON/CSV dışa/içe aktarma")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for command in ("export", "import"):
+        p = sub.add_parser(command)
+        p.add_argument("url", help="örneğin sqlite:///multi_ValueObject.db")
+        p.add_argument("table", choices=["products", "places", "users"])
+        p.add_argument("path", help=".ndjson / .jsonl / .csv")
+        p.add_argument("--layout", choices=LAYOUTS, default="nested")
+        p.add_argument("--batch-size", type=int, default=10_000)
+        p.add_argument("--workers", type=int, default=None, help="0: süreç havuzu yok")
+        if command == "import":
+            p.add_argument("--commit-every", type=int, default=200_000)
+    demo = sub.add_parser("demo", help="geçici veritabanlarıyla 50k satırlık gidiş-dönüş")
+    demo.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "demo":
+        _demo(args.workers)
+        return
+
+    from valueobject_engine import create_tuned_engine
+    engine = create_tuned_engine(args.url)
+    table = load_tables()[args.table]
+
+    def progress(stats):
+        print(f"\r{stats}", end="", flush=True)
+
+    if args.command == "export":
+        stats = export_table(engine, table, args.path, args.layout, batch_size=args.batch_size,
+                             workers=args.workers, progress=progress)
+    else:
+        table.metadata.create_all(engine, tables=[table])
+        stats = import_table(engine, table, args.path, args.layout, batch_size=args.batch_size,
+                             commit_every=args.commit_every, workers=args.workers, progress=progress)
+    print()
+    print(json.dumps(stats.as_dict()))
+
+
+if __name__ == "__main__":
+    main()
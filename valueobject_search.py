@@ -0,0 +1,187 @@
+"""
+Value object metin alanları (FullName.first/last, EmailAddress.address ...) için FTS5 araması.
+
+Place.owner_first_name == 'Ayşe' ve json_extract(owner_name, '$.first') = 'Ayşe' sadece
+birebir eşleşir ve tabloyu baştan sona tarar. TextSearchIndex sahibi olan tablonun yanına
+bir FTS5 gölge tablosu açar ve tetikleyicilerle (INSERT / UPDATE / DELETE) senkron tutar:
+
+    owner_search = TextSearchIndex(Place, ["owner_name.first", "owner_name.last"])
+    owner_search.search(session, "şük")                       # önek: Şükrü, ŞÜKRAN, sukru ...
+    owner_search.search(session, "zuleyha", prefix=False)     # tam kelime
+    owner_search.search(session, "ay", fields=["owner_name.first"], limit=20, offset=40)
+    owner_search.count(session, "ay")                         # sayfalama için toplam
+
+    TextSearchIndex(Contact, ["email.address"])               # EmailAddress: "user@exa" → user, exa*
+
+Büyük/küçük harf ve aksan duyarsızdır: unicode61 tokenizer'ı (remove_diacritics 2)
+ş→s, ü→u, ğ→g, ö→o, ç→c, İ→i katlar; Türkçedeki noktasız ı aksan değil ayrı harf olduğu için
+hem tetikleyicilerde hem sorguda ayrıca ı→i yapılır (Işık, ışık, isik aynı kelime).
+Sonuçlar bm25 skoruna göre sıralanır; LIMIT/OFFSET FTS tarafında uygulanır, sadece
+sayfadaki satırlar ana tablodan okunur.
+
+Yeni veritabanlarında FTS tablosu create_all ile oluşturulur; tablo zaten varsa
+TextSearchIndex.create(conn) çağrılır (idempotent, mevcut satırları da indeksler).
+Tetikleyiciler json_extract kullanır: sütunlar JSON metni üreten bir serializer ile yazılmalı.
+"""
+import re
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, event, func, literal_column, select, text
+
+TOKENIZER = "unicode61 remove_diacritics 2"
+PREFIX_INDEXES = "2 3"  # 2 ve 3 harflik önekler için ek indeks: kısa "yazarken ara" sorguları hızlı
+
+_WORD = re.compile(r"\w+")
+
+
+def fold(value):
+    """unicode61'in katlamadığı Türkçe noktasız ı → i (tetikleyicilerdeki replace ile aynı)."""
+    return value.replace("ı", "i")
+
+
+def _sql_fold(expr):
+    return f"replace({expr}, 'ı', 'i')"
+
+
+class TextSearchIndex:
+    """
+    :param model: ORM sınıfı (tek kolonlu tamsayı primary key'li)
+    :param fields: "sütun.alan" listesi, örneğin ["owner_name.first", "owner_name.last"]
+    """
+
+    def __init__(self, model, fields, name=None):
+        self.model = model
+        self.table = model.__table__
+        (pk,) = self.table.primary_key.columns
+        self.pk = pk.name
+        self.fields = [tuple(f.split(".", 1)) for f in fields]
+        self.columns = [f"{col}_{field}" for col, field in self.fields]  # FTS sütun adları
+        self.name = name or f"{self.table.name}_search"
+        self.fts = Table(self.name, MetaData(), Column("rowid", Integer), Column("rank", Float))
+        event.listen(self.table, "after_create", lambda target, conn, **kw: self.create(conn))
+        event.listen(self.table, "before_drop", lambda target, conn, **kw: self.drop(conn))
+
+    # ---- DDL ----
+    def _ddl(self):
+        t, pk, fts = self.table.name, self.pk, self.name
+        sources = sorted({col for col, _ in self.fields})
+
+        def values(row):
+            return ", ".join(_sql_fold(f"json_extract({row}.{col}, '$.{field}')") for col, field in self.fields)
+
+        names = ", ".join(self.columns)
+        insert_new = f"INSERT INTO {fts} (rowid, {names}) VALUES (NEW.{pk}, {values('NEW')});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+            f"tokenize='{TOKENIZER}', prefix='{PREFIX_INDEXES}')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {t} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {', '.join(sources)}, {pk} ON {t} BEGIN "
+            f"DELETE FROM {fts} WHERE rowid = OLD.{pk}; {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {t} BEGIN "
+            f"DELETE FROM {fts} WHERE rowid = OLD.{pk}; END",
+        ], f"INSERT INTO {fts} (rowid, {names}) SELECT {pk}, {values(t)} FROM {t}"
+
+    def create(self, conn):
+        """FTS5 tablosunu ve tetikleyicileri oluşturur; tablo yeni ise mevcut satırları indeksler."""
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": self.name}
+        ).first()
+        statements, backfill = self._ddl()
+        for sql in statements:
+            conn.exec_driver_sql(sql)
+        if not exists:
+            conn.exec_driver_sql(backfill)
+
+    def drop(self, conn):
+        for suffix in ("ai", "au", "ad"):
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {self.name}_{suffix}")
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {self.name}")
+
+    # ---- sorgular ----
+    def match_expression(self, query, prefix=True, fields=None):
+        """
+        Kullanıcı metnini güvenli bir FTS5 sorgusuna çevirir: her kelime tırnaklı
+        (FTS5 operatörleri/özel karakterler etkisiz), önek aramada "kelime"* ; kelimeler AND.
+        Kelime yoksa None.
+        """
+        tokens = _WORD.findall(fold(query))
+        if not tokens:
+            return None
+        star = "*" if prefix else ""
+        expr = " ".join(f'"{token}"{star}' for token in tokens)
+        if fields:
+            columns = " ".join(f"{col}_{field}" for col, field in (f.split(".", 1) for f in fields))
+            expr = f"{{{columns}}} : ({expr})"
+        return expr
+
+    def _hits(self, match):
+        return select(self.fts.c.rowid, self.fts.c.rank).where(literal_column(self.name).op("MATCH")(match))
+
+    def search(self, session, query, prefix=True, fields=None, limit=20, offset=0):
+        """bm25'e göre sıralı bir sayfa model nesnesi; FTS tarafında LIMIT/OFFSET."""
+        match = self.match_expression(query, prefix, fields)
+        if match is None:
+            return []
+        hits = self._hits(match).order_by(self.fts.c.rank).limit(limit).offset(offset).subquery()
+        stmt = (
+            select(self.model)
+            .join(hits, hits.c.rowid == self.table.c[self.pk])
+            .order_by(hits.c.rank)
+        )
+        return session.scalars(stmt).all()
+
+    def count(self, session, query, prefix=True, fields=None):
+        match = self.match_expression(query, prefix, fields)
+        if match is None:
+            return 0
+        return session.scalar(select(func.count()).select_from(self._hits(match).subquery()))
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    from sqlalchemy import Column as SAColumn, String
+    from sqlalchemy.orm import Session
+
+    from bench_persistence import load_script
+    from valueobject_engine import create_tuned_engine
+
+    hybrid = load_script("vealuobject_hybrid-property.py")
+    with contextlib.redirect_stdout(io.StringIO()):  # modül seviyesindeki örnek çıktılarını gizle
+        EmailAddress = load_script("basic_valueObject-2.py").EmailAddress
+
+    class Contact(hybrid.Base):
+        __tablename__ = "contacts"
+        id = SAColumn(Integer, primary_key=True)
+        label = SAColumn(String)
+        email = SAColumn(hybrid.ValueType(EmailAddress, trusted=True))
+
+    contact_search = TextSearchIndex(Contact, ["email.address"])
+
+    engine = create_tuned_engine("sqlite://")
+    hybrid.Base.metadata.create_all(engine)
+    names = [("Şükrü", "Işık"), ("Züleyha", "Öztürk"), ("Ayşe", "Yılmaz"), ("AYŞEGÜL", "Çelik"),
+             ("Sukru", "Aydın"), ("Ilgaz", "Kaya")]
+    with Session(engine) as s:
+        s.add_all([hybrid.Place(name=f"{first} {last}", owner_name=hybrid.FullName(first, last)) for first, last in names])
+        s.add_all([Contact(label="destek", email=EmailAddress("destek@ornek.com.tr")),
+                   Contact(label="ayse", email=EmailAddress("ayse.yilmaz@example.com"))])
+        s.commit()
+
+        search = hybrid.owner_search
+        for q in ("şük", "SUKRU", "ayse", "isik", "ılgaz", "zuleyha öztürk"):
+            print(f"{q!r:18} → {[p.name for p in search.search(s, q)]}")
+        assert {p.name for p in search.search(s, "sukru")} == {"Şükrü Işık", "Sukru Aydın"}
+        assert [p.name for p in search.search(s, "ayşe", prefix=False)] == ["Ayşe Yılmaz"]
+        assert search.count(s, "ay") == 3  # Ayşe, AYŞEGÜL, Aydın
+        page = search.search(s, "ay", limit=2, offset=2)
+        print("sayfa 2:", [p.name for p in page])
+        print("e-posta:", [c.label for c in contact_search.search(s, "yilmaz@exa")])
+
+        s.query(hybrid.Place).filter(hybrid.Place.owner_first_name == "Züleyha").update(
+            {"owner_name": hybrid.FullName("Zeliha", "Öztürk")}, synchronize_session=False)
+        s.delete(s.scalars(select(hybrid.Place).where(hybrid.Place.name == "Ilgaz Kaya")).one())
+        s.commit()
+        assert search.search(s, "zuleyha") == [] and search.count(s, "zeliha") == 1
+        assert search.search(s, "ilgaz") == []
+        print("tetikleyiciler: güncelleme/silme FTS'e yansıdı")
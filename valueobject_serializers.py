@@ -0,0 +1,282 @@
+"""
+Value object sütunları için takılıp çıkarılabilir serializer backend'leri.
+
+ValueType / ProfileType varsayılan olarak stdlib json ile TEXT sütununa yazar. İki alanlı
+küçük nesnelerde ('{"lat": 41.0151, "lng": 28.9793}') depolamanın ve decode CPU'sunun
+çoğu JSON metnine gidiyor. Burada aynı arayüzle dört backend var:
+
+    "json"     → stdlib json, String (TEXT)           — her zaman mevcut
+    "orjson"   → orjson, String (TEXT)                — pip install orjson
+    "msgpack"  → alan değerleri dizisi, LargeBinary   — pip install msgpack
+    "struct"   → sabit düzenli ikili paket, LargeBinary — sadece sayısal alanlar
+                 (Coordinates(lat, lng) → 16 byte, Color(255, 0, 0) → 24 byte)
+
+Seçim:
+    Column(ValueType(Coordinates, serializer="struct"))            # sütun bazında
+    Column(ValueType(Money, serializer=("orjson", "json")))        # fallback sırası
+    use_serializer(engine, "msgpack")                               # engine bazında
+
+Eski (legacy) JSON satırları: ikili backend'ler, ham değer str ise onu JSON olarak okur;
+bytes önce backend'in kendi formatıyla çözülür, sadece bu başarısız olursa JSON denenir
+(Color(123, 0, 0)'ın struct paketi de b'{' ile başlar). Böylece sütun TEXT'ten BLOB'a
+geçerken eski satırlar okunmaya devam eder.
+
+NOT: json_extract tabanlı filtreler ve ValueType(indexed=...) sadece JSON metni üreten
+backend'lerle ("json", "orjson") çalışır.
+"""
+import struct
+
+from sqlalchemy import LargeBinary, String
+
+from valueobject_codec import _json_decode
+from valueobject_lazy import lazy_factory
+
+try:
+    import orjson
+except ImportError:  # opsiyonel bağımlılık
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # opsiyonel bağımlılık
+    msgpack = None
+
+
+class Serializer:
+    """
+    Backend temel sınıfı. Alt sınıflar _make_dumper / _make_loader'ı tanımlar;
+    üretilen fonksiyonlar codec (ve trusted) başına bir kez oluşturulup önbelleğe alınır.
+    """
+    name = None
+    impl = String  # Sütunun SQL tipi
+    binary = False  # True ise değer bytes; json_extract kullanılamaz
+
+    def __init__(self):
+        self._dumpers = {}
+        self._loaders = {}
+
+    @property
+    def available(self):
+        return True
+
+    def dumper(self, codec):
+        """nesne → ham değer fonksiyonu (codec başına önbellekli)."""
+        fn = self._dumpers.get(codec)
+        if fn is None:
+            fn = self._dumpers[codec] = self._make_dumper(codec)
+        return fn
+
+    def loader(self, codec, trusted=False):
+        """ham değer → nesne fonksiyonu (codec ve trusted başına önbellekli)."""
+        key = (codec, trusted)
+        fn = self._loaders.get(key)
+        if fn is None:
+            fn = self._loaders[key] = self._make_loader(codec, trusted)
+        return fn
+
+    def lazy_loader(self, codec, trusted=False):
+        """ham değer → LazyValue fonksiyonu; decode ilk attribute erişiminde (bkz. valueobject_lazy)."""
+        key = (codec, trusted, "lazy")
+        fn = self._loaders.get(key)
+        if fn is None:
+            fn = self._loaders[key] = lazy_factory(self.loader(codec, trusted), codec, self)
+        return fn
+
+    def _make_dumper(self, codec):
+        raise NotImplementedError
+
+    def _make_loader(self, codec, trusted):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+def _legacy_json_loader(codec, trusted, loader):
+    """İkili backend loader'ını eski JSON satırlarını da okuyacak şekilde sarar."""
+    from_dict = codec.from_dict_trusted if trusted else codec.from_dict
+
+    def load(raw):
+        if isinstance(raw, str):
+            return from_dict(_json_decode(raw))
+        try:
+            return loader(raw)
+        except Exception:
+            # BLOB olarak saklanmış eski JSON: ikili çözme başarısızsa JSON dene;
+            # o da olmazsa asıl hata yükseltilir
+            if raw[:1] == b"{":
+                try:
+                    return from_dict(_json_decode(bytes(raw).decode()))
+                except ValueError:
+                    pass
+            raise
+    return load
+
+
+class JsonSerializer(Serializer):
+    name = "json"
+
+    def _make_dumper(self, codec):
+        return codec.encode
+
+    def _make_loader(self, codec, trusted):
+        return codec.decode_trusted if trusted else codec.decode
+
+
+class OrjsonSerializer(Serializer):
+    name = "orjson"
+
+    @property
+    def available(self):
+        return orjson is not None
+
+    def _make_dumper(self, codec):
+        dumps, to_dict = orjson.dumps, codec.to_dict
+        # orjson bytes döndürür; TEXT sütunu ve json_extract için str'ye çeviriyoruz
+        return lambda value: dumps(to_dict(value)).decode()
+
+    def _make_loader(self, codec, trusted):
+        loads = orjson.loads
+        from_dict = codec.from_dict_trusted if trusted else codec.from_dict
+        return lambda raw: from_dict(loads(raw))
+
+
+class MsgpackSerializer(Serializer):
+    """Alan değerlerini (anahtarsız) msgpack dizisi olarak yazar: [15000, "TRY"]."""
+    name = "msgpack"
+    impl = LargeBinary
+    binary = True
+
+    @property
+    def available(self):
+        return msgpack is not None
+
+    def _make_dumper(self, codec):
+        packb, to_tuple = msgpack.packb, codec.to_tuple
+        return lambda value: packb(to_tuple(value))
+
+    def _make_loader(self, codec, trusted):
+        unpackb = msgpack.unpackb
+        from_tuple = codec.from_tuple_trusted if trusted else codec.from_tuple
+        return _legacy_json_loader(codec, trusted, lambda raw: from_tuple(unpackb(raw)))
+
+
+# Anotasyon → struct format karakteri. Anotasyonu olmayan alanlar float64 ("d") sayılır.
+_STRUCT_CODES = {int: "q", "int": "q", float: "d", "float": "d", bool: "?", "bool": "?", None: "d"}
+
+
+class StructSerializer(Serializer):
+    """
+    Tüm alanları sayısal olan value object'ler için sabit düzenli ikili paket.
+    :param fmt: struct formatı (örneğin "<BBB" renk için). Verilmezse alan
+                anotasyonlarından türetilir: int → q, float → d, bool → ?, yok → d.
+    """
+    name = "struct"
+    impl = LargeBinary
+    binary = True
+
+    def __init__(self, fmt=None):
+        super().__init__()
+        self.fmt = fmt
+
+    def packer(self, codec):
+        if self.fmt is not None:
+            return struct.Struct(self.fmt)
+        try:
+            codes = "".join(_STRUCT_CODES[codec.types[f]] for f in codec.fields)
+        except KeyError:
+            raise TypeError(
+                f"{codec.cls.__name__}: struct serializer sadece sayısal alanları destekler "
+                f"({dict(codec.types)}); açık bir fmt verin"
+            ) from None
+        return struct.Struct("<" + codes)
+
+    def _make_dumper(self, codec):
+        pack, to_tuple = self.packer(codec).pack, codec.to_tuple
+        return lambda value: pack(*to_tuple(value))
+
+    def _make_loader(self, codec, trusted):
+        unpack = self.packer(codec).unpack
+        from_tuple = codec.from_tuple_trusted if trusted else codec.from_tuple
+        return _legacy_json_loader(codec, trusted, lambda raw: from_tuple(unpack(raw)))
+
+
+SERIALIZERS = {
+    "json": JsonSerializer(),
+    "orjson": OrjsonSerializer(),
+    "msgpack": MsgpackSerializer(),
+    "struct": StructSerializer(),
+}
+
+# "auto" için denenme sırası: kurulu olan ilk backend seçilir
+FALLBACK_ORDER = ("orjson", "json")
+
+DEFAULT_SERIALIZER = SERIALIZERS["json"]
+
+
+def resolve_serializer(spec):
+    """
+    Serializer belirtimini bir Serializer nesnesine çevirir.
+    :param spec: None ("json"), "auto", bir ad ("msgpack"), adlar dizisi (ilk kurulu olan
+                 seçilir) veya bir Serializer nesnesi (örneğin StructSerializer("<BBB")).
+    """
+    if spec is None:
+        return DEFAULT_SERIALIZER
+    if isinstance(spec, Serializer):
+        return spec
+    if spec == "auto":
+        spec = FALLBACK_ORDER
+    if isinstance(spec, str):
+        serializer = SERIALIZERS.get(spec)
+        if serializer is None:
+            raise ValueError(f"Bilinmeyen serializer: {spec!r} (seçenekler: {', '.join(SERIALIZERS)})")
+        if not serializer.available:
+            raise ImportError(f"{spec!r} serializer'ı için paket kurulu değil (pip install {spec})")
+        return serializer
+    for name in spec:
+        try:
+            return resolve_serializer(name)
+        except ImportError:
+            continue  # kurulu değil → sıradakini dene
+    raise ImportError(f"Kurulu serializer bulunamadı: {tuple(spec)}")
+
+
+def use_serializer(engine, spec):
+    """
+    Engine bazında varsayılan serializer: serializer'ı açıkça verilmemiş tüm value object
+    sütunları bu engine üzerinden bu backend ile yazılır/okunur.
+    Tablolar oluşturulmadan (create_all) önce çağrılmalıdır; sütunun SQL tipi de değişebilir.
+    """
+    engine.dialect.value_object_serializer = resolve_serializer(spec)
+    return engine
+
+
+def serializer_for(serializer, dialect):
+    """Sütunun serializer'ı, yoksa engine (dialect) varsayılanı, o da yoksa json."""
+    return serializer or getattr(dialect, "value_object_serializer", DEFAULT_SERIALIZER)
+
+
+if __name__ == "__main__":
+    from valueobject_base import value_object
+    from valueobject_codec import get_codec
+
+    @value_object
+    class Color:
+        red: int
+        green: int
+        blue: int
+
+    codec = get_codec(Color)
+    color = Color(123, 0, 0)  # struct paketi b'{\x00...' — JSON'la karıştırılmamalı
+    for name in ("struct", "msgpack"):
+        serializer = SERIALIZERS[name]
+        if not serializer.available:
+            print(f"{name}: kurulu değil, atlandı")
+            continue
+        raw = serializer.dumper(codec)(color)
+        for trusted in (False, True):
+            assert serializer.loader(codec, trusted)(raw) == color, (name, raw)
+        # eski JSON satırları (TEXT ve BLOB olarak) okunmaya devam eder
+        assert serializer.loader(codec)(codec.encode(color)) == color
+        assert serializer.loader(codec)(codec.encode(color).encode()) == color
+        print(f"{name}: {raw[:1]!r}... gidiş-dönüş tamam")
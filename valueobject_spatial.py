@@ -0,0 +1,214 @@
+"""
+Koordinat value object'leri için SQLite R*Tree uzamsal indeksi.
+
+Place.location gibi bir sütun Coordinates(lat, lng)'yi JSON metni olarak saklıyor;
+"X'e yakın mekanlar" için her satırı yükleyip Python'da mesafe hesaplamak gerekiyordu.
+SpatialIndex sütunun yanına bir R*Tree sanal tablosu açar ve tetikleyicilerle
+(INSERT / UPDATE / DELETE) sahibi olan tabloyla senkron tutar:
+
+    place_locations = SpatialIndex(Place, "location")            # Coordinates(lat, lng)
+    SpatialIndex(Store, "location", lat="latitude", lng="longitude")   # Location(latitude, longitude)
+
+    place_locations.within_bbox(session, south=40.9, west=28.8, north=41.1, east=29.1)
+    place_locations.nearest(session, Coordinates(41.0, 29.0), k=5)        # [Place, ...] mesafeye göre
+    place_locations.nearest(session, (41.0, 29.0), k=5, with_distance=True)   # [(Place, km), ...]
+
+Yeni veritabanlarında R*Tree tablosu create_all ile birlikte oluşturulur; tablo zaten varsa
+SpatialIndex.create(conn) çağrılır (idempotent, mevcut satırları da indeksler).
+
+Notlar:
+- Tetikleyiciler json_extract kullanır: sütun JSON metni üreten bir serializer ile yazılmalı.
+- R*Tree koordinatları 32 bit float olarak (dışa doğru yuvarlanmış) saklar; aday kümesi
+  indeksle bulunur, kesin filtre ve sıralama sütundaki gerçek değerlerle yapılır.
+- nearest: kutuyu k aday bulunana kadar büyütür, sonra k. adayın mesafesini kapsayan kutuyla
+  bir kez daha sorgular; böylece kutunun köşelerinden kaçan daha yakın nokta kalmaz.
+"""
+import heapq
+import math
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, and_, event, func, literal_column, or_, select, text
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+# float32 (24 bit mantis) 180°'de ~1.5e-5° ≈ 1.7 m; R*Tree mesafesi bu kadar sapabilir
+ROUNDING_KM = 0.01
+IN_CHUNK_SIZE = 500  # SQLite parametre limitinin (999/32766) altında
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """İki nokta arasındaki büyük çember mesafesi (km)."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _bbox_around(lat, lng, radius_km):
+    """(lat, lng) merkezli, yarıçapı radius_km olan çemberi içine alan kutu: (south, west, north, east)."""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    south, north = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+    cos_lat = math.cos(math.radians(max(abs(south), abs(north))))
+    if cos_lat < 1e-9 or radius_km / (KM_PER_DEGREE_LAT * cos_lat) >= 180:
+        return south, -180.0, north, 180.0  # kutba yakın / çok büyük yarıçap: tüm boylamlar
+    dlng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    west, east = lng - dlng, lng + dlng
+    if west < -180:
+        west += 360  # antimeridyeni aşan kutu: west > east
+    if east > 180:
+        east -= 360
+    return south, west, north, east
+
+
+class SpatialIndex:
+    """
+    :param model: ORM sınıfı (tek kolonlu tamsayı primary key'li)
+    :param column: koordinat value object'ini saklayan sütunun adı
+    :param lat, lng: value object'teki enlem/boylam alan adları
+    """
+
+    def __init__(self, model, column, lat="lat", lng="lng"):
+        self.model = model
+        self.table = model.__table__
+        self.column = column
+        self.lat, self.lng = lat, lng
+        (pk,) = self.table.primary_key.columns
+        self.pk = pk.name
+        self.name = f"{self.table.name}_{column}_rtree"
+        # Sadece sorgu kurmak için; create_all ile değil create() ile oluşturulur
+        self.rtree = Table(
+            self.name, MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("min_lat", Float), Column("max_lat", Float),
+            Column("min_lng", Float), Column("max_lng", Float),
+        )
+        event.listen(self.table, "after_create", lambda target, conn, **kw: self.create(conn))
+        event.listen(self.table, "before_drop", lambda target, conn, **kw: self.drop(conn))
+
+    # ---- DDL ----
+    def _ddl(self):
+        t, col, pk, rt = self.table.name, self.column, self.pk, self.name
+
+        def point(row):
+            lat = f"json_extract({row}.{col}, '$.{self.lat}')"
+            lng = f"json_extract({row}.{col}, '$.{self.lng}')"
+            return f"{lat}, {lat}, {lng}, {lng}"
+
+        insert_new = (
+            f"INSERT INTO {rt} (id, min_lat, max_lat, min_lng, max_lng) "
+            f"SELECT NEW.{pk}, {point('NEW')} WHERE NEW.{col} IS NOT NULL;"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {rt} USING rtree(id, min_lat, max_lat, min_lng, max_lng)",
+            f"CREATE TRIGGER IF NOT EXISTS {rt}_ai AFTER INSERT ON {t} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {rt}_au AFTER UPDATE OF {col}, {pk} ON {t} BEGIN "
+            f"DELETE FROM {rt} WHERE id = OLD.{pk}; {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {rt}_ad AFTER DELETE ON {t} BEGIN "
+            f"DELETE FROM {rt} WHERE id = OLD.{pk}; END",
+        ], (
+            f"INSERT INTO {rt} (id, min_lat, max_lat, min_lng, max_lng) "
+            f"SELECT {pk}, {point(t)} FROM {t} WHERE {col} IS NOT NULL"
+        )
+
+    def create(self, conn):
+        """R*Tree tablosunu ve tetikleyicileri oluşturur; tablo yeni ise mevcut satırları indeksler."""
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": self.name}
+        ).first()
+        statements, backfill = self._ddl()
+        for sql in statements:
+            conn.exec_driver_sql(sql)
+        if not exists:
+            conn.exec_driver_sql(backfill)
+
+    def drop(self, conn):
+        for suffix in ("ai", "au", "ad"):
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {self.name}_{suffix}")
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {self.name}")
+
+    # ---- sorgular ----
+    def _bbox_clause(self, south, west, north, east):
+        rt = self.rtree.c
+        lat_ok = and_(rt.max_lat >= south, rt.min_lat <= north)
+        if west <= east:
+            return and_(lat_ok, rt.max_lng >= west, rt.min_lng <= east)
+        return and_(lat_ok, or_(rt.max_lng >= west, rt.min_lng <= east))  # antimeridyen
+
+    def _field(self, name):
+        return func.json_extract(self.table.c[self.column], literal_column(f"'$.{name}'"))
+
+    def within_bbox(self, session, south, west, north, east):
+        """
+        Kutunun içindeki satırlar (sınırlar dahil). west > east ise kutu 180. boylamı aşar.
+        Aday kümesi R*Tree'den gelir; 32 bit yuvarlama payı gerçek değerlerle elenir.
+        """
+        lat, lng = self._field(self.lat), self._field(self.lng)
+        lng_ok = lng.between(west, east) if west <= east else or_(lng >= west, lng <= east)
+        stmt = (
+            select(self.model)
+            .join(self.rtree, self.rtree.c.id == self.table.c[self.pk])
+            .where(self._bbox_clause(south, west, north, east), lat.between(south, north), lng_ok)
+        )
+        return session.scalars(stmt).all()
+
+    def _candidates(self, session, bbox):
+        rt = self.rtree.c
+        stmt = select(rt.id, rt.min_lat, rt.min_lng).where(self._bbox_clause(*bbox))
+        return session.execute(stmt).all()
+
+    def nearest(self, session, point, k=10, radius_km=1.0, max_km=None, with_distance=False):
+        """
+        point'e en yakın k satır, mesafeye göre sıralı.
+        :param point: Coordinates(lat, lng), Location(latitude, longitude) veya (lat, lng)
+        :param radius_km: ilk arama yarıçapı; aday yetmezse ikiye katlanır
+        :param max_km: bu mesafeden uzak satırlar döndürülmez
+        """
+        lat, lng = _lat_lng(point)
+        limit = max_km if max_km is not None else math.pi * EARTH_RADIUS_KM
+        radius = min(radius_km, limit)
+        while True:
+            rows = self._candidates(session, _bbox_around(lat, lng, radius))
+            if len(rows) >= k or radius >= limit:
+                break
+            radius = min(radius * 2, limit)
+
+        # Kutu köşelerindeki adaylar çemberin dışında olabilir: k. adayın mesafesini kapsayan
+        # kutuyla bir kez daha sorgula (32 bit yuvarlama için küçük pay bırakılır)
+        ranked = heapq.nsmallest(k, ((haversine_km(lat, lng, r.min_lat, r.min_lng), r.id) for r in rows))
+        if len(ranked) == k and ranked[-1][0] > radius:
+            radius = min(ranked[-1][0] * 1.001 + 0.001, limit)
+            rows = self._candidates(session, _bbox_around(lat, lng, radius))
+        if not rows:
+            return []
+
+        # Yalnızca sonuca girebilecek adaylar yüklenir: R*Tree mesafesine göre k. adayın
+        # mesafesi + yuvarlama payı (kutudaki tüm adaylar binlerce satır olabilir)
+        approx = sorted((haversine_km(lat, lng, r.min_lat, r.min_lng), r.id) for r in rows)
+        cutoff = approx[min(k, len(approx)) - 1][0] + ROUNDING_KM
+        if max_km is not None:
+            cutoff = min(cutoff, max_km + ROUNDING_KM)
+        ids = [id_ for km, id_ in approx if km <= cutoff]
+
+        # Kesin mesafe: adayların sütundaki gerçek koordinatları
+        pk = self.table.c[self.pk]
+        objects = []
+        for start in range(0, len(ids), IN_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CHUNK_SIZE]
+            objects += session.scalars(select(self.model).where(pk.in_(chunk))).all()
+        scored = []
+        for obj in objects:
+            vo = getattr(obj, self.column)
+            km = haversine_km(lat, lng, getattr(vo, self.lat), getattr(vo, self.lng))
+            if max_km is None or km <= max_km:
+                scored.append((km, obj))
+        best = heapq.nsmallest(k, scored, key=lambda pair: pair[0])
+        return [(obj, km) for km, obj in best] if with_distance else [obj for km, obj in best]
+
+
+def _lat_lng(point):
+    """Coordinates / Location / (lat, lng) → (lat, lng)."""
+    if isinstance(point, (tuple, list)):
+        return float(point[0]), float(point[1])
+    for lat, lng in (("lat", "lng"), ("latitude", "longitude")):
+        if hasattr(point, lat) and hasattr(point, lng):
+            return float(getattr(point, lat)), float(getattr(point, lng))
+    raise TypeError(f"Koordinat alınamadı: {point!r}")
@@ -0,0 +1,322 @@
+"""
+Tek tamsayıyla kodlanmış Time / Date value object'leri ve INTEGER sütun tipleri.
+
+basic_valueObject-2.py'deki Time(hours, minutes, seconds) ve Date(day, month, year) üç ayrı
+int tutuyor; ValueType ile saklansalar JSON metni olurlar ve "9:00-12:00 arası" ya da
+"Ocak ayı" gibi aralık sorguları json_extract üzerinden, indekssiz ve metin sırasıyla çalışır.
+Burada her değer tek bir int'tir:
+
+    PackedTime(9, 30)          → seconds_of_day = 34200       (gece yarısından beri saniye)
+    PackedDate(15, 6, 2024)    → epoch_day      = 19889       (1970-01-01'den beri gün)
+
+Python API'si aynı kalır (t.hours, d.month, str(d) → "15/06/2024", d1 < d2, tuple(d) → (15, 6, 2024));
+alanlar istendiğinde int'ten hesaplanır. Sütunda tek bir INTEGER saklanır; sıra int sırasıyla
+aynı olduğu için BETWEEN / < / > sorguları normal B-tree indeksini kullanır:
+
+    class Appointment(Base):
+        day = Column(PackedDateType, index=True)
+        start = Column(PackedTimeType, index=True)
+
+    select(Appointment).where(
+        Appointment.day.between(PackedDate(1, 1, 2024), PackedDate(31, 1, 2024)),
+        Appointment.start >= PackedTime(9),
+    )
+
+Sütun tipleri PackedTime/PackedDate dışında basic_valueObject-2'deki Time/Date'i (alan adlarından),
+datetime.time/datetime.date'i ve zaten kodlanmış int'i de kabul eder.
+sort_key, seconds_of_day / epoch_day'in kendisidir: valueobject_keys.by_sort_key ve
+key_range bu sınıflarla da çalışır.
+"""
+from dataclasses import FrozenInstanceError
+from datetime import date as _date, time as _time
+
+from sqlalchemy import Integer, TypeDecorator
+
+from valueobject_keys import add_ordering
+from valueobject_validation import ValidationError
+
+SECONDS_PER_DAY = 86_400
+EPOCH_ORDINAL = _date(1970, 1, 1).toordinal()  # 719163
+
+
+def _frozen_setattr(self, name, value):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self, name):
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+class PackedTime:
+    """Günün saati, gece yarısından beri saniye olarak (0 … 86399)."""
+
+    __slots__ = ("seconds_of_day",)
+    __match_args__ = ("hours", "minutes", "seconds")
+
+    def __init__(self, hours, minutes=0, seconds=0):
+        # Yalnızca int: 9.5 saat kesirli saniye, True ise 1 olarak kodlanırdı
+        if not (hours.__class__ is int and minutes.__class__ is int and seconds.__class__ is int):
+            raise ValidationError(
+                "PackedTime", [(None, f"saat alanları int olmalı: {hours!r}, {minutes!r}, {seconds!r}")])
+        if not (0 <= hours <= 23 and 0 <= minutes <= 59 and 0 <= seconds <= 59):
+            raise ValidationError("PackedTime", [(None, f"geçersiz saat {hours}:{minutes}:{seconds}")])
+        _set_seconds(self, hours * 3600 + minutes * 60 + seconds)
+
+    @classmethod
+    def from_seconds(cls, seconds_of_day):
+        """Kodlanmış değerden (DB okuma yolu): doğrulama yok."""
+        obj = _new(cls)
+        _set_seconds(obj, seconds_of_day)
+        return obj
+
+    @classmethod
+    def from_time(cls, value):
+        """datetime.time veya hours/minutes/seconds alanlı nesne (basic_valueObject-2.Time)."""
+        if isinstance(value, _time):
+            return cls(value.hour, value.minute, value.second)
+        return cls(value.hours, value.minutes, value.seconds)
+
+    @property
+    def hours(self):
+        return self.seconds_of_day // 3600
+
+    @property
+    def minutes(self):
+        return self.seconds_of_day // 60 % 60
+
+    @property
+    def seconds(self):
+        return self.seconds_of_day % 60
+
+    def to_time(self):
+        return _time(self.hours, self.minutes, self.seconds)
+
+    def __iter__(self):
+        minutes, seconds = divmod(self.seconds_of_day, 60)
+        return iter((*divmod(minutes, 60), seconds))
+
+    def __eq__(self, other):
+        if other.__class__ is not PackedTime:
+            return NotImplemented
+        return self.seconds_of_day == other.seconds_of_day
+
+    def __hash__(self):
+        return hash(self.seconds_of_day)
+
+    def __reduce__(self):
+        return (PackedTime.from_seconds, (self.seconds_of_day,))
+
+    def __repr__(self):
+        return "PackedTime(hours={}, minutes={}, seconds={})".format(*self)
+
+    def __str__(self):
+        return "{:02}:{:02}:{:02}".format(*self)
+
+    __setattr__ = _frozen_setattr
+    __delattr__ = _frozen_delattr
+
+
+class PackedDate:
+    """Takvim günü, 1970-01-01'den beri gün sayısı olarak (negatif olabilir)."""
+
+    __slots__ = ("epoch_day",)
+    __match_args__ = ("day", "month", "year")
+
+    def __init__(self, day, month, year):
+        if not (day.__class__ is int and month.__class__ is int and year.__class__ is int):
+            raise ValidationError("PackedDate", [(None, f"tarih alanları int olmalı: {day!r}, {month!r}, {year!r}")])
+        try:
+            ordinal = _date(year, month, day).toordinal()
+        except (TypeError, ValueError) as e:
+            raise ValidationError("PackedDate", [(None, f"geçersiz tarih {day}/{month}/{year}: {e}")]) from None
+        _set_epoch_day(self, ordinal - EPOCH_ORDINAL)
+
+    @classmethod
+    def from_epoch_day(cls, epoch_day):
+        """Kodlanmış değerden (DB okuma yolu): doğrulama yok."""
+        obj = _new(cls)
+        _set_epoch_day(obj, epoch_day)
+        return obj
+
+    @classmethod
+    def from_date(cls, value):
+        """datetime.date veya day/month/year alanlı nesne (basic_valueObject-2.Date)."""
+        if isinstance(value, _date):
+            return cls.from_epoch_day(value.toordinal() - EPOCH_ORDINAL)
+        return cls(value.day, value.month, value.year)
+
+    def to_date(self):
+        return _date.fromordinal(self.epoch_day + EPOCH_ORDINAL)
+
+    @property
+    def day(self):
+        return self.to_date().day
+
+    @property
+    def month(self):
+        return self.to_date().month
+
+    @property
+    def year(self):
+        return self.to_date().year
+
+    def __iter__(self):
+        d = self.to_date()  # tek dönüşümle üç alan
+        return iter((d.day, d.month, d.year))
+
+    def __eq__(self, other):
+        if other.__class__ is not PackedDate:
+            return NotImplemented
+        return self.epoch_day == other.epoch_day
+
+    def __hash__(self):
+        return hash(self.epoch_day)
+
+    def __reduce__(self):
+        return (PackedDate.from_epoch_day, (self.epoch_day,))
+
+    def __repr__(self):
+        return "PackedDate(day={}, month={}, year={})".format(*self)
+
+    def __str__(self):
+        return "{:02}/{:02}/{}".format(*self)
+
+    __setattr__ = _frozen_setattr
+    __delattr__ = _frozen_delattr
+
+
+_new = object.__new__
+_set_seconds = PackedTime.seconds_of_day.__set__
+_set_epoch_day = PackedDate.epoch_day.__set__
+# Aynı slot iki adla: sort_key (valueobject_keys.by_sort_key ile uyumlu), ek maliyet yok
+PackedTime.sort_key = PackedTime.seconds_of_day
+PackedDate.sort_key = PackedDate.epoch_day
+# < / <= / > / >=: valueobject_keys'in sort_key karşılaştırmaları (@keyed sınıflarla aynı kod)
+add_ordering(PackedTime)
+add_ordering(PackedDate)
+
+
+# ================== SÜTUN TİPLERİ ==================
+class PackedTimeType(TypeDecorator):
+    """PackedTime ↔ INTEGER (gece yarısından beri saniye)."""
+
+    impl = Integer
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return PackedTime
+
+    def process_bind_param(self, value, dialect):
+        if value is None or value.__class__ is int:
+            return value  # None veya zaten kodlanmış (ham INSERT / pipeline); bool int sayılmaz
+        if value.__class__ is bool:
+            raise TypeError(f"PackedTimeType bool kabul etmez: {value!r}")
+        if value.__class__ is not PackedTime:
+            value = PackedTime.from_time(value)
+        return value.seconds_of_day
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else PackedTime.from_seconds(value)
+
+
+class PackedDateType(TypeDecorator):
+    """PackedDate ↔ INTEGER (1970-01-01'den beri gün)."""
+
+    impl = Integer
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return PackedDate
+
+    def process_bind_param(self, value, dialect):
+        if value is None or value.__class__ is int:
+            return value
+        if value.__class__ is bool:
+            raise TypeError(f"PackedDateType bool kabul etmez: {value!r}")
+        if value.__class__ is not PackedDate:
+            value = PackedDate.from_date(value)
+        return value.epoch_day
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else PackedDate.from_epoch_day(value)
+
+
+if __name__ == "__main__":
+    import pickle
+    import random
+    import sys
+    import time as timer
+
+    from sqlalchemy import Column, String, func, insert, select, text
+    from sqlalchemy.orm import DeclarativeBase, Session
+
+    from valueobject_engine import create_tuned_engine
+    from valueobject_keys import by_sort_key, key_range
+
+    d, t = PackedDate(15, 6, 2024), PackedTime(9, 30)
+    print(d, t, repr(d), tuple(d), t.hours, t.minutes)
+    assert PackedDate.from_date(_date(2024, 6, 15)) == d and d.to_date() == _date(2024, 6, 15)
+    assert pickle.loads(pickle.dumps(t)) == t and PackedTime(9) < t
+    assert PackedDate(1, 1, 2024) <= d <= PackedDate(15, 6, 2024) and not d > d and t >= PackedTime(9, 30)
+    print("boyut:", sys.getsizeof(d), "bayt (tuple(15, 6, 2024):", sys.getsizeof((15, 6, 2024)), "bayt + int'ler)")
+    for bad in (lambda: PackedDate(30, 2, 2024), lambda: PackedTime(24, 0), lambda: PackedTime(9.5),
+                lambda: PackedTime(True), lambda: PackedDate(1, True, 2024)):
+        try:
+            bad()
+        except ValueError as e:
+            print("Hata:", e)
+        else:
+            raise AssertionError("geçersiz değer kabul edildi")
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Appointment(Base):
+        __tablename__ = "appointments"
+        id = Column(Integer, primary_key=True)
+        title = Column(String)
+        day = Column(PackedDateType, index=True)
+        start = Column(PackedTimeType, index=True)
+
+    engine = create_tuned_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rng = random.Random(3)
+    first = PackedDate(1, 1, 2023).epoch_day
+    with engine.begin() as conn:
+        conn.execute(insert(Appointment), [
+            {"title": f"randevu {i}", "day": PackedDate.from_epoch_day(first + rng.randrange(730)),
+             "start": PackedTime(rng.randrange(8, 19), rng.choice((0, 15, 30, 45)))}
+            for i in range(200_000)
+        ])
+
+    assert PackedTimeType().process_bind_param(34200, None) == 34200
+    try:
+        PackedTimeType().process_bind_param(True, None)
+    except TypeError as e:
+        print("Hata:", e)
+    else:
+        raise AssertionError("bool sütuna yazıldı")
+
+    with Session(engine) as s:
+        january = Appointment.day.between(PackedDate(1, 1, 2024), PackedDate(31, 1, 2024))
+        start = timer.perf_counter()
+        rows = s.scalars(select(Appointment).where(january, Appointment.start < PackedTime(10))).all()
+        print(f"Ocak 2024, 10:00 öncesi: {len(rows)} randevu, {(timer.perf_counter() - start) * 1000:.1f} ms")
+        assert all(r.day.year == 2024 and r.day.month == 1 and r.start.hours < 10 for r in rows)
+        print("ilk:", rows[0].day, rows[0].start)
+
+        stmt = select(Appointment.id).where(january)
+        sql = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+        plan = [row[-1] for row in s.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+        print("Query plan:", plan)
+        assert any("ix_appointments_day" in step for step in plan), plan
+
+        busiest = s.execute(select(Appointment.day, func.count()).group_by(Appointment.day)
+                            .order_by(func.count().desc()).limit(1)).one()
+        print("en yoğun gün:", busiest[0], busiest[1])
+
+        days = sorted({r.day for r in rows}, key=by_sort_key)
+        assert key_range(days, PackedDate(10, 1, 2024), PackedDate(12, 1, 2024)) == [
+            PackedDate(10, 1, 2024), PackedDate(11, 1, 2024), PackedDate(12, 1, 2024)]
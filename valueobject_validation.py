@@ -0,0 +1,415 @@
+"""
+Value object alanları için bildirimsel (declarative) doğrulama, sınıf başına derlenmiş.
+
+basic_valueObject-1.py'deki Money.__post_init__ elle yazılmış tek bir kontrol; diğer value
+object'ler (Time, Date, Color, EmailAddress, Location) hiçbir şeyi doğrulamıyordu.
+@validated kısıtları alan adlarıyla alır ve sınıf için TEK bir kontrol fonksiyonu derler
+(valueobject_codec'teki gibi exec ile): alan başına tip kontrolü + kısıtlar, ardından
+alanlar arası kurallar. Geçerli değerde ara liste/dict üretilmez, sadece karşılaştırmalar çalışır.
+
+    @dataclass(frozen=True)                      # veya @value_object
+    @validated(
+        day=Range(1, 31), month=Range(1, 12), year=Range(1, 9999),
+        rules=[Rule(lambda day, month, year: day <= monthrange(year, month)[1], "ayda bu gün yok")],
+    )
+    class Date:
+        day: int
+        month: int
+        year: int
+
+    Date(31, 2, 2024)                 # ValidationError: Date: ayda bu gün yok
+    report = validate_many(Date, [{"day": 1, "month": 1, "year": 2024}, {"day": 0, "month": 13}])
+    report.valid                      # [Date(day=1, month=1, year=2024)]
+    report.errors                     # [(1, [("day", "1 ile 31 arasında olmalı, 0 geldi"), ...])]
+
+Kısıtlar: Range(min, max), Length(min, max), Pattern(regex), OneOf(değerler), Rule(fn, mesaj).
+Rule fonksiyonunun parametre adları alan adlarıdır; sadece alan kontrolleri geçerse çağrılır.
+
+@validated sınıfa bir __post_init__ ekler: bu yüzden @dataclass / @value_object'in ALTINDA
+(önce uygulanacak şekilde) yazılmalıdır. Sınıfın (veya taban sınıfın) __post_init__'i varsa ondan sonra çalışır.
+
+Güvenilir yükleme: kendi veritabanımızdan gelen satırlar zaten doğrulanmış olarak yazıldı.
+ValueType(..., trusted=True) ve Validator.load(data, trusted=True) codec'in güvenilir yolunu
+kullanır (__init__ / __post_init__ ve dolayısıyla doğrulama atlanır). validate_many de her
+kaydı bir kez doğrular, nesneyi aynı güvenilir yolla kurar (kontroller iki kez çalışmaz).
+"""
+import inspect
+import re
+from decimal import Decimal
+
+from valueobject_codec import _compile, class_annotations, get_codec
+
+
+class ValidationError(ValueError):
+    """Doğrulama hatası; errors = [(alan veya None, mesaj), ...]."""
+
+    def __init__(self, cls_name, errors):
+        self.errors = errors
+        details = "; ".join(f"{field}: {message}" if field else message for field, message in errors)
+        super().__init__(f"{cls_name}: {details}")
+
+
+# Anotasyon → kabul edilen sınıflar (bool int'in alt sınıfı ama int alana kabul edilmez)
+_ACCEPTED_TYPES = {
+    int: (int,), "int": (int,),
+    float: (float, int), "float": (float, int),
+    Decimal: (Decimal, int), "Decimal": (Decimal, int),
+    bool: (bool,), "bool": (bool,),
+    str: (str,), "str": (str,),
+}
+
+
+# ================== KISITLAR ==================
+class Constraint:
+    """Kısıt: derlenen fonksiyona gömülecek bir koşul ifadesi ve hata mesajı üretir."""
+
+    def condition(self, var, ref):
+        """`var` değeri için geçerlilik ifadesi (Python kaynağı); sabitler ref(değer) ile eklenir."""
+        raise NotImplementedError
+
+    def message(self, value):
+        raise NotImplementedError
+
+
+class Range(Constraint):
+    """min <= değer <= max (sınırlar dahil; biri None olabilir)."""
+
+    def __init__(self, min=None, max=None):
+        self.min, self.max = min, max
+
+    def condition(self, var, ref):
+        if self.min is not None and self.max is not None:
+            return f"{ref(self.min)} <= {var} <= {ref(self.max)}"
+        if self.min is not None:
+            return f"{var} >= {ref(self.min)}"
+        return f"{var} <= {ref(self.max)}"
+
+    def message(self, value):
+        if self.min is not None and self.max is not None:
+            return f"{self.min} ile {self.max} arasında olmalı, {value!r} geldi"
+        if self.min is not None:
+            return f"en az {self.min} olmalı, {value!r} geldi"
+        return f"en fazla {self.max} olmalı, {value!r} geldi"
+
+
+class Length(Range):
+    """min <= len(değer) <= max."""
+
+    def condition(self, var, ref):
+        return super().condition(f"len({var})", ref)
+
+    def message(self, value):
+        return "uzunluk " + super().message(len(value))
+
+
+class Pattern(Constraint):
+    """Değerin tamamı düzenli ifadeyle eşleşmeli (fullmatch)."""
+
+    def __init__(self, regex, flags=0):
+        self.regex = re.compile(regex, flags)
+
+    def condition(self, var, ref):
+        return f"{ref(self.regex.fullmatch)}({var}) is not None"
+
+    def message(self, value):
+        return f"{self.regex.pattern!r} biçiminde olmalı, {value!r} geldi"
+
+
+class OneOf(Constraint):
+    """Değer verilen kümeden biri olmalı."""
+
+    def __init__(self, values):
+        self.values = frozenset(values)
+
+    def condition(self, var, ref):
+        return f"{var} in {ref(self.values)}"
+
+    def message(self, value):
+        return f"{sorted(map(str, self.values))} değerlerinden biri olmalı, {value!r} geldi"
+
+
+class Rule:
+    """Alanlar arası kural: fn(alan1, alan2, ...) → bool; parametre adları alan adlarıdır."""
+
+    def __init__(self, fn, message):
+        self.fn = fn
+        self.text = message
+        self.fields = tuple(inspect.signature(fn).parameters)
+
+
+# ================== DERLEME ==================
+def compile_check(cls_name, fields, types, constraints, rules):
+    """
+    check(alan1, alan2, ...) → None (geçerli) veya [(alan, mesaj), ...].
+    Alan başına: tip → kısıtlar (ilk başarısız olan raporlanır); hepsi geçerse kurallar.
+    """
+    ns = {"_fail": _fail}
+    counter = iter(range(1_000_000))
+
+    def ref(value):
+        key = f"_c{next(counter)}"
+        ns[key] = value
+        return key
+
+    body = [f"def check({', '.join(fields)}):", "    e = None"]
+    for field in fields:
+        branch = "if"
+        accepted = _ACCEPTED_TYPES.get(types.get(field))
+        if accepted is not None:
+            body += [
+                f"    if {field}.__class__ not in {ref(accepted)}:",
+                f"        e = _fail(e, {field!r}, {ref(_type_message(accepted))}, {field})",
+            ]
+            branch = "elif"
+        # Tip koruması yoksa kısıt ifadesi uyumsuz değerde TypeError atabilir (0 <= "abc"):
+        # alan hatası olarak raporlanır. try, 3.11'de hata olmadıkça maliyetsizdir.
+        guarded = accepted is not None or not constraints.get(field)
+        indent = "    " if guarded else "        "
+        if not guarded:
+            body.append("    try:")
+        for constraint in constraints.get(field, ()):
+            body += [
+                f"{indent}{branch} not ({constraint.condition(field, ref)}):",
+                f"{indent}    e = _fail(e, {field!r}, {ref(constraint.message)}, {field})",
+            ]
+            branch = "elif"
+        if not guarded:
+            body += [
+                "    except TypeError:",
+                f"        e = _fail(e, {field!r}, {ref(_incomparable_message)}, {field})",
+            ]
+    if rules:
+        body.append("    if e is None:")
+        for rule in rules:
+            unknown = set(rule.fields) - set(fields)
+            if unknown:
+                raise TypeError(f"{cls_name}: kural bilinmeyen alan kullanıyor: {sorted(unknown)}")
+            body += [
+                f"        if not {ref(rule.fn)}({', '.join(rule.fields)}):",
+                f"            e = _fail(e, None, {ref(lambda value, text=rule.text: text)}, None)",
+            ]
+    body.append("    return e")
+    return _compile("check", body, ns)
+
+
+def _type_message(accepted):
+    names = " veya ".join(t.__name__ for t in accepted)
+    return lambda value: f"{names} olmalı, {type(value).__name__} geldi"
+
+
+def _incomparable_message(value):
+    return f"{type(value).__name__} değeri bu kısıtla kontrol edilemez"
+
+
+def _fail(errors, field, message, value):
+    # Sadece hata yolunda çalışır: liste ve mesaj metni yalnızca geçersiz değerde üretilir
+    if errors is None:
+        errors = []
+    errors.append((field, message(value)))
+    return errors
+
+
+def validated(rules=(), **constraints):
+    """
+    Sınıf dekoratörü: alan kısıtları (tek kısıt veya liste) ve alanlar arası kurallar.
+    @dataclass / @value_object'in altına yazılır; onların __init__'i eklenen __post_init__'i çağırır.
+    """
+    def decorate(cls):
+        annotations = class_annotations(cls)
+        fields = tuple(annotations)
+        unknown = set(constraints) - set(fields)
+        if unknown:
+            raise TypeError(f"{cls.__name__}: bilinmeyen alanlar için kısıt: {sorted(unknown)}")
+        spec = {
+            field: tuple(c) if isinstance(c, (list, tuple)) else (c,)
+            for field, c in constraints.items()
+        }
+        check = compile_check(cls.__name__, fields, annotations, spec, tuple(rules))
+
+        ns = {"_check": check, "_error": ValidationError, "_name": cls.__name__}
+        original = getattr(cls, "__post_init__", None)  # kalıtılan da çağrılır
+        args = ", ".join(f"self.{f}" for f in fields)
+        body = [
+            "def __post_init__(self):",
+            f"    e = _check({args})",
+            "    if e is not None:",
+            "        raise _error(_name, e)",
+        ]
+        if original is not None:
+            ns["_original"] = original
+            body.append("    _original(self)")
+        cls.__post_init__ = _compile("__post_init__", body, ns)
+        cls.__value_check__ = check  # get_validator için (ham dict kontrolü)
+        return cls
+    return decorate
+
+
+# ================== TOPLU DOĞRULAMA ==================
+_MISSING = object()
+
+
+class ValidationReport:
+    """validate_many sonucu: geçerli nesneler ve (kayıt sırası, hatalar) listesi."""
+
+    __slots__ = ("valid", "errors")
+
+    def __init__(self, valid, errors):
+        self.valid = valid
+        self.errors = errors
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"ValidationReport(valid={len(self.valid)}, errors={len(self.errors)})"
+
+
+class Validator:
+    """
+    Bir sınıfın ham dict'ler için doğrulayıcısı. Doğrudan değil get_validator(cls) ile alınır.
+    check_dict(d) → None veya hatalar; eksik alanlar varsayılanıyla doldurulur, yoksa hata.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.codec = get_codec(cls)
+        check = getattr(cls, "__value_check__", None)
+        fields = self.codec.fields
+        params = inspect.signature(cls).parameters
+        ns = {"_check": check, "_missing": _MISSING}
+        body = ["def check_dict(d):", "    e = None"]
+        for field in fields:
+            default = params[field].default if field in params else inspect.Parameter.empty
+            ns[f"_d_{field}"] = _MISSING if default is inspect.Parameter.empty else default
+            body += [
+                f"    {field} = d.get({field!r}, _d_{field})",
+                f"    if {field} is _missing:",
+                f"        e = (e or []) + [({field!r}, 'zorunlu alan eksik')]",
+            ]
+        body += ["    if e is not None:", "        return e"]
+        body.append(f"    return _check({', '.join(fields)})" if check else "    return None")
+        self.check_dict = _compile("check_dict", body, ns)
+        # Geçerli kayıt: varsayılanlar dahil alan dict'i → nesne, __post_init__ tekrar çalışmaz
+        keys = ", ".join(f"{f!r}: d.get({f!r}, _d_{f})" for f in fields)
+        ns["_build"] = self.codec.from_dict_trusted
+        self.build = _compile("build", ["def build(d):", f"    return _build({{{keys}}})"], ns)
+
+    def validate(self, data):
+        """Tek kayıt: doğrulanmış nesne veya ValidationError."""
+        errors = self.check_dict(data)
+        if errors is not None:
+            raise ValidationError(self.cls.__name__, errors)
+        return self.build(data)
+
+    def validate_many(self, records, build=True):
+        """Tüm kayıtları doğrular, hepsinin hatalarını toplar (ilk hatada durmaz)."""
+        check, make = self.check_dict, self.build
+        valid, errors = [], []
+        append_valid, append_error = valid.append, errors.append
+        for i, data in enumerate(records):
+            e = check(data)
+            if e is None:
+                if build:
+                    append_valid(make(data))
+            else:
+                append_error((i, e))
+        return ValidationReport(valid, errors)
+
+    def load(self, data, trusted=False):
+        """trusted=True: kendi DB'mizden gelen kayıt, doğrulama yok (codec'in güvenilir yolu)."""
+        if trusted:
+            return self.codec.from_dict_trusted(data)
+        return self.validate(data)
+
+
+_VALIDATORS = {}
+
+
+def get_validator(cls):
+    """Sınıf için Validator (önbellekli)."""
+    validator = _VALIDATORS.get(cls)
+    if validator is None:
+        validator = _VALIDATORS.setdefault(cls, Validator(cls))
+    return validator
+
+
+def validate_many(cls, records, build=True):
+    """get_validator(cls).validate_many(records, build) kısayolu."""
+    return get_validator(cls).validate_many(records, build)
+
+
+if __name__ == "__main__":
+    import calendar
+    import time
+    from dataclasses import dataclass
+
+    from valueobject_base import value_object
+
+    @dataclass(frozen=True)
+    @validated(
+        day=Range(1, 31), month=Range(1, 12), year=Range(1, 9999),
+        rules=[Rule(lambda day, month, year: day <= calendar.monthrange(year, month)[1], "ayda bu gün yok")],
+    )
+    class Date:
+        day: int
+        month: int
+        year: int
+
+    @value_object
+    @validated(amount=Range(min=0), currency=[Length(3, 3), OneOf({"TRY", "USD", "EUR"})])
+    class Money:
+        amount: float
+        currency: str
+
+    print(Date(29, 2, 2024), Money(10, "TRY"))
+    for bad in (lambda: Date(29, 2, 2023), lambda: Money(-1, "GBP"), lambda: Money("10", "TRY")):
+        try:
+            bad()
+        except ValidationError as e:
+            print("Hata:", e)
+
+    records = [{"day": d % 31 + 1, "month": d % 12 + 1, "year": 2000 + d % 30} for d in range(1_000_000)]
+    start = time.perf_counter()
+    report = validate_many(Date, records)
+    elapsed = time.perf_counter() - start
+    print(report, f"{len(records) / elapsed * 60 / 1e6:.1f} milyon kayıt/dakika")
+    print("ilk hata:", report.errors[0])
+    assert len(report.valid) + len(report.errors) == len(records)
+
+    report = validate_many(Money, [{"amount": 5}, {"amount": -3, "currency": "XYZ"}, {"amount": 1, "currency": "USD"}])
+    print(report.valid, report.errors)
+    assert Validator(Money).load({"amount": -1, "currency": "XYZ"}, trusted=True).amount == -1  # DB'den: kontrol yok
+
+    @dataclass(frozen=True)
+    @validated(score=Range(0, 100))
+    class Rating:
+        score: "Score"  # tanınmayan anotasyon → tip koruması yok
+
+    try:
+        Rating("yüksek")  # 0 <= "yüksek" TypeError atar; alan hatasına dönüşmeli
+    except ValidationError as e:
+        print("Hata:", e)
+        assert e.errors[0][0] == "score"
+    assert validate_many(Rating, [{"score": None}, {"score": 7}]).errors[0][1][0][0] == "score"
+
+    @dataclass(frozen=True)
+    class Positive:
+        value: int
+
+        def __post_init__(self):
+            if self.value <= 0:
+                raise ValueError("pozitif olmalı")
+
+    @dataclass(frozen=True)
+    @validated(value=Range(max=100))
+    class Percent(Positive):  # taban sınıfın __post_init__'i de çalışmalı
+        pass
+
+    for bad in (-5, 500):
+        try:
+            Percent(bad)
+        except ValueError as e:
+            print("Hata:", e)
+        else:
+            raise AssertionError(f"Percent({bad}) kabul edildi")
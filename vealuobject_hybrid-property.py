@@ -1,4 +1,4 @@
-from sqlalchemy import TypeDecorator, String, create_engine, Column, Integer, func, text
+from sqlalchemy import TypeDecorator, String, Column, Integer, Float, Boolean, Numeric, Index, func, text, event, cast, type_coerce
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.ext.hybrid import hybrid_property
 import json
@@ -7,7 +7,42 @@ Base = declarative_base()
 
 from sqlalchemy import TypeDecorator, String
 import json
-from sqlalchemy.sql import column
+from sqlalchemy.sql import column, literal_column
+from sqlalchemy.schema import CreateIndex, DropIndex
+from valueobject_base import value_object
+from valueobject_codec import get_codec
+from valueobject_composite import FIELD_SQL_TYPES
+from valueobject_engine import create_tuned_engine
+from valueobject_lazy import LazyValue
+from valueobject_serializers import resolve_serializer, serializer_for
+from valueobject_spatial import SpatialIndex
+from valueobject_search import TextSearchIndex
+
+
+# Alan anotasyonu → SQL tipi. Sayısal alanlar CAST edilir: json_extract'in sonucunun
+# tip yakınlığı (affinity) yoktur; '41' gibi metin bir parametreyle karşılaştırıldığında
+# SQLite metin karşılaştırması yapar (15000 > '41' → False). CAST(... AS FLOAT) ifadesi
+# REAL yakınlığı taşır, karşı taraf sayıya çevrilir.
+# Eşleme valueobject_composite ile ortak: ayrı sütun modunda aynı tipler sütun tipi olur.
+_CAST_TYPES = (Integer, Float, Numeric, Boolean)
+
+
+def json_field(col, field, type_=None):
+    """
+    ValueType sütunundaki tek bir alan için SQL ifadesi: json_extract(col, '$.field').
+    JSON yolu bind parametresi (?) olarak değil, literal olarak SQL'e gömülür.
+    Neden? SQLite bir ifade indeksini (expression index) ancak sorgudaki ifade,
+    indeks tanımındaki ifadeyle BİREBİR aynıysa kullanır. Bu yüzden hem indeks
+    hem de sorgu ifadeleri bu fonksiyonu (aynı type_ ile) kullanmalıdır.
+    :param type_: Sayısal tiplerde ifade CAST(... AS <tip>) ile sarılır; String'de
+                  SQL değişmez, sadece Python tarafındaki ifade tipi atanır.
+    """
+    expr = func.json_extract(col, literal_column(f"'$.{field}'"))
+    if type_ is None:
+        return expr
+    if issubclass(type_, _CAST_TYPES):
+        return cast(expr, type_)
+    return type_coerce(expr, type_)
 
 class ValueType(TypeDecorator):
     """
@@ -19,18 +54,64 @@ class ValueType(TypeDecorator):
     # 1. Temel SQL Tipi: Bu TypeDecorator hangi temel SQL tipine karşılık geliyor?
     impl = String  # SQLite'da TEXT sütunu demektir.
 
+    # 1b. Alan ifadeleri: Place.location.lat > 41, Product.price.currency == "TRY".
+    #     Sütun (ve ORM attribute'u) üzerinde bilinmeyen bir attribute arandığında
+    #     SQLAlchemy tipin comparator'ına sorar; value object alanları burada çözülür.
+    class Comparator(TypeDecorator.Comparator):
+        def __getattr__(self, name):
+            value_type = self.type
+            if name in value_type.codec.fields:
+                return value_type.field_expression(self.expr, name)
+            raise AttributeError(name)
+
+    comparator_factory = Comparator
+
     # 2. Önbellek Uyumluluğu: SQLAlchemy 2.0+ sürümünde SQL ifadeleri önbelleğe alınır.
     #    Bu tipin durumu (state) sabit ve güvenli olduğu için önbelleğe alınabilir.
     cache_ok = True  # ✅ Bu tipin önbellek anahtarı üretmesi güvenlidir.
 
     # 3. Yapıcı Metot (Constructor): Bu tip hangi Python sınıfını temsil edecek?
-    def __init__(self, cls, *args, **kwargs):
+    def __init__(self, cls, *args, indexed=(), trusted=False, serializer=None, lazy=False, **kwargs):
         """
         ValueType'ı bir Python sınıfı (örneğin Money, Coordinates) ile başlatır.
         :param cls: JSON'dan geri yüklenecek Python sınıfı (örneğin Money)
+        :param indexed: İndekslenecek value object alanları (örneğin ("amount",)) veya
+                        True (tüm alanlar). Her alan için field_expression ile aynı
+                        ifade üzerinde bir SQLite ifade indeksi oluşturulur
+                        (bkz. _create_value_indexes).
+        :param trusted: True ise okuma sırasında __init__ doğrulaması atlanır; sütuna
+                        yalnızca bu tipin yazdığı veri girdiği için güvenlidir.
+        :param serializer: "json" (varsayılan), "orjson", "msgpack", "struct", bir fallback
+                           dizisi veya Serializer nesnesi (bkz. valueobject_serializers).
+                           Verilmezse engine'e use_serializer() ile atanan backend kullanılır.
+        :param lazy: True ise okuma sırasında decode edilmez; ham değeri tutan ve ilk
+                     attribute erişiminde decode eden bir LazyValue döner (bkz. valueobject_lazy).
         """
         super().__init__(*args, **kwargs)  # Üst sınıfın (TypeDecorator) __init__ metodunu çağır.
         self.cls = cls  # Saklanacak/geri yüklenecek sınıfı kaydet.
+        self.trusted = trusted
+        self.lazy = lazy
+        # Sınıf başına bir kez derlenen encoder/decoder (valueobject_codec._CODECS önbelleği).
+        # Her satırda value.__dict__ + json.dumps ve cls(**data) yerine sınıfa özel kod çalışır.
+        self.codec = get_codec(cls)
+        # cache_ok=True olduğu için __init__ argümanları hashlenebilir olmalı → tuple
+        self.indexed = self.codec.fields if indexed is True else tuple(indexed)
+        self.serializer = serializer
+        self._serializer = resolve_serializer(serializer) if serializer is not None else None
+        if self.indexed and self._serializer is not None and self._serializer.binary:
+            raise ValueError("indexed alanlar json_extract gerektirir; JSON metni üreten bir serializer seçin")
+
+    def field_sql_type(self, field):
+        """Alanın anotasyonundan SQL tipi; anotasyon yoksa None (CAST yapılmaz)."""
+        return FIELD_SQL_TYPES.get(self.codec.types[field])
+
+    def field_expression(self, col, field):
+        """Sorgularda ve indekslerde kullanılan tipli alan ifadesi."""
+        return json_field(col, field, self.field_sql_type(field))
+
+    # 3b. Sütun Tipi: serializer'a göre TEXT (json/orjson) veya BLOB (msgpack/struct).
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(serializer_for(self._serializer, dialect).impl())
 
     # 4. Python → Veritabanı Dönüşümü: Python nesnesini veritabanına yazmadan önce hazırlar.
     def process_bind_param(self, value, dialect):
@@ -42,9 +123,16 @@ class ValueType(TypeDecorator):
         :return: JSON string veya None
         """
         if value is not None:
-            # Nesnenin __dict__'ini al ve JSON string'e dönüştür.
-            # __dict__: Nesnenin tüm attribute'larını içeren sözlük (örneğin {'amount': 15000, 'currency': 'TRY'})
-            return json.dumps(value.__dict__)
+            serializer = serializer_for(self._serializer, dialect)
+            if type(value) is LazyValue:
+                # Aynı formatta okunmuş lazy değer: ham metin/bytes olduğu gibi geri yazılır
+                raw = value.raw_for(self.codec, serializer)
+                if raw is not None:
+                    return raw
+            # Derlenmiş encoder alanları doğrudan okuyup JSON metnini üretir.
+            # Çıktı json.dumps(value.__dict__) ile aynıdır (örneğin '{"amount": 15000, "currency": "TRY"}')
+            # msgpack/struct seçildiyse bunun yerine bytes üretilir.
+            return serializer.dumper(self.codec)(value)
         return None  # Eğer değer None ise, None döndür.
 
     # 5. Veritabanı → Python Dönüşümü: Veritabanından okunan değeri Python nesnesine çevirir.
@@ -57,13 +145,23 @@ class ValueType(TypeDecorator):
         :return: Python nesnesi (self.cls tipinde) veya None
         """
         if value is not None:
-            # JSON string'i Python sözlüğüne dönüştür.
-            data = json.loads(value)
-            # Sözlüğü, self.cls sınıfının yapıcısına (**kwargs olarak) vererek yeni bir nesne oluştur.
-            # Örnek: Money(**{'amount': 15000, 'currency': 'TRY'}) → Money(15000, "TRY")
-            return self.cls(**data)
+            # trusted=False: Money(**{'amount': 15000, 'currency': 'TRY'}) → __init__ çalışır.
+            # trusted=True:  Money.__new__ + alanlar doğrudan yazılır → __init__ atlanır.
+            # lazy=True:     decode ilk attribute erişimine ertelenir.
+            serializer = serializer_for(self._serializer, dialect)
+            if self.lazy:
+                return serializer.lazy_loader(self.codec, self.trusted)(value)
+            return serializer.loader(self.codec, self.trusted)(value)
         return None  # Eğer değer None ise, None döndür.
 
+    # 5b. Değişiklik Takibi: flush sırasında eski ve yeni değer bu metotla karşılaştırılır.
+    #     Varsayılan x == y, __eq__'su olmayan sınıflarda eşit değerli yeni nesneyi "değişti"
+    #     sayar → sütun yeniden encode edilip UPDATE'e girer. Derlenmiş karşılaştırma önce
+    #     kimliğe bakar (dokunulmamış değişmez değer aynı nesnedir), sonra alanlara.
+    #     Değişebilir (frozen olmayan) sınıflarda varsayılan x == y korunur.
+    def compare_values(self, x, y):
+        return self.codec.equal(x, y) if self.codec.frozen else x == y
+
     # 6. SQL İfade Temsili: Bu sütun SQL ifadelerinde nasıl temsil edilmeli?
     def column_expression(self, col):
         """
@@ -75,21 +173,61 @@ class ValueType(TypeDecorator):
         :return: Değişmeden aynı sütun nesnesi
         """
         return col  # SQL'de sütun hala TEXT (JSON string) olarak kalır.
-# Value Object sınıfları
+
+
+# 7. JSON Alan İndeksleri: ValueType(..., indexed=(...)) ile işaretlenen alanlar için
+#    sütun tabloya bağlandığı anda ifade indeksi tanımlanır. create_all() tabloyla
+#    birlikte "CREATE INDEX ix_<tablo>_<sütun>_<alan> ON <tablo> (json_extract(...))" üretir.
+@event.listens_for(Column, "after_parent_attach")
+def _create_value_indexes(col, table):
+    if isinstance(col.type, ValueType):
+        for field in col.type.indexed:
+            Index(f"ix_{table.name}_{col.name}_{field}", col.type.field_expression(col, field))
+
+
+def sync_value_indexes(conn, metadata):
+    """
+    Eksik ifade indekslerini oluşturur, tanımı değişmiş olanları (örneğin alan ifadesine
+    CAST eklendiğinde) yeniden oluşturur. create_all var olan tablolara sonradan eklenen
+    indeksleri oluşturmaz; ifade indeksleri de reflection ile okunamaz, bu yüzden
+    sqlite_master'daki CREATE INDEX metni beklenen DDL ile karşılaştırılır.
+    """
+    existing = dict(conn.execute(text("SELECT name, sql FROM sqlite_master WHERE type = 'index'")).all())
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            ddl = " ".join(str(CreateIndex(index).compile(conn)).split())
+            current = existing.get(index.name)
+            if current is not None and " ".join(current.split()) == ddl:
+                continue
+            if current is not None:
+                conn.execute(DropIndex(index))
+            conn.execute(CreateIndex(index))
+
+
+def explain_query_plan(session, query):
+    """
+    Bir sorgunun SQLite EXPLAIN QUERY PLAN çıktısını satır listesi olarak döndürür.
+    Örnek: ['SEARCH products USING INDEX ix_products_price_amount (<expr>>?)']
+    """
+    stmt = query.statement if hasattr(query, "statement") else query
+    sql = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    return [row[-1] for row in session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+# Value Object sınıfları: değişmez (frozen). p.price.amount = 1 → FrozenInstanceError;
+# değer değiştirmek için yeni nesne atanır (p.price = Money(1, "TRY")) ve ORM bunu görür.
+@value_object
 class Money:
-    def __init__(self, amount, currency):
-        self.amount = amount
-        self.currency = currency
+    amount: float
+    currency: str
 
+@value_object
 class Coordinates:
-    def __init__(self, lat, lng):
-        self.lat = lat
-        self.lng = lng
+    lat: float
+    lng: float
 
+@value_object
 class FullName:
-    def __init__(self, first, last):
-        self.first = first
-        self.last = last
+    first: str
+    last: str
 
 # Modeller
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -99,7 +237,7 @@ class Product(Base):
     __tablename__ = 'products'
     id = Column(Integer, primary_key=True)
     name = Column(String)
-    price = Column(ValueType(Money))  # ValueType ile JSON olarak saklanan value object
+    price = Column(ValueType(Money, indexed=("amount",), trusted=True))  # ValueType ile JSON olarak saklanan value object
 
     # -------------------------------------------------------------------
     # ✅ HYBRID_PROPERTY: NEDEN KULLANILIR?
@@ -122,6 +260,11 @@ class Product(Base):
     #   ValueType, veriyi JSON string olarak saklar ve Python'da geri nesneye çevirir.
     #   Ama SQL filtrelemesi için bu yetmez → hybrid_property ile SQL tarafında
     #   nasıl sorgulanacağını MANUEL olarak tanımlıyoruz.
+    #
+    # ➕ ARTIK OTOMATİK: ValueType.Comparator sayesinde her alan doğrudan sorgulanabilir:
+    #   Product.price.amount > 10000, Place.location.lng < 30, Place.owner_name.last == "Yılmaz"
+    #   Aşağıdaki hybrid'ler Python tarafındaki kısa erişim (p.price_amount) için duruyor;
+    #   SQL ifadeleri aynı tipli alan ifadesini (ve dolayısıyla aynı indeksi) kullanır.
     # -------------------------------------------------------------------
 
     @hybrid_property
@@ -144,7 +287,7 @@ class Product(Base):
         SQLite'ın json_extract fonksiyonunu kullanır.
         Örnek SQL: json_extract(price, '$.amount')
         """
-        return func.json_extract(cls.price, '$.amount')
+        return cls.price.amount  # indeksle birebir aynı ifade: CAST(json_extract(...) AS FLOAT)
 
     # Aynı mantık currency için de uygulanabilir:
     @hybrid_property
@@ -155,14 +298,14 @@ class Product(Base):
     @price_currency.expression
     def price_currency(cls):
         """SQL tarafında: json_extract(price, '$.currency')"""
-        return func.json_extract(cls.price, '$.currency')
+        return cls.price.currency
 
 class Place(Base):
     __tablename__ = 'places'
     id = Column(Integer, primary_key=True)
     name = Column(String)
-    location = Column(ValueType(Coordinates))
-    owner_name = Column(ValueType(FullName))
+    location = Column(ValueType(Coordinates, trusted=True))
+    owner_name = Column(ValueType(FullName, indexed=("first",), trusted=True))
 
     @hybrid_property
     def location_lat(self):
@@ -170,7 +313,7 @@ class Place(Base):
 
     @location_lat.expression
     def location_lat(cls):
-        return func.json_extract(cls.location, '$.lat')
+        return cls.location.lat
 
     @hybrid_property
     def owner_first_name(self):
@@ -178,35 +321,93 @@ class Place(Base):
 
     @owner_first_name.expression
     def owner_first_name(cls):
-        return func.json_extract(cls.owner_name, '$.first')
-
-# DB ve session
-engine = create_engine('sqlite:///multi_ValueObject.db', echo=False)
-Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
-session = Session()
-
-# Test verileri
-laptop = Product(name="Laptop", price=Money(15000, "TRY"))
-cafe = Place(
-    name="Kahve Dükkanı",
-    location=Coordinates(41.0151, 28.9793),
-    owner_name=FullName("Ayşe", "Yılmaz")
-)
-
-session.add_all([laptop, cafe])
-session.commit()
-
-# ✅ Python tarafında erişim
-p = session.query(Product).first()
-print(f"Python: {p.price_amount} {p.price_currency}")  # 15000 TRY
-
-# ✅ SQL filtreleme
-expensive = session.query(Product).filter(Product.price_amount > 10000).all()
-for p in expensive:
-    print(f"SQL Filter: {p.name} - {p.price_amount} {p.price_currency}")
-
-# ✅ Owner name filter
-ayse_places = session.query(Place).filter(Place.owner_first_name == 'Ayşe').all()
-for pl in ayse_places:
-    print(f"Ayşe'nin yeri: {pl.name}")
+        return cls.owner_name.first
+
+# Konum için R*Tree indeksi (places_location_rtree), tetikleyicilerle places'e bağlı:
+#   place_locations.within_bbox(session, south, west, north, east) → [Place, ...]
+#   place_locations.nearest(session, Coordinates(41.0, 29.0), k=5)  → en yakın 5 Place
+place_locations = SpatialIndex(Place, "location")
+
+# Sahip adı için FTS5 indeksi (places_search): büyük/küçük harf ve aksan duyarsız önek araması
+#   owner_search.search(session, "şük") → Şükrü, Sukru ... (bm25 sıralı, limit/offset)
+owner_search = TextSearchIndex(Place, ["owner_name.first", "owner_name.last"])
+
+if __name__ == "__main__":
+    # DB ve session
+    engine = create_tuned_engine('sqlite:///multi_ValueObject.db', echo=False)
+    Base.metadata.create_all(engine)
+    # multi_ValueObject.db, multi_valueobject.py ile paylaşılıyor: tablolar zaten varsa
+    # create_all indeksleri oluşturmaz; eksik/eski tanımlı indeksleri senkronize et.
+    with engine.begin() as conn:
+        sync_value_indexes(conn, Base.metadata)
+        place_locations.create(conn)  # places tablosu zaten varsa R*Tree'yi sonradan ekler
+        owner_search.create(conn)     # ... ve FTS5 arama tablosunu
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    # Test verileri
+    laptop = Product(name="Laptop", price=Money(15000, "TRY"))
+    cafe = Place(
+        name="Kahve Dükkanı",
+        location=Coordinates(41.0151, 28.9793),
+        owner_name=FullName("Ayşe", "Yılmaz")
+    )
+
+    session.add_all([laptop, cafe])
+    session.commit()
+
+    # ✅ Python tarafında erişim
+    p = session.query(Product).first()
+    print(f"Python: {p.price_amount} {p.price_currency}")  # 15000 TRY
+
+    # ✅ SQL filtreleme
+    expensive = session.query(Product).filter(Product.price_amount > 10000).all()
+    for p in expensive:
+        print(f"SQL Filter: {p.name} - {p.price_amount} {p.price_currency}")
+
+    # ✅ Owner name filter
+    ayse_places = session.query(Place).filter(Place.owner_first_name == 'Ayşe').all()
+    for pl in ayse_places:
+        print(f"Ayşe'nin yeri: {pl.name}")
+
+    # ✅ Değişiklik takibi: eşit değerli yeni nesne "değişiklik" sayılmaz (encode/UPDATE yok),
+    #    yerinde değişiklik ise sessizce kaybolmak yerine hata verir
+    from dataclasses import FrozenInstanceError
+    from sqlalchemy import inspect as sa_inspect
+    p.price = Money(p.price.amount, p.price.currency)
+    assert not sa_inspect(p).attrs.price.history.has_changes()
+    try:
+        p.price.amount = 1
+    except FrozenInstanceError as e:
+        print("Yerinde değişiklik engellendi:", e)
+
+    # ✅ Otomatik alan ifadeleri: hybrid yazmadan her alan, sayısal alanlar CAST ile
+    east = session.query(Place).filter(Place.location.lng > 28.5, Place.owner_name.last == "Yılmaz").all()
+    print("Doğudaki Yılmaz mekanları:", sorted({pl.name for pl in east}))
+    # Metin parametre de sayısal karşılaştırılır (CAST yokken '41' ile metin karşılaştırması yapılırdı)
+    assert session.query(Product).filter(Product.price.amount > "9000").count() >= 1
+
+    # ✅ Uzamsal sorgular (R*Tree): kutu içi ve en yakın komşu
+    session.add_all([
+        Place(name="Galata Kulesi", location=Coordinates(41.0256, 28.9744), owner_name=FullName("Can", "Demir")),
+        Place(name="Kız Kulesi", location=Coordinates(41.0211, 29.0041), owner_name=FullName("Elif", "Kaya")),
+        Place(name="Anıtkabir", location=Coordinates(39.9255, 32.8369), owner_name=FullName("Mert", "Aydın")),
+    ])
+    session.commit()
+    in_istanbul = place_locations.within_bbox(session, south=40.8, west=28.5, north=41.3, east=29.5)
+    assert "Anıtkabir" not in {pl.name for pl in in_istanbul}
+    for pl, km in place_locations.nearest(session, Coordinates(41.0082, 28.9784), k=3, with_distance=True):
+        print(f"Yakın: {pl.name} ({km:.2f} km)")
+
+    # ✅ Tam metin / önek araması (FTS5): "ayse" → Ayşe, "KAY" → Kaya
+    print("Arama 'ayse':", sorted({pl.name for pl in owner_search.search(session, "ayse", limit=5)}))
+    print("Arama 'KAY':", sorted({pl.owner_name.last for pl in owner_search.search(session, "KAY", limit=5)}))
+
+    # ✅ İndeks kullanımı: planner tam tablo taraması (SCAN) yerine indeksi kullanmalı
+    plan = explain_query_plan(session, session.query(Product).filter(Product.price_amount > 10000))
+    print("Query plan:", plan)
+    assert any("USING INDEX ix_products_price_amount" in step for step in plan), plan
+
+    plan = explain_query_plan(session, session.query(Place).filter(Place.owner_first_name == 'Ayşe'))
+    print("Query plan:", plan)
+    assert any("USING INDEX ix_places_owner_name_first" in step for step in plan), plan